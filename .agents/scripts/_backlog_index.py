@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Backlog Index - Inove AI Framework
+==================================
+Parses BACKLOG.md once into a compact structured form (epics, stories,
+checkbox counts and character offsets) shared by every script that reads
+the backlog: shard_epic, progress_tracker, validate_traceability,
+auto_session, finish_task and dashboard.
+
+Parses are cached on disk under .agents/.cache/backlog_index.json, keyed by
+the SHA-256 of the backlog content, and memoized per process, so a
+session-end that runs several consumers pays for a single parse. Consumers
+with their own view of the backlog can cache it alongside the parse with
+BacklogIndex.derived().
+
+Usage as module:
+    from _backlog_index import load_backlog, index_content
+
+    index = load_backlog()              # docs/BACKLOG.md (or None if missing)
+    done, total = index.progress()
+    story = index.story("1.2")
+    text = index.description(story)
+
+    index = index_content(content)      # Same, for content already in memory
+"""
+
+import os
+import re
+import sys
+import copy
+import json
+import time
+import inspect
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from platform_compat import find_backlog
+
+# Persistent parse cache (relative to project root) and its bound
+INDEX_FILE = Path(".agents/.cache/backlog_index.json")
+INDEX_MAX_ENTRIES = 8
+# Indexes kept in memory per process (each holds its backlog text)
+MEMO_MAX_ENTRIES = 4
+
+# Bumped whenever the parsed form changes, invalidating cached parses
+PARSER_VERSION = 1
+
+# Works with both lean (checkbox-only) and fat (with descriptions) formats
+EPIC_PATTERN = re.compile(
+    r"^##\s+Epic\s+(\d+):\s+(.+?)\s*(?:\[(?:P\d+)\])?\s*(?:\[OWNER:\s*(.+?)\])?\s*(?:\[MODEL:\s*(.+?)\])?\s*(?:[✅🔴⏳].*)?$",
+    re.MULTILINE,
+)
+STORY_PATTERN = re.compile(
+    r"^-\s*\[([ xX])\]\s*(?:\*\*)?Story\s+(\d+\.\d+):?\*?\*?\s*(.+?)$",
+    re.MULTILINE,
+)
+# Top-level checkboxes only (indented subtasks are not counted)
+DONE_PATTERN = re.compile(r"^-\s*\[(?:x|X)\]", re.MULTILINE)
+PENDING_PATTERN = re.compile(r"^-\s*\[\s\]", re.MULTILINE)
+
+
+def parse_content(content: str) -> dict:
+    """
+    Parse backlog content into its structured form.
+
+    Returns:
+        {"epics": [{num, name, owner, model, start, body_start, end, done, pending, stories}],
+         "stories": [{id, title, status, epic, start, end, desc_end}]}
+
+        Offsets index into `content`; an epic's `stories` are positions in
+        the flat story list, which also holds stories outside any epic.
+    """
+    epic_matches = list(EPIC_PATTERN.finditer(content))
+
+    # Stories are matched per segment: the preamble, then each epic body
+    segments = [(None, 0, epic_matches[0].start() if epic_matches else len(content))]
+    epics = []
+    for idx, match in enumerate(epic_matches):
+        body_start = match.end()
+        end = epic_matches[idx + 1].start() if idx + 1 < len(epic_matches) else len(content)
+        epics.append({
+            "num": int(match.group(1)),
+            "name": match.group(2).strip(),
+            "owner": match.group(3).strip() if match.group(3) else None,
+            "model": match.group(4).strip() if match.group(4) else None,
+            "start": match.start(),
+            "body_start": body_start,
+            "end": end,
+            "done": len(DONE_PATTERN.findall(content, body_start, end)),
+            "pending": len(PENDING_PATTERN.findall(content, body_start, end)),
+            "stories": [],
+        })
+        segments.append((idx, body_start, end))
+
+    stories = []
+    for epic_idx, start, end in segments:
+        matches = list(STORY_PATTERN.finditer(content, start, end))
+        for idx, match in enumerate(matches):
+            if epic_idx is not None:
+                epics[epic_idx]["stories"].append(len(stories))
+            stories.append({
+                "id": match.group(2),
+                "title": match.group(3).strip(),
+                "status": "done" if match.group(1).lower() == "x" else "pending",
+                "epic": epics[epic_idx]["num"] if epic_idx is not None else None,
+                "start": match.start(),
+                "end": match.end(),
+                # Description: indented lines until the next story or the end of the epic
+                "desc_end": matches[idx + 1].start() if idx + 1 < len(matches) else end,
+            })
+
+    return {"epics": epics, "stories": stories}
+
+
+class BacklogIndex:
+    """Parsed view of one backlog content, backed by the on-disk cache."""
+
+    def __init__(self, content: str, key: str, entry: dict, cache: "_IndexCache",
+                 path: Optional[Path] = None):
+        self.content = content
+        self.key = key
+        self.path = path
+        self._entry = entry
+        self._cache = cache
+        self.epics: List[dict] = entry["parsed"]["epics"]
+        self.stories: List[dict] = entry["parsed"]["stories"]
+        self._by_id: Dict[str, dict] = {}
+        for story in self.stories:
+            self._by_id.setdefault(story["id"], story)
+
+    def epic(self, num: int) -> Optional[dict]:
+        for epic in self.epics:
+            if epic["num"] == num:
+                return epic
+        return None
+
+    def story(self, story_id: str) -> Optional[dict]:
+        """First story with this ID (e.g. "1.2")."""
+        return self._by_id.get(story_id)
+
+    def epic_stories(self, epic: dict) -> Iterator[dict]:
+        for position in epic["stories"]:
+            yield self.stories[position]
+
+    def description(self, story: dict) -> str:
+        return self.content[story["end"]:story["desc_end"]].strip()
+
+    def progress(self) -> Tuple[int, int]:
+        """(done, total) top-level checkboxes across all epics."""
+        done = sum(e["done"] for e in self.epics)
+        return done, done + sum(e["pending"] for e in self.epics)
+
+    def derived(self, name: str, build: Callable[[str], object]) -> object:
+        """
+        A consumer-specific view of the backlog, built once per content hash
+        and cached with the parse. `build(content)` must return JSON data;
+        callers get their own copy and may modify it. The view is stamped
+        with a hash of the builder's source file, so editing the builder
+        rebuilds it.
+        """
+        values = self._entry.setdefault("derived", {})
+        fingerprint = _builder_fingerprint(build)
+        cached = values.get(name)
+        if not isinstance(cached, dict) or cached.get("builder") != fingerprint:
+            cached = values[name] = {"builder": fingerprint, "value": build(self.content)}
+            self._cache.put(self.key, self._entry)
+        return copy.deepcopy(cached["value"])
+
+
+def _builder_fingerprint(build: Callable) -> str:
+    """Hash of a derived-view builder: its name and the source file defining it."""
+    digest = hashlib.sha256(getattr(build, "__qualname__", repr(build)).encode())
+    try:
+        digest.update(Path(inspect.getsourcefile(build)).read_bytes())
+    except (OSError, TypeError):
+        pass
+    return digest.hexdigest()
+
+
+class _IndexCache:
+    """Size-bounded store of parses keyed by content hash."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: Dict[str, dict] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == PARSER_VERSION:
+                self._entries = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+
+    def get(self, key: str) -> Optional[dict]:
+        return self._entries.get(key)
+
+    def put(self, key: str, entry: dict):
+        entry["stored"] = time.time()
+        self._entries[key] = entry
+        # Drop the oldest parses beyond the bound
+        for old in sorted(self._entries, key=lambda k: self._entries[k]["stored"])[:-INDEX_MAX_ENTRIES]:
+            del self._entries[old]
+        self.save()
+
+    def save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": PARSER_VERSION, "entries": self._entries}),
+                           encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[!] Could not write backlog index: {e}", file=sys.stderr)
+
+
+# Per-process memo: (cache path, content hash) -> index, most recent last,
+# bounded so long-running watchers do not keep every edited backlog alive;
+# and cache path -> loaded store
+_INDEXES: "OrderedDict[Tuple[Path, str], BacklogIndex]" = OrderedDict()
+_CACHES: Dict[Path, _IndexCache] = {}
+
+
+def index_content(content: str, path: Optional[Path] = None,
+                  cache_path: Path = INDEX_FILE) -> BacklogIndex:
+    """Index backlog content, reusing a cached parse when the content hash matches."""
+    key = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    memo_key = (cache_path, key)
+    if memo_key in _INDEXES:
+        _INDEXES.move_to_end(memo_key)
+        return _INDEXES[memo_key]
+
+    cache = _CACHES.get(cache_path)
+    if cache is None:
+        cache = _CACHES[cache_path] = _IndexCache(cache_path)
+
+    entry = cache.get(key)
+    if entry is None:
+        entry = {"parsed": parse_content(content), "derived": {}}
+        cache.put(key, entry)
+
+    index = _INDEXES[memo_key] = BacklogIndex(content, key, entry, cache, path)
+    while len(_INDEXES) > MEMO_MAX_ENTRIES:
+        _INDEXES.popitem(last=False)
+    return index
+
+
+def load_backlog(path: Optional[Path] = None, cache_path: Path = INDEX_FILE) -> Optional[BacklogIndex]:
+    """Index the backlog file (found with find_backlog() by default), or None if missing."""
+    path = path or find_backlog()
+    if not path or not path.exists():
+        return None
+    return index_content(path.read_text(encoding="utf-8"), path, cache_path)
@@ -4,13 +4,53 @@ Shared Check Runner - Inove AI Framework
 =========================================
 Common utilities for checklist.py and verify_all.py.
 Provides Colors, print helpers, and check execution logic.
+
+Checks can be run one at a time (run_check / run_script_check) or through
+run_checks_parallel, which schedules independent checks concurrently on a
+bounded worker pool while respecting declared dependencies.
+
+Checks that declare their input globs are memoized in a ResultCache: when
+the content hash of every matched file is unchanged, the stored result is
+replayed instead of spawning the process.
 """
 
+import os
 import sys
+import json
+import time
+import hashlib
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
+
+# Default worker pool size for parallel check execution
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+
+# Persistent result cache (relative to project root) and its size bounds
+CACHE_FILE = Path(".agents/.cache/check_results.json")
+CACHE_MAX_ENTRIES = 64
+CACHE_MAX_BYTES = 2 * 1024 * 1024
+
+# Input globs of the standard checks (relative to the check's cwd).
+# The cache directory and generated reports must never match these.
+FRAMEWORK_INPUTS = [
+    "*.md", ".agents/*.md", ".agents/agents/*", ".agents/skills/*",
+    ".agents/skills/**/SKILL.md", ".agents/workflows/*", ".agents/scripts/*.py",
+    ".agents/config/*", ".claude/*", ".codex/*", ".gemini/*", "squads/**/*",
+]
+TRACEABILITY_INPUTS = ["docs/BACKLOG.md", "docs/planning/0*.md"]
+# Shared modules imported by the check scripts (relative to this directory).
+# A script's own file is not enough for its cache key: editing a helper
+# changes the result without touching the script.
+HELPER_DIR = Path(__file__).resolve().parent
+HELPER_INPUTS = ["_*.py", "platform_compat.py"]
+WEB_SOURCE_INPUTS = [
+    "src/**/*", "public/**/*", "index.html", "*.config.*", "tsconfig*.json",
+    "package.json", "package-lock.json",
+]
 
 
 class Colors:
@@ -46,61 +86,75 @@ def print_error(text: str):
     print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
 
-def run_check(name: str, cmd: list, cwd: str, timeout: int = 300) -> dict:
+def run_check(name: str, cmd: list, cwd: str, timeout: int = 300,
+              on_start: Optional[Callable[[subprocess.Popen], None]] = None) -> dict:
     """
     Run a validation command and capture results.
 
     Args:
         name: Display name for the check
-        cmd: Command list for subprocess.run
+        cmd: Command list for subprocess.Popen
         cwd: Working directory
         timeout: Timeout in seconds (default 5 minutes)
+        on_start: Optional callback receiving the spawned process, used by
+                  the parallel scheduler to terminate in-flight checks
 
     Returns:
-        dict with keys: name, passed, output, error, skipped, duration
+        dict with keys: name, passed, output, error, skipped, duration,
+        returncode (None if the process did not run to completion)
     """
     print_step(f"Running: {name}")
     start_time = datetime.now()
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout,
             cwd=cwd
         )
+        if on_start:
+            on_start(proc)
+
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
 
         duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
+        passed = proc.returncode == 0
 
         if passed:
             print_success(f"{name}: PASSED ({duration:.1f}s)")
         else:
             print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:300]}")
+            if stderr:
+                print(f"  Error: {stderr[:300]}")
 
         return {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "output": stdout,
+            "error": stderr,
             "skipped": False,
-            "duration": duration
+            "duration": duration,
+            "returncode": proc.returncode
         }
 
     except subprocess.TimeoutExpired:
         duration = (datetime.now() - start_time).total_seconds()
         print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
         return {"name": name, "passed": False, "output": "", "error": "Timeout",
-                "skipped": False, "duration": duration}
+                "skipped": False, "duration": duration, "returncode": None}
 
     except Exception as e:
         duration = (datetime.now() - start_time).total_seconds()
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "output": "", "error": str(e),
-                "skipped": False, "duration": duration}
+                "skipped": False, "duration": duration, "returncode": None}
 
 
 def run_script_check(name: str, script_path: Path, project_path: str,
@@ -126,6 +180,346 @@ def run_script_check(name: str, script_path: Path, project_path: str,
     return run_check(name, cmd, project_path, timeout)
 
 
+def check_spec(name: str, cmd: list, cwd: str, required: bool = False,
+               timeout: int = 300, depends_on: Optional[List[str]] = None,
+               category: Optional[str] = None, script: Optional[Path] = None,
+               attempts: int = 1, inputs: Optional[List[str]] = None) -> dict:
+    """
+    Build a check description for run_checks_parallel.
+
+    Args:
+        name: Display name (also used as the dependency key)
+        cmd: Command list to execute
+        cwd: Working directory
+        required: Whether a failure should stop the run (with stop_on_fail)
+        timeout: Timeout in seconds
+        depends_on: Names of checks that must pass before this one starts
+        category: Optional category attached to the result
+        script: Script path; the check is skipped if it does not exist
+        attempts: Attempts made when execution raises (retry with backoff)
+        inputs: Glob patterns (relative to cwd) of every file the check
+                reads; enables result caching when set
+
+    Returns:
+        Check spec dict
+    """
+    return {
+        "name": name,
+        "cmd": cmd,
+        "cwd": cwd,
+        "required": required,
+        "timeout": timeout,
+        "depends_on": list(depends_on or []),
+        "category": category,
+        "script": script,
+        "attempts": attempts,
+        "inputs": list(inputs or []),
+    }
+
+
+def script_check_spec(name: str, script_path: Path, project_path: str,
+                      **kwargs) -> dict:
+    """Build a check spec that runs a Python script (see run_script_check)."""
+    return check_spec(name, [sys.executable, str(script_path)], project_path,
+                      script=script_path, **kwargs)
+
+
+class ResultCache:
+    """
+    Persistent, size-bounded LRU cache of check results.
+
+    Entries are keyed by check name, command and the combined content hash
+    of the files matched by the check's input globs. The cache is loaded
+    once, shared by all worker threads and written back with save().
+    """
+
+    def __init__(self, path: Path, max_entries: int = CACHE_MAX_ENTRIES,
+                 max_bytes: int = CACHE_MAX_BYTES):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: Dict[str, dict] = {}
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == 1:
+                self._entries = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+
+    def key_for(self, spec: dict) -> Optional[str]:
+        """Compute the cache key for a check, or None if it declares no inputs."""
+        if not spec.get("inputs"):
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(spec["name"].encode())
+        digest.update(json.dumps(spec["cmd"]).encode())
+        digest.update(hash_inputs(Path(spec["cwd"]), spec["inputs"]).encode())
+        if spec.get("script") is not None:
+            digest.update(hash_inputs(Path(spec["script"]).parent,
+                                      [Path(spec["script"]).name]).encode())
+            digest.update(hash_inputs(HELPER_DIR, HELPER_INPUTS).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry["last_used"] = time.time()
+            self._dirty = True
+            return dict(entry["result"])
+
+    def put(self, key: str, result: dict):
+        """Store a result. Only checks that ran to completion are cached."""
+        if result.get("skipped") or result.get("returncode") is None:
+            return
+        stored = {k: result[k] for k in ("name", "passed", "output", "error",
+                                         "duration", "returncode")}
+        with self._lock:
+            self._entries[key] = {"result": stored, "last_used": time.time()}
+            self._dirty = True
+            self._evict()
+
+    def _evict(self):
+        # Drop least recently used entries until both bounds are satisfied
+        order = sorted(self._entries, key=lambda k: self._entries[k]["last_used"])
+        sizes = {k: len(json.dumps(self._entries[k])) for k in order}
+        total = sum(sizes.values())
+        while order and (len(order) > self.max_entries or total > self.max_bytes):
+            oldest = order.pop(0)
+            total -= sizes[oldest]
+            del self._entries[oldest]
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                tmp.write_text(json.dumps({"version": 1, "entries": self._entries}),
+                               encoding="utf-8")
+                os.replace(tmp, self.path)
+                self._dirty = False
+            except OSError as e:
+                print_warning(f"Could not write check cache: {e}")
+
+
+def hash_inputs(root: Path, patterns: List[str]) -> str:
+    """
+    Hash the content of every file matched by the glob patterns.
+
+    Symlinks contribute their target path, so re-pointing a link
+    invalidates the hash even when the content is identical.
+    """
+    matched = set()
+    for pattern in patterns:
+        matched.update(root.glob(pattern))
+
+    digest = hashlib.sha256()
+    for path in sorted(matched):
+        rel = path.relative_to(root).as_posix()
+        try:
+            if path.is_symlink():
+                digest.update(f"L:{rel}:{os.readlink(path)}\0".encode())
+            if path.is_file():
+                digest.update(f"F:{rel}\0".encode())
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 16), b""):
+                        digest.update(chunk)
+        except OSError:
+            digest.update(f"E:{rel}\0".encode())
+    return digest.hexdigest()
+
+
+class CheckScheduler:
+    """
+    Dependency-aware scheduler that runs checks on a bounded worker pool.
+
+    A check starts as soon as a worker is free and every check it depends on
+    has finished. If a dependency failed, the dependent check is skipped.
+    With stop_on_fail, the first failing required check terminates all
+    in-flight siblings and no further checks are started. When a cache is
+    given, checks with unchanged inputs replay their stored result.
+    """
+
+    def __init__(self, specs: List[dict], jobs: int = DEFAULT_JOBS,
+                 stop_on_fail: bool = False, cache: Optional[ResultCache] = None):
+        self.specs = specs
+        self.jobs = max(1, jobs)
+        self.stop_on_fail = stop_on_fail
+        self.cache = cache
+        self.stopped_by: Optional[str] = None
+        self._known = {spec["name"] for spec in specs}
+        self._procs: Dict[str, subprocess.Popen] = {}
+        self._cancelled = set()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    def run(self) -> List[dict]:
+        """Run all checks. Returns results in declaration order."""
+        pending = list(self.specs)
+        results: Dict[str, dict] = {}
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                for spec in list(pending):
+                    if self._stopping.is_set():
+                        break
+                    if len(running) >= self.jobs:
+                        break
+                    deps = [d for d in spec["depends_on"] if d in self._known]
+                    if any(d not in results for d in deps):
+                        continue
+
+                    pending.remove(spec)
+                    failed_deps = [d for d in deps if _is_failure(results[d])]
+                    if failed_deps:
+                        print_warning(f"{spec['name']}: skipped (dependency failed: "
+                                      f"{', '.join(failed_deps)})")
+                        results[spec["name"]] = self._finish(spec, _skipped_result(
+                            spec["name"], f"Dependency failed: {', '.join(failed_deps)}"))
+                        continue
+
+                    future = pool.submit(self._execute, spec)
+                    running[future] = spec
+
+                if self._stopping.is_set():
+                    pending.clear()
+
+                if not running:
+                    if pending:
+                        # Remaining checks wait on dependencies that never ran
+                        for spec in pending:
+                            results[spec["name"]] = self._finish(spec, _skipped_result(
+                                spec["name"], "Unresolved dependency"))
+                        pending.clear()
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    spec = running.pop(future)
+                    result = self._finish(spec, future.result())
+                    results[spec["name"]] = result
+
+                    if (self.stop_on_fail and spec["required"]
+                            and _is_failure(result) and not self._stopping.is_set()):
+                        self.stopped_by = spec["name"]
+                        self._cancel_running()
+
+        return [results[spec["name"]] for spec in self.specs if spec["name"] in results]
+
+    def _execute(self, spec: dict) -> dict:
+        script = spec.get("script")
+        if script is not None and not Path(script).exists():
+            print_warning(f"{spec['name']}: Script not found, skipping")
+            return {"name": spec["name"], "passed": True, "output": "", "error": "",
+                    "skipped": True, "duration": 0}
+
+        key = self.cache.key_for(spec) if self.cache else None
+        if key:
+            cached = self.cache.get(key)
+            if cached:
+                status = "PASSED" if cached["passed"] else "FAILED"
+                message = f"{spec['name']}: {status} (cached, {cached['duration']:.1f}s)"
+                (print_success if cached["passed"] else print_error)(message)
+                return dict(cached, skipped=False, cached=True)
+
+        def _run():
+            return run_check(spec["name"], spec["cmd"], spec["cwd"],
+                             timeout=spec["timeout"],
+                             on_start=lambda proc: self._register(spec["name"], proc))
+
+        if spec.get("attempts", 1) > 1:
+            from recovery import with_retry
+            _run = with_retry(max_attempts=spec["attempts"], backoff=2)(_run)
+
+        try:
+            result = _run()
+        finally:
+            with self._lock:
+                self._procs.pop(spec["name"], None)
+
+        if key and spec["name"] not in self._cancelled:
+            self.cache.put(key, result)
+        return result
+
+    def _register(self, name: str, proc: subprocess.Popen):
+        # Called from worker threads once a check process has been spawned
+        with self._lock:
+            self._procs[name] = proc
+            if self._stopping.is_set():
+                self._cancelled.add(name)
+                proc.terminate()
+
+    def _cancel_running(self):
+        self._stopping.set()
+        with self._lock:
+            for name, proc in self._procs.items():
+                if proc.poll() is None:
+                    self._cancelled.add(name)
+                    proc.terminate()
+
+    def _finish(self, spec: dict, result: dict) -> dict:
+        if spec["name"] in self._cancelled:
+            result = dict(result, passed=False, skipped=True, error="Cancelled")
+            print_warning(f"{spec['name']}: cancelled")
+        if spec.get("category"):
+            result["category"] = spec["category"]
+        return result
+
+
+def run_checks_parallel(specs: List[dict], jobs: int = DEFAULT_JOBS,
+                        stop_on_fail: bool = False,
+                        cache: Optional[ResultCache] = None) -> List[dict]:
+    """
+    Run checks concurrently, honouring dependencies and stop-on-fail.
+
+    Args:
+        specs: Check specs built with check_spec / script_check_spec
+        jobs: Maximum number of checks running at the same time
+        stop_on_fail: Cancel in-flight checks when a required check fails
+        cache: Optional ResultCache; saved after the run
+
+    Returns:
+        List of result dicts (same format as run_check), in spec order.
+        Checks never started because of a stop are omitted; replayed
+        results carry cached=True.
+    """
+    results = CheckScheduler(specs, jobs=jobs, stop_on_fail=stop_on_fail,
+                             cache=cache).run()
+    if cache:
+        cache.save()
+    return results
+
+
+def first_required_failure(specs: List[dict], results: List[dict]) -> Optional[str]:
+    """Return the name of the first required check that failed, if any."""
+    required = {spec["name"] for spec in specs if spec["required"]}
+    for r in results:
+        if r["name"] in required and _is_failure(r):
+            return r["name"]
+    return None
+
+
+def _is_failure(result: dict) -> bool:
+    return not result["passed"] and not result.get("skipped")
+
+
+def _skipped_result(name: str, reason: str) -> dict:
+    return {"name": name, "passed": False, "output": "", "error": reason,
+            "skipped": True, "duration": 0}
+
+
 def print_summary(results: List[dict], show_duration: bool = False,
                   show_categories: bool = False) -> bool:
     """
@@ -191,5 +585,7 @@ def _print_result_line(r: dict, show_duration: bool = False, indent: str = ""):
     duration_str = ""
     if show_duration and not r.get("skipped") and r.get("duration"):
         duration_str = f" ({r['duration']:.1f}s)"
+    if r.get("cached"):
+        duration_str += " (cached)"
 
     print(f"{indent}{status} {r['name']}{duration_str}")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Frontmatter Reader - Inove AI Framework
+=======================================
+Bounded reads of the YAML-like header of Markdown files (stories, skills,
+agents, workflows), for callers that only need a few header keys.
+
+- The file is read in small chunks and reading stops at the closing
+  '---', so the body of large files is never loaded.
+- Headers are cached in an LRU keyed by (path, mtime_ns, size): scanning
+  the same files again costs one stat each.
+
+Usage as module:
+    from _frontmatter import read_frontmatter
+
+    head = read_frontmatter(path)   # "---\\n...\\n---", or None
+"""
+
+import os
+import functools
+from pathlib import Path
+from typing import Optional, Union
+
+# Read size per chunk and upper bound for a header (larger ones are not frontmatter)
+CHUNK_SIZE = 4096
+MAX_HEADER_BYTES = 64 * 1024
+CACHE_SIZE = 4096
+
+
+def read_frontmatter(path: Union[str, Path], st: Optional[os.stat_result] = None) -> Optional[str]:
+    """
+    Start of the file up to and including the closing '---' line marker,
+    or None when the file is missing, does not open with '---' or has no
+    closing marker within MAX_HEADER_BYTES.
+    """
+    try:
+        st = st or os.stat(path)
+    except OSError:
+        return None
+    return _cached_header(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _cached_header(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    return _read_header(path)
+
+
+def _read_header(path: str) -> Optional[str]:
+    data = b""
+    try:
+        with open(path, "rb") as f:
+            while len(data) < MAX_HEADER_BYTES:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    return None
+                # Look back 3 bytes so a marker split across chunks is found
+                start = max(3, len(data) - 3)
+                data += chunk
+                if not data.startswith(b"---"):
+                    return None
+                end = data.find(b"\n---", start)
+                if end != -1:
+                    return data[:end + 4].decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    return None
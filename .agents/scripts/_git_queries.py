@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Git Queries - Inove AI Framework
+================================
+Shared git access for dashboard, sync_tracker, progress_tracker and the
+docs bootstrap, so one report does not fork git once per question.
+
+- Repository state (available, branch, HEAD commit) is read straight from
+  the git directory: no subprocess at all.
+- History queries (git log ...) run at most once per HEAD: their output
+  is cached in .agents/.cache/git_queries.json and the whole cache is
+  dropped when HEAD moves.
+
+Usage as module:
+    from _git_queries import head_state, git_branch, git_log
+
+    state = head_state()                # {"available", "branch", "head"}
+    branch = git_branch()               # "unknown" outside a repository
+    out = git_log("-3", "--oneline")    # None if git fails
+"""
+
+import os
+import sys
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, Optional
+
+# Query cache (relative to project root) and its format version
+CACHE_FILE = Path(".agents/.cache/git_queries.json")
+CACHE_VERSION = 1
+
+
+def find_git_dir(start: Optional[Path] = None) -> Optional[Path]:
+    """Git directory of the repository containing `start` (default: cwd)."""
+    if os.environ.get("GIT_DIR"):
+        return Path(os.environ["GIT_DIR"])
+
+    path = (start or Path.cwd()).resolve()
+    for directory in (path, *path.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            # Worktrees and submodules: ".git" holds "gitdir: <path>"
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir: "):
+                return (directory / content[8:]).resolve()
+            return None
+    return None
+
+
+def _common_dir(git_dir: Path) -> Path:
+    """Directory holding refs (differs from git_dir in linked worktrees)."""
+    try:
+        return (git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()).resolve()
+    except OSError:
+        return git_dir
+
+
+def _resolve_ref(git_dir: Path, ref: str) -> Optional[str]:
+    """Commit a ref points to, from loose refs or packed-refs."""
+    common = _common_dir(git_dir)
+    for base in (git_dir, common):
+        try:
+            return (base / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+    try:
+        for line in (common / "packed-refs").read_text(encoding="utf-8").splitlines():
+            if line.endswith(" " + ref):
+                return line.split(" ", 1)[0]
+    except OSError:
+        pass
+    return None
+
+
+def head_state() -> Dict[str, object]:
+    """
+    {available, branch, head} without running git: branch is None when
+    detached, head is None before the first commit.
+    """
+    git_dir = find_git_dir()
+    if git_dir is None or shutil.which("git") is None:
+        return {"available": False, "branch": None, "head": None}
+
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return {"available": False, "branch": None, "head": None}
+
+    if head.startswith("ref: "):
+        ref = head[5:]
+        branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+        return {"available": True, "branch": branch, "head": _resolve_ref(git_dir, ref)}
+    return {"available": True, "branch": None, "head": head}
+
+
+def git_available() -> bool:
+    """True if we are inside a git repository and git is installed."""
+    return bool(head_state()["available"])
+
+
+def git_branch() -> str:
+    """Current branch, or 'unknown' when detached or outside a repository."""
+    return head_state()["branch"] or "unknown"
+
+
+class _QueryCache:
+    """git output keyed by arguments, valid for a single HEAD."""
+
+    def __init__(self, path: Path = CACHE_FILE):
+        self.path = path
+        self.head = None
+        self.entries: Dict[str, Optional[str]] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == CACHE_VERSION:
+                self.head = data.get("head")
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+
+    def for_head(self, head: str) -> Dict[str, Optional[str]]:
+        if head != self.head:
+            self.head, self.entries = head, {}
+        return self.entries
+
+    def save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "head": self.head,
+                                       "entries": self.entries}), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[!] Could not write git query cache: {e}", file=sys.stderr)
+
+
+_cache: Optional[_QueryCache] = None
+
+
+def _run_git(args) -> Optional[str]:
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return None
+
+
+def git_log(*args: str) -> Optional[str]:
+    """
+    Output of `git log <args>`, or None if git fails. Cached per HEAD, so
+    args must not depend on the clock (filter dates on the result instead).
+    """
+    global _cache
+    head = head_state()["head"]
+    if head is None:
+        return _run_git(["log", *args])
+
+    if _cache is None:
+        _cache = _QueryCache()
+    entries = _cache.for_head(head)
+    key = "\0".join(args)
+    if key not in entries:
+        entries[key] = _run_git(["log", *args])
+        _cache.save()
+    return entries[key]
@@ -0,0 +1,868 @@
+#!/usr/bin/env python3
+"""
+Shared Scan Engine - Inove AI Framework
+========================================
+Single-pass scanning core for the skill audit scripts
+(ux_audit, mobile_audit, security_scan, accessibility_checker, seo_checker,
+geo_checker, i18n_checker, react_performance_checker).
+
+One directory walk and one read per file are shared by every registered
+auditor. Auditors query the file through a FileContext whose search/findall
+results are memoized per file, so a pattern used by several rules (or
+several auditors) is evaluated once.
+
+Every pattern is reduced to the literal prefixes one of which must start
+any match (e.g. "hero|<h1|banner" -> {"hero", "<h1", "banner"}). Those
+literals are checked with plain substring search against one lower-cased
+copy of the file: absent patterns never reach the regex engine, and
+present ones start matching at the first literal occurrence.
+
+Reads are bounded: each file is audited up to a byte budget, minified
+bundles only through a leading sample, and auditors that scan arbitrary
+files (security_scan) stream large ones as overlapping mmap windows.
+
+Incremental mode keeps a per-file index (size, mtime, content hash and the
+findings each auditor produced) under .agents/.cache/. Unchanged files are
+not read again; their cached findings are replayed into the auditors so
+reports look exactly like a full run.
+
+Usage as module:
+    from _scan_engine import ScanEngine, Auditor, AuditIndex
+
+    engine = ScanEngine(project_path)
+    engine.register(MyAuditor())
+    engine.run()
+
+    # Only re-scan files changed since the last run (or since a git ref)
+    ScanEngine(project_path, auditors, index=AuditIndex(project_path, since="HEAD~1")).run()
+"""
+
+import os
+import re
+import mmap
+import sys
+import json
+import hashlib
+import inspect
+import functools
+import itertools
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+# Directories no auditor ever wants to enter
+DEFAULT_SKIP_DIRS = frozenset({
+    'node_modules', '.git', 'dist', 'build', '.next', '__pycache__', '.venv', 'venv',
+})
+
+# Framework state (check cache, audit index) is never audited
+STATE_DIR = Path(".agents") / ".cache"
+
+# Read limits: bytes audited per file, window size and overlap for streamed
+# reads, and the sample taken from minified bundles
+DEFAULT_BYTE_BUDGET = 16 * 1024 * 1024
+WINDOW_BYTES = 1024 * 1024
+WINDOW_OVERLAP = 4096
+SNIFF_BYTES = 8192
+MINIFIED_SAMPLE_BYTES = 256 * 1024
+MINIFIED_LINE_LENGTH = 1000
+
+
+class Auditor:
+    """
+    A rule set plugged into ScanEngine.
+
+    Subclasses declare the file extensions they audit, the directories they
+    skip and an optional cap on audited files, then implement visit(ctx).
+    finish() runs once after the walk; report() returns a JSON-serializable
+    summary used by audit_suite.py.
+    """
+
+    name = "auditor"
+    extensions: Set[str] = frozenset()
+    skip_dirs: Set[str] = DEFAULT_SKIP_DIRS
+    max_files: Optional[int] = None
+    # Accumulators filled by visit(), as attribute paths ("issues",
+    # "results.findings"). Lists are appended to, numbers and dicts of
+    # numbers are incremented. Declaring them enables incremental mode.
+    state_fields: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self.files_seen = 0      # Files accepted by this auditor
+        self.files_visited = 0   # Files actually audited (after max_files)
+
+    def accepts(self, path: Path) -> bool:
+        """Extra per-file filter (path is root-joined, as given to the engine)."""
+        return True
+
+    def visit(self, ctx: "FileContext") -> None:
+        raise NotImplementedError
+
+    def finish(self) -> None:
+        pass
+
+    def report(self) -> dict:
+        return {}
+
+
+class FileContext:
+    """
+    One file as seen by every auditor: content is read once, lower-cased
+    once, and regex results are memoized per (pattern, flags).
+
+    Reads are capped by a per-file byte budget (minified files by a smaller
+    sample). Auditors that must stay flat in memory on huge files iterate
+    windows() instead of text: files above WINDOW_BYTES are mapped with
+    mmap and decoded one overlapping window at a time.
+    """
+
+    # Position of this context in its file; a whole file is a single window.
+    # Matches starting at or after `owned` belong to the next window, so
+    # matches shorter than the overlap are counted exactly once.
+    first_line = 1
+    at_line_start = True
+    final = True
+
+    def __init__(self, path: Path, rel: Path, budget: Optional[int] = DEFAULT_BYTE_BUDGET):
+        self.path = path
+        self.rel = rel
+        self.name = path.name
+        self.suffix = path.suffix
+        self.budget = budget
+        self._size: Optional[int] = None
+        self._head: Optional[bytes] = None
+        self._owned: Optional[int] = None
+        self._text: Optional[str] = None
+        self._lower: Optional[str] = None
+        self._folded: Optional[str] = None
+        self._search: Dict["CompiledRule", Optional[re.Match]] = {}
+        self._findall: Dict["CompiledRule", list] = {}
+        # Prefilter: first offset of each prefix literal, per haystack (folded or not)
+        self._literal_hits: Dict[bool, Dict[str, int]] = {False: {}, True: {}}
+        self._literals_scanned: Dict[bool, int] = {False: 0, True: 0}
+
+    @property
+    def size(self) -> int:
+        if self._size is None:
+            self._size = os.stat(self.path).st_size
+        return self._size
+
+    @property
+    def head(self) -> bytes:
+        """First SNIFF_BYTES of the file, used for binary/minified detection."""
+        if self._head is None:
+            if self.size <= MINIFIED_SAMPLE_BYTES:
+                self.text  # Small files are read whole anyway; keep one read
+            else:
+                with open(self.path, 'rb') as f:
+                    self._head = f.read(SNIFF_BYTES)
+        return self._head
+
+    @property
+    def is_binary(self) -> bool:
+        return b'\0' in self.head
+
+    @property
+    def is_minified(self) -> bool:
+        """Bundled/minified output: larger than the sample, with very long lines."""
+        if self.size <= MINIFIED_SAMPLE_BYTES:
+            return False
+        head = self.head
+        return len(head) / (head.count(b'\n') + 1) > MINIFIED_LINE_LENGTH
+
+    @property
+    def limit(self) -> int:
+        """Bytes of the file auditors get to see."""
+        limit = self.size
+        if self.budget is not None:
+            limit = min(limit, self.budget)
+        if self.is_minified:
+            limit = min(limit, MINIFIED_SAMPLE_BYTES)
+        return limit
+
+    @property
+    def truncated(self) -> bool:
+        return self.limit < self.size
+
+    def read_summary(self) -> dict:
+        """Size and bytes audited, for reports listing truncated files."""
+        return {"file": str(self.rel), "size": self.size, "scanned_bytes": self.limit,
+                "minified": self.is_minified}
+
+    @property
+    def owned(self) -> int:
+        return len(self.text) if self._owned is None else self._owned
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            with open(self.path, 'rb') as f:
+                data = f.read(self.limit) if self.truncated else f.read()
+            if self._head is None:
+                self._head = data[:SNIFF_BYTES]
+            self._text = _decode(data)
+        return self._text
+
+    def windows(self, size: int = WINDOW_BYTES, overlap: int = WINDOW_OVERLAP) -> Iterator["FileContext"]:
+        """
+        Yield the audited part of the file as overlapping windows.
+
+        A file that fits in one window is yielded as itself (sharing its
+        memoized matches); larger ones are mapped and decoded window by
+        window, so memory stays bounded by `size` whatever the file size.
+        Each window is a FileContext over its slice, with first_line,
+        owned, at_line_start and final describing where it sits.
+        """
+        limit = self.limit
+        if limit <= size or self._text is not None:
+            yield self
+            return
+
+        step = size - overlap
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offset, first_line, at_line_start = 0, 1, True
+            while offset < limit:
+                owned = _decode(mm[offset:min(offset + step, limit)])
+                final = offset + step >= limit
+                tail = '' if final else _decode(mm[offset + step:min(offset + size, limit)])
+                window = FileContext(self.path, self.rel, self.budget)
+                window._size, window._head = self._size, self._head
+                window._text, window._owned = owned + tail, len(owned)
+                window.first_line, window.at_line_start, window.final = first_line, at_line_start, final
+                yield window
+                first_line += owned.count('\n')
+                at_line_start = owned.endswith('\n')
+                offset += step
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def folded(self) -> str:
+        """Case-folded content used by the literal prefilter."""
+        if self._folded is None:
+            self._folded = self.lower if self.text.isascii() else self.text.casefold()
+        return self._folded
+
+    def search(self, pattern, flags: int = 0) -> Optional[re.Match]:
+        """First match of a pattern string or a precompiled rule."""
+        rule = pattern if isinstance(pattern, CompiledRule) else compile_rule(pattern, flags)
+        if rule not in self._search:
+            pos = rule.first_position(self)
+            self._search[rule] = None if pos is None else rule.regex.search(self.text, pos)
+        return self._search[rule]
+
+    def findall(self, pattern, flags: int = 0) -> list:
+        """All matches of a pattern string or a precompiled rule."""
+        rule = pattern if isinstance(pattern, CompiledRule) else compile_rule(pattern, flags)
+        if rule not in self._findall:
+            pos = rule.first_position(self)
+            self._findall[rule] = [] if pos is None else rule.regex.findall(self.text, pos)
+        return self._findall[rule]
+
+    def count(self, pattern, flags: int = 0) -> int:
+        return len(self.findall(pattern, flags))
+
+    def count_owned(self, pattern, flags: int = 0) -> int:
+        """Matches starting in the owned part of a window (all matches for a whole file)."""
+        if self._owned is None:
+            return self.count(pattern, flags)
+        rule = pattern if isinstance(pattern, CompiledRule) else compile_rule(pattern, flags)
+        pos = rule.first_position(self)
+        if pos is None:
+            return 0
+        total = 0
+        for m in rule.regex.finditer(self.text, pos):
+            if m.start() >= self._owned:
+                break
+            total += 1
+        return total
+
+    def contains(self, literal: str) -> bool:
+        return literal in self.text
+
+    def literal_position(self, literal: str, folded: bool) -> int:
+        """
+        First offset of a rule's prefix literal (-1 if absent). All prefix
+        literals known for this file type are located together, in one
+        pass over the haystack; the pass only repeats for literals of rules
+        first seen on this file.
+        """
+        literals = _LITERAL_TABLES.setdefault((self.suffix.lower(), folded), {})
+        if literal not in literals:
+            literals[literal] = None  # Insertion-ordered: new literals go last
+        scanned = self._literals_scanned[folded]
+        if scanned < len(literals):
+            pending = tuple(itertools.islice(literals, scanned, None))
+            haystack = self.folded if folded else self.text
+            self._literal_hits[folded].update(_first_literal_hits(haystack, pending))
+            self._literals_scanned[folded] = len(literals)
+        return self._literal_hits[folded].get(literal, -1)
+
+
+class CompiledRule:
+    """A compiled pattern plus the literal prefixes used to prefilter it."""
+
+    def __init__(self, pattern: str, flags: int):
+        self.regex = re.compile(pattern, flags)
+        self.ignorecase = bool(self.regex.flags & re.IGNORECASE)
+        self.prefixes = _literal_prefixes(pattern, flags)
+        if self.prefixes is not None and self.ignorecase:
+            self.prefixes = {p.casefold() for p in self.prefixes}
+        # No lookarounds or anchors: a match inside a substring is a match of the substring
+        self.context_free = _context_free(pattern, flags)
+
+    def first_position(self, ctx: FileContext) -> Optional[int]:
+        """
+        Earliest offset where a match could start, or None if the pattern
+        cannot match at all.
+        """
+        if self.prefixes is None:
+            return 0
+
+        positions = [ctx.literal_position(literal, self.ignorecase) for literal in self.prefixes]
+        first = min((index for index in positions if index != -1), default=None)
+        if first is None:
+            return None
+        # Case-folding may change lengths outside ASCII; offsets only align for ASCII text
+        if self.ignorecase and not ctx.text.isascii():
+            return 0
+        return first
+
+
+# Prefix literals seen per (file suffix, case-folded), in order of first use.
+# Dicts used as ordered sets: a file's pass covers a prefix of each table.
+_LITERAL_TABLES: Dict[Tuple[str, bool], Dict[str, None]] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _literal_matcher(literals: Tuple[str, ...]) -> Tuple[re.Pattern, Dict[str, List[str]]]:
+    """
+    One alternation over `literals`, longest first, so a match is the
+    longest literal at its offset; and for each literal, the literals that
+    are its prefixes (they match at the same offset).
+    """
+    ordered = sorted(literals, key=len, reverse=True)
+    regex = re.compile("|".join(map(re.escape, ordered)))
+    covers = {literal: [other for other in literals if literal.startswith(other)]
+              for literal in literals}
+    return regex, covers
+
+
+def _first_literal_hits(haystack: str, literals: Tuple[str, ...]) -> Dict[str, int]:
+    """First offset of each literal found in haystack, in a single left-to-right sweep."""
+    regex, covers = _literal_matcher(literals)
+    hits: Dict[str, int] = {}
+    pos = 0
+    while len(hits) < len(literals):
+        # Resume one character later (not at the match end) so overlapping literals are seen
+        match = regex.search(haystack, pos)
+        if match is None:
+            break
+        for literal in covers[match.group()]:
+            hits.setdefault(literal, match.start())
+        pos = match.start() + 1
+    return hits
+
+
+@functools.lru_cache(maxsize=2048)
+def compile_rule(pattern: str, flags: int = 0) -> CompiledRule:
+    """Compile a pattern once per process."""
+    return CompiledRule(pattern, flags)
+
+
+def _literal_prefixes(pattern: str, flags: int) -> Optional[Set[str]]:
+    """
+    Literal strings one of which must begin every match of the pattern,
+    or None when no such set can be derived (the pattern is always run).
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+    prefixes = _prefixes_of(list(parsed))
+    if not prefixes or any(not p for p in prefixes):
+        return None
+    return prefixes
+
+
+def _context_free(pattern: str, flags: int) -> bool:
+    """True when the pattern has no lookarounds and no anchors other than \\b / \\B."""
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return False
+    word_boundaries = (sre_constants.AT_BOUNDARY, sre_constants.AT_NON_BOUNDARY)
+
+    def walk(items) -> bool:
+        for op, av in items:
+            if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+                return False
+            if op is sre_constants.AT and av not in word_boundaries:
+                return False
+            if op is sre_constants.SUBPATTERN and not walk(av[3]):
+                return False
+            if op is sre_constants.BRANCH and not all(walk(b) for b in av[1]):
+                return False
+            if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and not walk(av[2]):
+                return False
+        return True
+
+    return walk(list(parsed))
+
+
+def _prefixes_of(items: list) -> Optional[Set[str]]:
+    literal = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            literal.append(chr(av))
+            continue
+        if literal:
+            break
+        if op is sre_constants.AT:
+            continue  # Zero-width anchors (^, \b) before the first literal
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            if (add_flags | del_flags) & sre_constants.SRE_FLAG_IGNORECASE:
+                return None
+            return _prefixes_of(list(sub))
+        if op is sre_constants.BRANCH:
+            result = set()
+            for branch in av[1]:
+                branch_prefixes = _prefixes_of(list(branch))
+                if not branch_prefixes:
+                    return None
+                result |= branch_prefixes
+            return result
+        return None
+    return {''.join(literal)} if literal else None
+
+
+class ScanEngine:
+    """
+    Walks a project once and feeds every file to the auditors that want it.
+
+    Directories are pruned only when every registered auditor skips them;
+    per-auditor skip lists and filters are applied to each file.
+
+    With jobs > 1 and a picklable `factory` that rebuilds the same auditors,
+    files are sharded across worker processes. Workers only run visit() and
+    return per-file state deltas; the parent applies them in walk order, so
+    the merged report is identical to a sequential run. This requires every
+    auditor to declare state_fields; otherwise the scan stays sequential.
+    """
+
+    def __init__(self, root, auditors: Iterable[Auditor] = (), index: Optional["AuditIndex"] = None,
+                 jobs: int = 1, factory: Optional[Callable[[], Iterable[Auditor]]] = None,
+                 budget: Optional[int] = DEFAULT_BYTE_BUDGET):
+        self.root = Path(root)
+        self.auditors: List[Auditor] = list(auditors)
+        self.index = index
+        self.jobs = jobs
+        self.factory = factory
+        self.budget = budget  # Per-file byte budget (None reads files whole)
+        if index is not None:
+            index.budget = budget
+        self.files_scanned = 0
+
+    def register(self, auditor: Auditor) -> Auditor:
+        self.auditors.append(auditor)
+        return auditor
+
+    def run(self) -> None:
+        """Walk the tree, visit every accepted file, then finish all auditors."""
+        if self.root.is_file():
+            self.scan_file(self.root, Path(self.root.name))
+        elif self.parallel:
+            self._run_parallel()
+        else:
+            for path, rel in self.iter_files():
+                self.scan_file(path, rel)
+        for auditor in self.auditors:
+            auditor.finish()
+        if self.index is not None:
+            self.index.save()
+
+    @property
+    def parallel(self) -> bool:
+        return (self.jobs > 1 and self.factory is not None
+                and all(a.state_fields for a in self.auditors))
+
+    def iter_files(self):
+        """Yield (path, relative path) once for every candidate file, in sorted order."""
+        extensions = set().union(*(a.extensions for a in self.auditors)) if self.auditors else set()
+        prune = frozenset.intersection(*(frozenset(a.skip_dirs) for a in self.auditors)) \
+            if self.auditors else DEFAULT_SKIP_DIRS
+
+        state_dir = self.root / STATE_DIR
+        for dirpath, dirs, files in os.walk(self.root):
+            base = Path(dirpath)
+            dirs[:] = sorted(d for d in dirs if d not in prune and base / d != state_dir)
+            for filename in sorted(files):
+                if _suffix(filename) in extensions:
+                    path = base / filename
+                    yield path, path.relative_to(self.root)
+
+    def _admit(self, auditor: Auditor, path: Path, rel: Path, suffix: str) -> bool:
+        """Apply the auditor's filters and file cap; count the file if admitted."""
+        if suffix not in auditor.extensions:
+            return False
+        if any(part in auditor.skip_dirs for part in rel.parts[:-1]):
+            return False
+        if not auditor.accepts(path):
+            return False
+        auditor.files_seen += 1
+        if auditor.max_files is not None and auditor.files_visited >= auditor.max_files:
+            return False
+        auditor.files_visited += 1
+        return True
+
+    def scan_file(self, path: Path, rel: Path) -> Optional[FileContext]:
+        """Run every interested auditor on one file (content read at most once)."""
+        suffix = _suffix(path.name)
+        ctx = None
+        entry = None
+        for auditor in self.auditors:
+            if not self._admit(auditor, path, rel, suffix):
+                continue
+
+            tracked = self.index is not None and bool(auditor.state_fields)
+            if tracked:
+                if entry is None:
+                    entry = self.index.entry_for(path, rel)
+                delta = self.index.cached_delta(auditor, entry)
+                if delta is not None:
+                    apply_state(auditor, delta)
+                    self.index.store(auditor, entry, delta, reused=True)
+                    continue
+                before = capture_state(auditor)
+
+            if ctx is None:
+                ctx = FileContext(path, rel, self.budget)
+                self.files_scanned += 1
+            try:
+                auditor.visit(ctx)
+            except OSError:
+                continue
+            if tracked:
+                self.index.store(auditor, entry, diff_state(auditor, before))
+        return ctx
+
+    def _run_parallel(self) -> None:
+        # Plan in the parent: filters, caps and index hits depend on walk order
+        plan = []     # (entry, [(auditor position, cached delta or None)])
+        pending = []  # (path, rel, [auditor positions]) sent to workers
+        for path, rel in self.iter_files():
+            suffix = _suffix(path.name)
+            entry = self.index.entry_for(path, rel) if self.index is not None else None
+            steps, todo = [], []
+            for position, auditor in enumerate(self.auditors):
+                if not self._admit(auditor, path, rel, suffix):
+                    continue
+                cached = self.index.cached_delta(auditor, entry) if entry is not None else None
+                steps.append((position, cached))
+                if cached is None:
+                    todo.append(position)
+            if steps:
+                plan.append((entry, steps))
+            if todo:
+                pending.append((str(path), rel.as_posix(), todo))
+
+        self.files_scanned += len(pending)
+        # Several chunks per worker keep the pool balanced; map() keeps their order
+        chunk = max(1, min(256, len(pending) // (self.jobs * 4)))
+        chunks = [pending[i:i + chunk] for i in range(0, len(pending), chunk)]
+        scanned = []
+        if chunks:
+            with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                     initargs=(self.factory, self.budget)) as pool:
+                for batch in pool.map(_scan_chunk, chunks):
+                    scanned.extend(batch)
+        results = iter(scanned)
+
+        # Merge in walk order so findings and counters match a sequential run
+        for entry, steps in plan:
+            fresh = next(results) if any(cached is None for _, cached in steps) else {}
+            for position, cached in steps:
+                auditor = self.auditors[position]
+                delta = cached if cached is not None else fresh.get(position)
+                if delta is None:
+                    continue  # Unreadable file: nothing to record
+                apply_state(auditor, delta)
+                if entry is not None:
+                    self.index.store(auditor, entry, delta, reused=cached is not None)
+
+
+# Auditors rebuilt once per worker process by _init_worker()
+_WORKER_AUDITORS: List[Auditor] = []
+_WORKER_BUDGET: Optional[int] = DEFAULT_BYTE_BUDGET
+
+
+def _init_worker(factory, budget: Optional[int]) -> None:
+    global _WORKER_AUDITORS, _WORKER_BUDGET
+    _WORKER_AUDITORS = list(factory())
+    _WORKER_BUDGET = budget
+
+
+def _scan_chunk(chunk) -> List[Dict[int, dict]]:
+    """Visit a shard of files in a worker; return {auditor position: delta} per file."""
+    results = []
+    for path, rel, positions in chunk:
+        ctx = FileContext(Path(path), Path(rel), _WORKER_BUDGET)
+        deltas = {}
+        for position in positions:
+            auditor = _WORKER_AUDITORS[position]
+            before = capture_state(auditor)
+            try:
+                auditor.visit(ctx)
+            except OSError:
+                continue
+            deltas[position] = diff_state(auditor, before)
+        results.append(deltas)
+    return results
+
+
+def _suffix(filename: str) -> str:
+    return os.path.splitext(filename)[1].lower()
+
+
+def _decode(data: bytes) -> str:
+    """Decode like open(..., errors='replace') in text mode, universal newlines included."""
+    text = data.decode('utf-8', errors='replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+# ============================================================================
+#  INCREMENTAL INDEX
+# ============================================================================
+
+INDEX_FILE = STATE_DIR / "audit_index.json"
+
+
+def _resolve(obj, field: str):
+    """Follow an attribute path ("results.findings") through objects and dicts."""
+    for part in field.split('.'):
+        obj = obj[part] if isinstance(obj, dict) else getattr(obj, part)
+    return obj
+
+
+def capture_state(auditor: Auditor) -> dict:
+    """Snapshot list lengths and counter values of an auditor's accumulators."""
+    snapshot = {}
+    for field in auditor.state_fields:
+        value = _resolve(auditor, field)
+        snapshot[field] = len(value) if isinstance(value, list) else \
+            dict(value) if isinstance(value, dict) else value
+    return snapshot
+
+
+def diff_state(auditor: Auditor, before: dict) -> dict:
+    """What one visit() added to each accumulator since capture_state()."""
+    delta = {}
+    for field in auditor.state_fields:
+        value = _resolve(auditor, field)
+        if isinstance(value, list):
+            added = value[before[field]:]
+        elif isinstance(value, dict):
+            added = {k: v - before[field].get(k, 0) for k, v in value.items()
+                     if v != before[field].get(k, 0)}
+        else:
+            added = value - before[field]
+        if added:
+            delta[field] = added
+    return delta
+
+
+def apply_state(auditor: Auditor, delta: dict) -> None:
+    """Replay a cached delta into the auditor's accumulators."""
+    for field, added in delta.items():
+        value = _resolve(auditor, field)
+        if isinstance(value, list):
+            value.extend(added)
+        elif isinstance(value, dict):
+            for k, v in added.items():
+                value[k] = value.get(k, 0) + v
+        else:
+            parent, _, attr = field.rpartition('.')
+            owner = _resolve(auditor, parent) if parent else auditor
+            if isinstance(owner, dict):
+                owner[attr] = owner[attr] + added
+            else:
+                setattr(owner, attr, getattr(owner, attr) + added)
+
+
+def git_changed_files(root: Path, ref: str) -> Optional[Set[str]]:
+    """
+    Paths (relative to root) changed since a git ref, including untracked
+    files, or None when git cannot answer.
+    """
+    changed = set()
+    for cmd in (["git", "diff", "--name-only", "--relative", ref, "--"],
+                ["git", "ls-files", "--others", "--exclude-standard"]):
+        try:
+            result = subprocess.run(cmd, cwd=root, capture_output=True, text=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        changed.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return changed
+
+
+def incremental_flags(argv: List[str]) -> Tuple[bool, Optional[str]]:
+    """Parse --incremental and --since REF from a raw argument list."""
+    since = None
+    if "--since" in argv:
+        position = argv.index("--since")
+        if position + 1 < len(argv):
+            since = argv[position + 1]
+    return ("--incremental" in argv or since is not None), since
+
+
+class FileEntry:
+    """Identity of one file for the index: stat and (lazily) content hash."""
+
+    def __init__(self, path: Path, rel: Path):
+        self.path = path
+        self.key = rel.as_posix()
+        try:
+            st = path.stat()
+            self.size, self.mtime_ns = st.st_size, st.st_mtime_ns
+        except OSError:
+            self.size, self.mtime_ns = -1, -1
+        self._sha256: Optional[str] = None
+
+    @property
+    def sha256(self) -> str:
+        if self._sha256 is None:
+            digest = hashlib.sha256()
+            try:
+                with open(self.path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 16), b''):
+                        digest.update(chunk)
+            except OSError:
+                pass
+            self._sha256 = digest.hexdigest()
+        return self._sha256
+
+
+class AuditIndex:
+    """
+    Per-file findings index used by --incremental.
+
+    Each auditor section is stamped with a fingerprint of the auditor's
+    source file, so editing a rule invalidates its cached findings. A file
+    is reused when its size and mtime match the index, or when its content
+    hash still matches. With `since`, files git reports as changed since
+    that ref are always rescanned; the others still go through the
+    size/mtime/hash checks, since their entry may predate the ref.
+    """
+
+    def __init__(self, root, since: Optional[str] = None, path: Optional[Path] = None):
+        self.root = Path(root)
+        self.path = path or (self.root / INDEX_FILE)
+        self.since = since
+        self.budget: Optional[int] = DEFAULT_BYTE_BUDGET  # Set by ScanEngine; part of the fingerprint
+        self.reused = 0
+        self.rescanned = 0
+        self._old: Dict[str, dict] = {}
+        self._new: Dict[str, dict] = {}
+        self._changed: Optional[Set[str]] = None
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == 1:
+                self._old = data.get("auditors", {})
+        except (OSError, ValueError):
+            pass
+
+        if since is not None:
+            self._changed = git_changed_files(self.root, since)
+            if self._changed is None:
+                print(f"[!] git could not diff against '{since}'; falling back to mtime/hash checks",
+                      file=sys.stderr)
+
+    def _section(self, auditor: Auditor) -> Tuple[dict, dict]:
+        """(old files, new files) for an auditor, dropping stale fingerprints."""
+        name = auditor.name
+        if name not in self._new:
+            fingerprint = _auditor_fingerprint(auditor, self.budget)
+            old = self._old.get(name, {})
+            self._old[name] = old if old.get("fingerprint") == fingerprint else {}
+            self._new[name] = {"fingerprint": fingerprint, "files": {}}
+        return self._old[name].get("files", {}), self._new[name]["files"]
+
+    def entry_for(self, path: Path, rel: Path) -> FileEntry:
+        return FileEntry(path, rel)
+
+    def cached_delta(self, auditor: Auditor, entry: FileEntry) -> Optional[dict]:
+        """Cached findings for an unchanged file, or None if it must be scanned."""
+        old, _ = self._section(auditor)
+        record = old.get(entry.key)
+        if record is None:
+            return None
+        if self._changed is not None and entry.key in self._changed:
+            return None
+        if record["size"] == entry.size and record["mtime_ns"] == entry.mtime_ns:
+            return record["delta"]
+        if record["size"] == entry.size and record["sha256"] == entry.sha256:
+            return record["delta"]
+        return None
+
+    def store(self, auditor: Auditor, entry: FileEntry, delta: dict, reused: bool = False):
+        old, new = self._section(auditor)
+        previous = old.get(entry.key)
+        if reused and previous is not None:
+            # Keep the known hash instead of reading the file to recompute it
+            sha256 = previous["sha256"] if previous["size"] == entry.size else entry.sha256
+        else:
+            sha256 = entry.sha256
+        new[entry.key] = {"size": entry.size, "mtime_ns": entry.mtime_ns,
+                          "sha256": sha256, "delta": delta}
+        if reused:
+            self.reused += 1
+        else:
+            self.rescanned += 1
+
+    def summary(self) -> dict:
+        return {"rescanned": self.rescanned, "reused": self.reused, "since": self.since}
+
+    def save(self):
+        # Sections of auditors not run this time are kept as they were
+        auditors = {name: section for name, section in self._old.items()
+                    if name not in self._new and section}
+        auditors.update(self._new)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": 1, "auditors": auditors}), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[!] Could not write audit index: {e}", file=sys.stderr)
+
+
+def _auditor_fingerprint(auditor: Auditor, budget: Optional[int] = None) -> str:
+    """Hash of the auditor's source file (and the engine), so rule edits invalidate the index."""
+    digest = hashlib.sha256(f"{auditor.name}:{budget}".encode())
+    try:
+        auditor_source = inspect.getsourcefile(type(auditor))
+    except TypeError:
+        auditor_source = None
+    for source in (auditor_source, __file__):
+        try:
+            digest.update(Path(source).read_bytes())
+        except (OSError, TypeError):
+            pass
+    return digest.hexdigest()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Session Store - Inove AI Framework
+==================================
+Columnar copy of the daily session logs (docs/08-Logs-Sessoes/YYYY/*.md) in
+a SQLite table indexed by date, so range queries (dashboard, metrics,
+sync_tracker) do not re-parse every Markdown log.
+
+The Markdown logs stay the source of truth. auto_session writes a log's
+rows at session end; before each query, logs dated in the range are
+checked by size and mtime, and any log that is new or was edited by hand
+is parsed again. The store lives in .agents/.cache/ and can be deleted at
+any time.
+
+Usage as module:
+    from _session_store import open_store
+
+    store = open_store(logs_dir)        # None if SQLite is unavailable
+    if store is not None:
+        with store:
+            rows = store.sessions_in_range(start_date, end_date)
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from platform_compat import parse_log_content, iter_log_files
+
+# Store location (relative to project root) and schema version
+STORE_FILE = Path(".agents/.cache/sessions.sqlite")
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS log_files (
+    path TEXT PRIMARY KEY,
+    file_date TEXT,
+    date TEXT,
+    project TEXT,
+    size INTEGER,
+    mtime_ns INTEGER
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    path TEXT,
+    seq INTEGER,
+    date TEXT,
+    start TEXT,
+    "end" TEXT,
+    duration_minutes INTEGER,
+    agent TEXT,
+    activities TEXT
+);
+CREATE INDEX IF NOT EXISTS sessions_by_date ON sessions (date, start);
+CREATE INDEX IF NOT EXISTS sessions_by_path ON sessions (path);
+CREATE INDEX IF NOT EXISTS log_files_by_date ON log_files (file_date);
+"""
+
+
+class SessionStore:
+    """SQLite-backed session rows, kept in step with the Markdown logs."""
+
+    def __init__(self, logs_dir: Path, path: Path = STORE_FILE):
+        # Resolved once, so row keys match however logs_dir was given
+        self.logs_dir = Path(logs_dir).resolve()
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), timeout=5)
+        self.conn.row_factory = sqlite3.Row
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.conn.executescript("DROP TABLE IF EXISTS log_files; DROP TABLE IF EXISTS sessions;")
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def ingest(self, log_file: Path, st=None) -> None:
+        """(Re)write the rows of one daily log."""
+        st = st or log_file.stat()
+        parsed = parse_log_content(log_file.read_text(encoding="utf-8"))
+        date, project, entries = parsed if parsed else (None, None, [])
+        key = str(log_file.resolve())
+        with self.conn:
+            self.conn.execute("DELETE FROM sessions WHERE path = ?", (key,))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO log_files (path, file_date, date, project, size, mtime_ns) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, log_file.stem, date, project, st.st_size, st.st_mtime_ns),
+            )
+            self.conn.executemany(
+                'INSERT INTO sessions (path, seq, date, start, "end", duration_minutes, agent, activities) '
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(key, seq, date, start, end, duration, agent, json.dumps(activities, ensure_ascii=False))
+                 for seq, (start, end, duration, activities, agent) in enumerate(entries)],
+            )
+
+    def refresh(self, start_date: datetime, end_date: datetime) -> None:
+        """Re-ingest logs in the range that are new or changed; drop deleted ones."""
+        known = {
+            row["path"]: (row["size"], row["mtime_ns"])
+            for row in self.conn.execute(
+                "SELECT path, size, mtime_ns FROM log_files WHERE file_date BETWEEN ? AND ?",
+                (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")),
+            )
+        }
+        for log_file in iter_log_files(self.logs_dir, start_date, end_date):
+            st = log_file.stat()
+            if known.pop(str(log_file), None) != (st.st_size, st.st_mtime_ns):
+                self.ingest(log_file, st)
+
+        # Known logs dated in the range that are gone from disk
+        gone = [path for path in known if not Path(path).exists()]
+        if gone:
+            with self.conn:
+                self.conn.executemany("DELETE FROM sessions WHERE path = ?", [(p,) for p in gone])
+                self.conn.executemany("DELETE FROM log_files WHERE path = ?", [(p,) for p in gone])
+
+    def sessions_in_range(self, start_date: datetime, end_date: datetime) -> List[dict]:
+        """
+        Sessions of the logs whose file name falls in the range, ordered by
+        (date, start).
+
+        Rows: {date, project, start, end, duration_minutes, activities, agent}
+        with agent None when the log entry had no badge.
+        """
+        self.refresh(start_date, end_date)
+        rows = self.conn.execute(
+            'SELECT s.date, f.project, s.start, s."end", s.duration_minutes, s.agent, s.activities '
+            "FROM sessions s JOIN log_files f ON f.path = s.path "
+            "WHERE f.file_date BETWEEN ? AND ? "
+            "ORDER BY s.date, s.start, s.path, s.seq",
+            (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")),
+        )
+        return [
+            {
+                "date": row["date"],
+                "project": row["project"],
+                "start": row["start"],
+                "end": row["end"],
+                "duration_minutes": row["duration_minutes"],
+                "agent": row["agent"],
+                "activities": json.loads(row["activities"]),
+            }
+            for row in rows
+        ]
+
+
+def open_store(logs_dir: Path, path: Path = STORE_FILE) -> Optional[SessionStore]:
+    """Open the session store, or None when SQLite cannot be used here."""
+    try:
+        return SessionStore(logs_dir, path)
+    except (sqlite3.Error, OSError):
+        return None
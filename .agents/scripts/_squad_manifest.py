@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Squad Manifest Loader - Inove AI Framework
+==========================================
+One loader for squads/*/squad.yaml, shared by squad_manager and
+validate_installation.
+
+- PyYAML with the libyaml C loader (CSafeLoader) when available, then
+  PyYAML's pure-Python SafeLoader, then a minimal line parser (flat keys,
+  one level of nesting, simple lists) when PyYAML is not installed.
+- Parsed manifests are cached in memory by (path, mtime_ns, size); callers
+  get their own copy.
+
+Usage as module:
+    from _squad_manifest import load_manifest
+
+    manifest = load_manifest(squad_dir / "squad.yaml")   # dict, {} if empty
+                                                         # PARSE_ERRORS if malformed
+
+Benchmark of the loading paths over the squads and templates of this tree:
+    python3 .agents/scripts/_squad_manifest.py --benchmark [ROUNDS]
+"""
+
+import os
+import sys
+import copy
+import time
+import functools
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+CACHE_SIZE = 256
+
+# What load_manifest raises on a malformed (but readable) squad.yaml
+PARSE_ERRORS = (ValueError,) if yaml is None else (ValueError, yaml.YAMLError)
+
+
+def _loader_name() -> str:
+    if yaml is None:
+        return "minimal"
+    return "CSafeLoader" if hasattr(yaml, "CSafeLoader") else "SafeLoader"
+
+
+# Loader used by load_manifest: "CSafeLoader", "SafeLoader" or "minimal"
+LOADER = _loader_name()
+
+
+def parse_manifest(text: str, loader: str = LOADER) -> dict:
+    """Parse squad.yaml content with the given loader."""
+    if loader == "minimal":
+        return parse_minimal(text)
+    return yaml.load(text, Loader=getattr(yaml, loader)) or {}
+
+
+def load_manifest(path: Union[str, Path]) -> dict:
+    """Parsed squad.yaml (a fresh copy), cached by path, mtime and size."""
+    st = os.stat(path)
+    return copy.deepcopy(_cached_manifest(str(path), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _cached_manifest(path: str, mtime_ns: int, size: int) -> dict:
+    return parse_manifest(Path(path).read_text(encoding="utf-8"))
+
+
+def parse_minimal(text: str) -> dict:
+    """Minimal YAML parser for squad.yaml (flat keys + simple lists)."""
+    result = {}
+    current_key = None
+    current_list = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith("- "):
+            if current_list is not None:
+                current_list.append(stripped[2:].strip().strip('"').strip("'"))
+            continue
+        if ":" in stripped:
+            key, _, val = stripped.partition(":")
+            key = key.strip()
+            val = val.strip().strip('"').strip("'")
+            if val:
+                # Navigate nested keys
+                indent = len(line) - len(line.lstrip())
+                if indent == 0:
+                    result[key] = val
+                    current_key = key
+                    current_list = None
+                else:
+                    if current_key and isinstance(result.get(current_key), dict):
+                        result[current_key][key] = val
+                    else:
+                        result[key] = val
+                    current_list = None
+            else:
+                indent = len(line) - len(line.lstrip())
+                if indent == 0:
+                    result[key] = {}
+                    current_key = key
+                    current_list = None
+                else:
+                    # This is a nested key that might contain a list
+                    if current_key and isinstance(result.get(current_key), dict):
+                        result[current_key][key] = []
+                        current_list = result[current_key][key]
+                    else:
+                        result[key] = []
+                        current_list = result[key]
+    return result
+
+
+def _time_per_load(load: Callable[[], object], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        load()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def benchmark(paths: list, rounds: int = 200) -> Dict[str, Optional[float]]:
+    """Microseconds per manifest for each loading path (None if unavailable)."""
+    texts = [Path(p).read_text(encoding="utf-8") for p in paths]
+    per_manifest = max(len(paths), 1)
+
+    results: Dict[str, Optional[float]] = {}
+    for loader in ("CSafeLoader", "SafeLoader", "minimal"):
+        if loader != "minimal" and (yaml is None or not hasattr(yaml, loader)):
+            results[loader] = None
+            continue
+        results[loader] = _time_per_load(
+            lambda: [parse_manifest(text, loader) for text in texts], rounds) / per_manifest
+
+    load_all = lambda: [load_manifest(p) for p in paths]  # noqa: E731
+    load_all()  # Warm the cache
+    results["cached"] = _time_per_load(load_all, rounds) / per_manifest
+    return results
+
+
+def main():
+    if "--benchmark" not in sys.argv:
+        print(__doc__)
+        return 0
+
+    idx = sys.argv.index("--benchmark")
+    rounds = int(sys.argv[idx + 1]) if idx + 1 < len(sys.argv) else 200
+
+    root = Path(__file__).resolve().parent.parent.parent
+    paths = sorted((root / "squads").glob("*/squad.yaml")) + \
+        sorted((root / "squads" / ".templates").glob("*/squad.yaml"))
+    if not paths:
+        print("No squad.yaml found under squads/")
+        return 1
+
+    print(f"Squad manifest loading: {len(paths)} manifest(s), {rounds} round(s), active loader: {LOADER}")
+    results = benchmark(paths, rounds)
+    baseline = results.get("SafeLoader")
+    for name, micros in results.items():
+        if micros is None:
+            print(f"  {name:<12} unavailable")
+        elif baseline:
+            print(f"  {name:<12} {micros:9.1f} us/manifest  ({baseline / micros:5.1f}x vs SafeLoader)")
+        else:
+            print(f"  {name:<12} {micros:9.1f} us/manifest")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Audit Suite - Inove AI Framework
+================================
+
+Runs every skill auditor (UX, mobile, accessibility, SEO, GEO, i18n,
+React performance, security) over a project in a single pass: the tree
+is walked once and each file is read once, shared by all auditors
+through the scan engine.
+
+Usage:
+    python .agents/scripts/audit_suite.py .
+    python .agents/scripts/audit_suite.py . --only ux_audit,security_scan
+    python .agents/scripts/audit_suite.py . --list
+    python .agents/scripts/audit_suite.py . --incremental       # Reuse findings of unchanged files
+    python .agents/scripts/audit_suite.py . --since origin/main # Re-scan only files changed since a ref
+
+Output: JSON with one report per auditor; exits 1 if any audit failed.
+"""
+
+import sys
+import json
+import argparse
+import importlib.util
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from _scan_engine import ScanEngine, AuditIndex
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent / "skills"
+
+# Skill script -> factory returning {report name: auditor}
+SUITE = {
+    "ux_audit": ("frontend-design/scripts/ux_audit.py",
+                 lambda m, root: {"ux_audit": m.UXAuditor()}),
+    "accessibility_checker": ("frontend-design/scripts/accessibility_checker.py",
+                              lambda m, root: {"accessibility_checker": m.AccessibilityAuditor(root)}),
+    "mobile_audit": ("mobile-design/scripts/mobile_audit.py",
+                     lambda m, root: {"mobile_audit": m.MobileAuditor()}),
+    "seo_checker": ("seo-fundamentals/scripts/seo_checker.py",
+                    lambda m, root: {"seo_checker": m.SEOAuditor(root)}),
+    "geo_checker": ("geo-fundamentals/scripts/geo_checker.py",
+                    lambda m, root: {"geo_checker": m.GEOAuditor(root)}),
+    "i18n_checker": ("i18n-localization/scripts/i18n_checker.py",
+                     lambda m, root: {"i18n_locales": m.LocaleFileAuditor(root),
+                                      "i18n_strings": m.HardcodedStringAuditor()}),
+    "react_performance_checker": ("nextjs-react-expert/scripts/react_performance_checker.py",
+                                  lambda m, root: {"react_performance": m.PerformanceChecker(root)}),
+    "security_scan": ("vulnerability-scanner/scripts/security_scan.py",
+                      lambda m, root: {f"security_{key}": scanner
+                                       for key, scanner in m.file_scanners(str(root)).items()}),
+}
+
+
+def load_skill_script(rel_path: str):
+    """Import a skill script as a module without running its main()."""
+    path = SKILLS_DIR / rel_path
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def report_passed(report: dict) -> bool:
+    """Apply each script's own pass criterion to its report."""
+    if isinstance(report.get("passed"), bool):
+        return report["passed"]
+    if "compliant" in report:
+        return bool(report["compliant"])
+    if "status" in report:  # security_scan
+        return not str(report["status"]).startswith("[!!]")
+    if isinstance(report.get("issues"), list):  # i18n_checker
+        return not any(str(i).startswith("[X]") for i in report["issues"])
+    return True
+
+
+def run_suite(project_path: Path, names, index: AuditIndex = None) -> dict:
+    """Register the selected auditors on one engine and collect their reports."""
+    auditors = {}
+    for name in names:
+        rel_path, factory = SUITE[name]
+        auditors.update(factory(load_skill_script(rel_path), project_path))
+
+    engine = ScanEngine(project_path, auditors.values(), index=index)
+    engine.run()
+
+    reports = {name: auditor.report() for name, auditor in auditors.items()}
+    failed = [name for name, report in reports.items() if not report_passed(report)]
+    result = {
+        "project": str(project_path),
+        "files_scanned": engine.files_scanned,
+        "reports": reports,
+        "failed": failed,
+        "passed": not failed,
+    }
+    if index is not None:
+        result["incremental"] = index.summary()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run all skill auditors in a single pass")
+    parser.add_argument("project", nargs="?", default=".", help="Project path to audit")
+    parser.add_argument("--only", help="Comma-separated auditors to run (default: all)")
+    parser.add_argument("--list", action="store_true", help="List available auditors")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only re-scan files changed since the last run")
+    parser.add_argument("--since", metavar="REF",
+                        help="Always re-scan files changed since a git ref (implies --incremental)")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (rel_path, _) in SUITE.items():
+            print(f"{name:28} {rel_path}")
+        sys.exit(0)
+
+    project_path = Path(args.project)
+    if not project_path.is_dir():
+        print(json.dumps({"error": f"Directory not found: {args.project}"}))
+        sys.exit(1)
+
+    names = [n.strip() for n in args.only.split(",")] if args.only else list(SUITE)
+    unknown = [n for n in names if n not in SUITE]
+    if unknown:
+        print(json.dumps({"error": f"Unknown auditor(s): {', '.join(unknown)}"}))
+        sys.exit(1)
+
+    index = AuditIndex(project_path, since=args.since) if args.incremental or args.since else None
+    result = run_suite(project_path, names, index=index)
+    print(json.dumps(result, indent=2, default=str))
+    sys.exit(0 if result["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()
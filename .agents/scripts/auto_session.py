@@ -17,7 +17,7 @@ from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
-from platform_compat import get_agent_source, find_logs_dir, ensure_docs_structure
+from platform_compat import get_agent_source, find_logs_dir, ensure_docs_structure, iter_log_entries
 
 SESSION_PATHS = [
     Path(".agents/.session_state.json"),
@@ -75,6 +75,21 @@ def _agent_badge(agent: str) -> str:
     return f"\U0001f535 {agent}"
 
 
+# Match both completed and in-progress sessions
+# Completed: 1. 14:30 -- 15:45 (01:15) [badge]
+# In progress: 2. 16:00 -- *(em andamento)* [badge]
+ENTRY_PATTERN = re.compile(
+    r'^(\d+)\.\s+'
+    '(\\d{1,2}:\\d{2})\\s+\u2014\\s+'
+    r'(?:(\d{1,2}:\d{2})\s+\((\d{2}:\d{2})\)|'
+    r'\*\(em andamento\)\*)'
+    r'\s+\[(.+?)\]',
+    re.MULTILINE
+)
+# The activities of the last entry stop before "## Resumo do Dia"
+RESUMO_PATTERN = re.compile(r'^## Resumo do Dia', re.MULTILINE)
+
+
 def _parse_sessions(content: str) -> list:
     """
     Parses all session entries from the log content.
@@ -84,39 +99,13 @@ def _parse_sessions(content: str) -> list:
     """
     sessions = []
 
-    # Match both completed and in-progress sessions
-    # Completed: 1. 14:30 -- 15:45 (01:15) [badge]
-    # In progress: 2. 16:00 -- *(em andamento)* [badge]
-    entry_pattern = re.compile(
-        r'^(\d+)\.\s+'
-        '(\\d{1,2}:\\d{2})\\s+\u2014\\s+'
-        r'(?:(\d{1,2}:\d{2})\s+\((\d{2}:\d{2})\)|'
-        r'\*\(em andamento\)\*)'
-        r'\s+\[(.+?)\]',
-        re.MULTILINE
-    )
-
-    for match in entry_pattern.finditer(content):
+    for match, activities_block in iter_log_entries(content, ENTRY_PATTERN, RESUMO_PATTERN):
         number = int(match.group(1))
         start = match.group(2)
         end = match.group(3)  # None if in progress
         duration = match.group(4)  # None if in progress
         badge = match.group(5)
 
-        # Extract activities block following this entry
-        entry_end = match.end()
-        next_entry = entry_pattern.search(content, entry_end)
-        # Also stop before "## Resumo do Dia"
-        resumo_match = re.search(r'^## Resumo do Dia', content[entry_end:], re.MULTILINE)
-
-        if next_entry:
-            block_end = next_entry.start()
-        elif resumo_match:
-            block_end = entry_end + resumo_match.start()
-        else:
-            block_end = len(content)
-
-        activities_block = content[entry_end:block_end]
         activities = []
         for line in activities_block.split('\n'):
             stripped = line.strip()
@@ -280,14 +269,10 @@ def update_daily_log_end(session: dict):
 
     # Fetch progress tracking data
     try:
-        from progress_tracker import find_backlog, parse_backlog
-        backlog_path = find_backlog()
-        if backlog_path and backlog_path.exists():
-            backlog_content = backlog_path.read_text(encoding="utf-8")
-            epics = parse_backlog(backlog_content)
-            
-            total = sum(e.total for e in epics)
-            done = sum(e.done for e in epics)
+        from _backlog_index import load_backlog
+        index = load_backlog()
+        if index is not None:
+            done, total = index.progress()
             percent = (done / total * 100) if total > 0 else 0
             
             # Inject Burn-down into the Resumo do Dia
@@ -310,6 +295,16 @@ def update_daily_log_end(session: dict):
 
     log_file.write_text(content, encoding='utf-8')
 
+    # Grava as sessoes do dia no store colunar (consultas de metrics/dashboard)
+    try:
+        from _session_store import open_store
+        store = open_store(logs_dir)
+        if store is not None:
+            with store:
+                store.ingest(log_file)
+    except Exception as e:
+        print(f"Nota: Não foi possível atualizar o store de sessões: {e}")
+
 
 def start_session(agent_override: str = None, bootstrap: bool = True) -> bool:
     """Inicia nova sessao."""
@@ -9,6 +9,8 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --jobs 1           # Run checks sequentially
+    python scripts/checklist.py . --no-cache         # Ignore cached results
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -27,9 +29,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 from _check_runner import (
     print_header, print_error, print_warning,
-    run_script_check, run_check, print_summary
+    check_spec, script_check_spec, run_checks_parallel,
+    first_required_failure, print_summary, ResultCache, CACHE_FILE,
+    FRAMEWORK_INPUTS, TRACEABILITY_INPUTS, WEB_SOURCE_INPUTS, DEFAULT_JOBS
 )
-from recovery import with_retry
 
 # Core checks (Python scripts relative to project root)
 CORE_CHECKS = [
@@ -44,6 +47,17 @@ WEB_CHECKS = [
     ("Build Check", ["npm", "run", "build"], False),
 ]
 
+# Per-check scheduling options (keyed by check name)
+CHECK_OPTIONS = {
+    # Core checks are timeout-prone: retry once with backoff
+    "Framework Validation": {"attempts": 2, "inputs": FRAMEWORK_INPUTS},
+    "Traceability Check": {"attempts": 2, "inputs": TRACEABILITY_INPUTS},
+    "TypeScript Check": {"inputs": WEB_SOURCE_INPUTS},
+    "Lint Check": {"inputs": WEB_SOURCE_INPUTS},
+    # The build re-runs the type checker, pointless if types already fail
+    "Build Check": {"depends_on": ["TypeScript Check"], "inputs": WEB_SOURCE_INPUTS},
+}
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -58,6 +72,10 @@ Examples:
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS,
+                        help=f"Maximum checks running concurrently (default: {DEFAULT_JOBS})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-run every check even if its inputs are unchanged")
 
     args = parser.parse_args()
 
@@ -71,39 +89,30 @@ Examples:
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
 
-    results = []
-
-    # Run core checks (Python scripts) with retry for timeout-prone checks
-    print_header("CORE CHECKS")
+    specs = []
     for name, script_rel, required in CORE_CHECKS:
-        script = project_path / script_rel
-
-        @with_retry(max_attempts=2, backoff=2, exceptions=(Exception,))
-        def _run_check(n=name, s=script):
-            return run_script_check(n, s, str(project_path))
+        specs.append(script_check_spec(name, project_path / script_rel, str(project_path),
+                                       required=required, **CHECK_OPTIONS.get(name, {})))
 
-        result = _run_check()
-        results.append(result)
-
-        if required and not result["passed"] and not result.get("skipped"):
-            print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_header("CHECKLIST SUMMARY")
-            print_summary(results)
-            sys.exit(1)
-
-    # Run web checks if web/ directory exists
+    # Web checks run if web/ directory exists
     web_dir = project_path / "web"
     if web_dir.exists() and (web_dir / "package.json").exists():
-        print_header("WEB CHECKS")
         for name, cmd, required in WEB_CHECKS:
-            result = run_check(name, cmd, str(web_dir))
-            results.append(result)
-
-            if required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-                print_header("CHECKLIST SUMMARY")
-                print_summary(results)
-                sys.exit(1)
+            specs.append(check_spec(name, cmd, str(web_dir), required=required,
+                                    **CHECK_OPTIONS.get(name, {})))
+
+    # Independent checks run concurrently; a failing required check
+    # cancels in-flight siblings and stops the checklist
+    print_header(f"RUNNING {len(specs)} CHECKS ({args.jobs} parallel)")
+    cache = None if args.no_cache else ResultCache(project_path / CACHE_FILE)
+    results = run_checks_parallel(specs, jobs=args.jobs, stop_on_fail=True, cache=cache)
+
+    critical = first_required_failure(specs, results)
+    if critical:
+        print_error(f"CRITICAL: {critical} failed. Stopping checklist.")
+        print_header("CHECKLIST SUMMARY")
+        print_summary(results)
+        sys.exit(1)
 
     # Print summary
     print_header("CHECKLIST SUMMARY")
@@ -5,10 +5,20 @@ Combina progresso, sessões e métricas em uma única visualização.
 
 Uso:
     python3 .agents/scripts/dashboard.py
+    python3 .agents/scripts/dashboard.py --watch   # Atualiza no terminal
+
+As seções (progresso, sessão, semana, sync) são carregadas em paralelo e
+cacheadas por chave de invalidação (mtime do backlog, do estado de sessão,
+dos logs e locks, HEAD do git); no --watch só as seções cujas entradas
+mudaram são recarregadas e re-renderizadas.
 """
 
+import os
 import sys
 import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -17,8 +27,12 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent))
 import progress_tracker
 import auto_session
-from lock_manager import LockManager
+from lock_manager import LockManager, STATS_FILE
 from platform_compat import find_logs_dir, get_logs_in_range, get_last_activity_by_agent, ensure_docs_structure
+from _git_queries import head_state
+
+# Intervalo de verificação do modo --watch (segundos)
+WATCH_INTERVAL = 2.0
 
 
 def format_duration(minutes: int) -> str:
@@ -165,6 +179,11 @@ def load_sync_status() -> dict:
     }
 
 
+def load_lock_stats() -> dict:
+    """Carrega a contenção de locks dos últimos 7 dias (lock_manager.py stats)."""
+    return LockManager().stats(days_back=7)
+
+
 def format_next_tasks(tasks: list) -> str:
     """Formata lista de próximas tarefas."""
     if not tasks:
@@ -173,27 +192,94 @@ def format_next_tasks(tasks: list) -> str:
     return "\n".join([f"{i+1}. {task}" for i, task in enumerate(tasks)])
 
 
-def generate_dashboard() -> str:
-    """Gera dashboard consolidado."""
-
-    # 0. Detect docs structure (never creates — detect only)
-    bootstrap = ensure_docs_structure(create_if_missing=False)
-    if bootstrap["missing"]:
-        for m in bootstrap["missing"]:
-            print(f"   Aviso: {m} ausente. Use 'auto_session.py start' para criar baseline.")
-
-    # 1. Carregar dados
-    progress = load_progress()
-    session = load_current_session()
-    weekly = load_weekly_stats()
-    sync = load_sync_status()
+def _stat_key(*paths) -> tuple:
+    """(mtime_ns, size) de cada path, ou None se ausente."""
+    key = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            key.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            key.append((str(path), None))
+    return tuple(key)
 
-    now = datetime.now().strftime('%Y-%m-%d %H:%M')
 
-    # 2. Construir output
-    lines = [
-        f"# 📊 Dashboard - {now}",
-        "",
+def _logs_key() -> tuple:
+    """Logs dos últimos 7 dias (um stat por dia, sem listar diretórios)."""
+    logs_dir = find_logs_dir()
+    if not logs_dir:
+        return ()
+    today = datetime.now()
+    days = [(today - timedelta(days=n)).strftime("%Y-%m-%d") for n in range(8)]
+    return (str(logs_dir),) + _stat_key(
+        *(logs_dir / day[:4] / f"{day}.md" for day in days)
+    )
+
+
+def _locks_key() -> tuple:
+    # Locks exclusivos (*.lock) e compartilhados (*.shared/*.json), em qualquer nível
+    locks = []
+    for dirpath, dirnames, filenames in os.walk(".agents/locks"):
+        shared = dirpath.endswith(".shared")
+        locks.extend(Path(dirpath) / name for name in filenames
+                     if name.endswith(".lock") or (shared and name.endswith(".json")))
+        dirnames[:] = [name for name in dirnames if not name.endswith(".queue")]
+    return _stat_key(*sorted(locks))
+
+
+def _minute_key() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
+
+
+def _sync_key() -> tuple:
+    locks = _locks_key()
+    # Com locks ativos, o tempo bloqueado exibido muda a cada minuto
+    return (_logs_key(), locks, _minute_key() if locks else None)
+
+
+# Seção -> (loader, chave de invalidação). Loaders só rodam quando a chave muda.
+SECTIONS = {
+    "bootstrap": (lambda: ensure_docs_structure(create_if_missing=False),
+                  lambda: (tuple(head_state().values()), _stat_key(progress_tracker.find_backlog() or "docs/BACKLOG.md",
+                                                      "docs/PROJECT_STATUS.md"))),
+    "progress": (load_progress,
+                 lambda: _stat_key(progress_tracker.find_backlog() or "docs/BACKLOG.md")),
+    "session": (load_current_session,
+                lambda: (_stat_key(*auto_session.SESSION_PATHS), _minute_key())),
+    "weekly": (load_weekly_stats, _logs_key),
+    "sync": (load_sync_status, _sync_key),
+    "locks": (load_lock_stats,
+              lambda: (_stat_key(f".agents/locks/{STATS_FILE}", f".agents/locks/{STATS_FILE}.1"),
+                       datetime.now().strftime("%Y-%m-%d"))),
+}
+
+
+class DashboardData:
+    """Seções do dashboard, carregadas em paralelo e cacheadas por chave de invalidação."""
+
+    def __init__(self):
+        self._cache = {}  # seção -> (chave, dados)
+
+    def refresh(self) -> set:
+        """Recarrega as seções cujas entradas mudaram; retorna seus nomes."""
+        keys = {name: key_fn() for name, (_, key_fn) in SECTIONS.items()}
+        stale = [name for name, key in keys.items()
+                 if name not in self._cache or self._cache[name][0] != key]
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+                loaded = list(pool.map(lambda name: SECTIONS[name][0](), stale))
+            for name, data in zip(stale, loaded):
+                self._cache[name] = (keys[name], data)
+
+        return set(stale)
+
+    def __getitem__(self, name: str):
+        return self._cache[name][1]
+
+
+def render_progress(progress: dict) -> list:
+    return [
         "## 🎯 Progresso do Projeto",
         "",
         f"{progress['bar']} {progress['percent']:.1f}%",
@@ -201,11 +287,12 @@ def generate_dashboard() -> str:
         "",
     ]
 
-    # Sessão atual
-    lines.extend([
+
+def render_session(session: Optional[dict]) -> list:
+    lines = [
         "## ⏱️ Sessão Atual",
         "",
-    ])
+    ]
 
     if session:
         agent_emoji = "🤖" if session['agent'] == "antigravity" else "🔵"
@@ -219,80 +306,189 @@ def generate_dashboard() -> str:
         lines.append("   💡 Use: python3 .agents/scripts/auto_session.py start")
 
     lines.extend(["", ""])
+    return lines
 
-    # Estatísticas da semana
-    lines.extend([
+
+def render_weekly(weekly: dict) -> list:
+    return [
         "## 📅 Esta Semana (últimos 7 dias)",
         "",
         f"- Tempo total: {weekly['total_time']}",
         f"- Sessões: {weekly['sessions']}",
         f"- Média/dia: {weekly['avg_per_day']}",
         "",
-    ])
+    ]
+
 
+def render_sync(sync: dict) -> list:
     # Sync Status (se houver múltiplos agentes)
-    if sync.get('agents') and len(sync['agents']) > 1:
-        lines.extend([
-            "## 🔄 Sync Status (Dual-Agent)",
-            "",
-            "| Agente | Última Atividade | Tempo (7 dias) | Sessões |",
-            "|--------|------------------|----------------|---------|",
-        ])
+    if not sync.get('agents') or len(sync['agents']) <= 1:
+        return []
+
+    lines = [
+        "## 🔄 Sync Status (Dual-Agent)",
+        "",
+        "| Agente | Última Atividade | Tempo (7 dias) | Sessões |",
+        "|--------|------------------|----------------|---------|",
+    ]
 
-        for agent_name, stats in sync['agents'].items():
-            agent_emoji = "🤖" if agent_name == "antigravity" else "🔵"
-            last_session = stats['last_session']
-            last_activity = stats['last_activity'][:50] + "..." if len(stats['last_activity']) > 50 else stats['last_activity']
-            time_str = format_duration(stats['total_time_week'])
-
-            lines.append(
-                f"| {agent_emoji} {agent_name} | "
-                f"{last_session.date} {last_session.start}<br/>*{last_activity}* | "
-                f"{time_str} | "
-                f"{stats['sessions_count']} |"
-            )
-
-        lines.extend(["", ""])
-
-        # Conflitos
-        if sync.get('conflicts'):
-            lines.extend([
-                "**Conflitos Detectados:**",
-                ""
-            ])
-            for conflict in sync['conflicts']:
-                lines.append(f"- {conflict}")
-        else:
-            lines.append("**Conflitos:** Nenhum ✅")
-
-        lines.extend(["", ""])
-
-    # Próximas tarefas
-    if progress['next_tasks']:
+    for agent_name, stats in sync['agents'].items():
+        agent_emoji = "🤖" if agent_name == "antigravity" else "🔵"
+        last_session = stats['last_session']
+        last_activity = stats['last_activity'][:50] + "..." if len(stats['last_activity']) > 50 else stats['last_activity']
+        time_str = format_duration(stats['total_time_week'])
+
+        lines.append(
+            f"| {agent_emoji} {agent_name} | "
+            f"{last_session.date} {last_session.start}<br/>*{last_activity}* | "
+            f"{time_str} | "
+            f"{stats['sessions_count']} |"
+        )
+
+    lines.extend(["", ""])
+
+    # Conflitos
+    if sync.get('conflicts'):
         lines.extend([
-            "## 🔥 Próximas Tarefas",
-            "",
-            format_next_tasks(progress['next_tasks']),
-            "",
+            "**Conflitos Detectados:**",
+            ""
         ])
+        for conflict in sync['conflicts']:
+            lines.append(f"- {conflict}")
+    else:
+        lines.append("**Conflitos:** Nenhum ✅")
+
+    lines.extend(["", ""])
+    return lines
+
+
+def render_lock_stats(stats: dict) -> list:
+    # Só aparece quando algum recurso teve espera, falha ou lease vencido
+    hot = [(resource, info) for resource, info in stats.get('resources', {}).items()
+           if info['contended'] or info['stale']][:5]
+    if not hot:
+        return []
+
+    lines = [
+        "## 🔐 Contenção de Locks (7 dias)",
+        "",
+        "| Recurso | Aquisições | Com espera | Falhas | Espera p95 | Posse máx | Leases vencidos |",
+        "|---------|------------|------------|--------|------------|-----------|-----------------|",
+    ]
+    for resource, info in hot:
+        wait, hold = info['wait_ms'], info['hold_ms']
+        p95 = f"{wait['p95']:.0f} ms" if wait['count'] else "-"
+        hold_max = f"{hold['max'] / 1000:.1f} s" if hold['count'] else "-"
+        lines.append(
+            f"| {resource} | {info['acquires']} | {info['contended']} | {info['failures']} | "
+            f"{p95} | {hold_max} | {info['stale']} |"
+        )
+
+    lines.extend(["", ""])
+    return lines
 
-    # Rodapé
-    lines.extend([
-        "---",
+
+def render_next_tasks(progress: dict) -> list:
+    if not progress['next_tasks']:
+        return []
+    return [
+        "## 🔥 Próximas Tarefas",
+        "",
+        format_next_tasks(progress['next_tasks']),
         "",
-        "**Comandos disponíveis:**",
-        "- `python3 .agents/scripts/auto_session.py start` - Iniciar sessão",
-        "- `python3 .agents/scripts/auto_session.py end` - Encerrar sessão",
-        "- `python3 .agents/scripts/finish_task.py <id>` - Marcar tarefa como concluída",
-        "- `python3 .agents/scripts/progress_tracker.py` - Atualizar progresso",
-        "- `python3 .agents/scripts/lock_manager.py list` - Ver locks ativos",
-    ])
+    ]
 
-    return "\n".join(lines)
+
+# Ordem das seções renderizadas: (seção de dados, renderer)
+LAYOUT = [
+    ("progress", render_progress),
+    ("session", render_session),
+    ("weekly", render_weekly),
+    ("sync", render_sync),
+    ("locks", render_lock_stats),
+    ("progress", render_next_tasks),
+]
+
+FOOTER = [
+    "---",
+    "",
+    "**Comandos disponíveis:**",
+    "- `python3 .agents/scripts/auto_session.py start` - Iniciar sessão",
+    "- `python3 .agents/scripts/auto_session.py end` - Encerrar sessão",
+    "- `python3 .agents/scripts/finish_task.py <id>` - Marcar tarefa como concluída",
+    "- `python3 .agents/scripts/progress_tracker.py` - Atualizar progresso",
+    "- `python3 .agents/scripts/lock_manager.py list` - Ver locks ativos",
+    "- `python3 .agents/scripts/lock_manager.py stats` - Ver contenção de locks",
+]
+
+
+class DashboardRenderer:
+    """Mantém o texto de cada seção; só re-renderiza as seções alteradas."""
+
+    def __init__(self, data: DashboardData):
+        self.data = data
+        self._rendered = {}  # posição no LAYOUT -> linhas
+
+    def render(self, changed: set) -> str:
+        # 0. Detect docs structure (never creates — detect only)
+        if "bootstrap" in changed:
+            for m in self.data["bootstrap"]["missing"]:
+                print(f"   Aviso: {m} ausente. Use 'auto_session.py start' para criar baseline.")
+
+        for pos, (name, renderer) in enumerate(LAYOUT):
+            if name in changed or pos not in self._rendered:
+                self._rendered[pos] = renderer(self.data[name])
+
+        now = datetime.now().strftime('%Y-%m-%d %H:%M')
+        lines = [f"# 📊 Dashboard - {now}", ""]
+        for pos in range(len(LAYOUT)):
+            lines.extend(self._rendered[pos])
+        lines.extend(FOOTER)
+        return "\n".join(lines)
+
+
+def generate_dashboard() -> str:
+    """Gera dashboard consolidado."""
+    data = DashboardData()
+    return DashboardRenderer(data).render(data.refresh())
+
+
+def watch(interval: float = WATCH_INTERVAL):
+    """
+    Mantém o dashboard no terminal. A cada intervalo só as chaves de
+    invalidação são verificadas (alguns stats); seções são recarregadas e
+    re-renderizadas apenas quando suas entradas mudam.
+    """
+    data = DashboardData()
+    renderer = DashboardRenderer(data)
+    shown = None
+
+    while True:
+        changed = data.refresh()
+        minute = _minute_key()
+        if changed or minute != shown:
+            output = renderer.render(changed)
+            print("\033[2J\033[H" + output, flush=True)
+            shown = minute
+        time.sleep(interval)
 
 
 def main():
     """Executa o dashboard."""
+    parser = argparse.ArgumentParser(description="Dashboard unificado do projeto")
+    parser.add_argument("--watch", action="store_true",
+                        help="Mantém o dashboard aberto, atualizando só as seções alteradas")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL,
+                        help=f"Intervalo de verificação do --watch em segundos (padrão: {WATCH_INTERVAL:g})")
+    args = parser.parse_args()
+
+    if args.watch:
+        try:
+            watch(args.interval)
+        except KeyboardInterrupt:
+            pass
+        return
+
     try:
         output = generate_dashboard()
         print(output)
@@ -23,6 +23,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 from lock_manager import LockManager
 from platform_compat import get_agent_source, find_backlog, find_story_file, parse_story_frontmatter
+from _backlog_index import index_content
 from shard_epic import update_story_status, inject_dependency_context, extract_agent_workspace
 
 
@@ -41,16 +42,11 @@ def check_epic_ownership(content: str, task_id: str, agent_source: str, force: b
 
     epic_num = epic_num_match.group(1)
 
-    epic_pattern = re.compile(
-        rf"^##\s+Epic\s+{epic_num}:\s+(.+?)\s*(?:\[OWNER:\s*(.+?)\])?\s*(?:[✅🔴⏳].*)?$",
-        re.MULTILINE,
-    )
-
-    epic_match = epic_pattern.search(content)
-    if not epic_match:
+    epic = index_content(content).epic(int(epic_num))
+    if not epic:
         return True, ""
 
-    epic_owner = epic_match.group(2).strip() if epic_match.group(2) else None
+    epic_owner = epic["owner"]
 
     if not epic_owner:
         return True, ""
@@ -5,16 +5,34 @@ Web Data Generator - Inove AI Framework
 Reads .agents/ markdown files (agents, skills, workflows) and generates
 JSON data files for the web site to consume.
 
+Only the frontmatter of each file is read. Parsed entries are kept in a
+manifest (.agents/.cache/web_manifest.json) keyed by source file, with its
+mtime, size and header hash: a rebuild only re-reads files whose stat
+changed and only re-parses those whose header did. Output JSON is replaced atomically and left untouched when unchanged.
+
 Usage:
     python3 .agents/scripts/generate_web_data.py
     python3 .agents/scripts/generate_web_data.py --out web/src/data
+    python3 .agents/scripts/generate_web_data.py --watch   # rebuild on change
 """
 
+import os
+import sys
 import json
 import re
+import time
+import hashlib
 import argparse
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from _frontmatter import read_frontmatter
+
+# Parse manifest (relative to project root) and its format version
+MANIFEST_FILE = Path(".agents/.cache/web_manifest.json")
+MANIFEST_VERSION = 2
+WATCH_INTERVAL = 1.0
 
 
 def parse_frontmatter(content: str) -> Dict[str, str]:
@@ -31,105 +49,190 @@ def parse_frontmatter(content: str) -> Dict[str, str]:
     return frontmatter
 
 
-def parse_agents(agents_dir: Path) -> List[Dict[str, Any]]:
+class Manifest:
+    """Parsed entry per source file, revalidated by stat and then by header hash."""
+
+    def __init__(self, root: Path, path: Optional[Path] = None):
+        self.root = root
+        self.path = path
+        self.files: Dict[str, dict] = {}
+        self.seen = set()
+        self.parsed = 0
+        self.dirty = False
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                self.files = data.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    def entry(self, source: Path, parse: Callable[[Path, str], Optional[dict]]) -> Optional[dict]:
+        """Entry of one source file: cached, or parse(source, header) when it changed."""
+        try:
+            key = source.relative_to(self.root).as_posix()
+        except ValueError:
+            key = str(source)
+        self.seen.add(key)
+
+        st = source.stat()
+        cached = self.files.get(key)
+        if cached and (cached["mtime_ns"], cached["size"]) == (st.st_mtime_ns, st.st_size):
+            return cached["entry"]
+
+        content = read_frontmatter(source, st) or ""
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        if cached and cached["hash"] == digest:
+            entry = cached["entry"]  # Header unchanged
+        else:
+            entry = parse(source, content)
+            self.parsed += 1
+
+        self.files[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size,
+                           "hash": digest, "entry": entry}
+        self.dirty = True
+        return entry
+
+    def save(self):
+        """Drop files not seen in this build and persist, if anything changed."""
+        gone = set(self.files) - self.seen
+        for key in gone:
+            del self.files[key]
+        if self.path is None or not (self.dirty or gone):
+            return
+        try:
+            write_json_atomic(self.path, {"version": MANIFEST_VERSION, "files": self.files}, indent=None)
+        except OSError as e:
+            print(f"[!] Could not write web manifest: {e}", file=sys.stderr)
+
+
+def write_json_atomic(out_file: Path, data, indent: Optional[int] = 2) -> bool:
+    """
+    Write JSON through a temporary file and os.replace, so readers never see
+    a partial file. Returns False (and leaves the file alone) when unchanged.
+    """
+    text = json.dumps(data, indent=indent, ensure_ascii=False)
+    try:
+        if out_file.read_text(encoding='utf-8') == text:
+            return False
+    except OSError:
+        pass
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_file.with_name(f".{out_file.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, out_file)
+    return True
+
+
+def _agent_entry(md_file: Path, content: str) -> Optional[Dict[str, Any]]:
+    fm = parse_frontmatter(content)
+    if not fm:
+        return None
+
+    name = fm.get("name", md_file.stem)
+    skills_str = fm.get("skills", "")
+    tools_str = fm.get("tools", "")
+
+    return {
+        "name": name,
+        "description": fm.get("description", ""),
+        "tools": [t.strip() for t in tools_str.split(",") if t.strip()],
+        "skills": [s.strip() for s in skills_str.split(",") if s.strip()],
+        "file": f".agents/agents/{md_file.name}",
+    }
+
+
+def parse_agents(agents_dir: Path, manifest: Optional[Manifest] = None) -> List[Dict[str, Any]]:
     """Parse all agent markdown files."""
+    manifest = manifest or Manifest(agents_dir)
     agents = []
     for md_file in sorted(agents_dir.glob("*.md")):
-        content = md_file.read_text(encoding='utf-8')
-        fm = parse_frontmatter(content)
-        if not fm:
-            continue
-
-        name = fm.get("name", md_file.stem)
-        skills_str = fm.get("skills", "")
-        tools_str = fm.get("tools", "")
-
-        agents.append({
-            "name": name,
-            "description": fm.get("description", ""),
-            "tools": [t.strip() for t in tools_str.split(",") if t.strip()],
-            "skills": [s.strip() for s in skills_str.split(",") if s.strip()],
-            "file": f".agents/agents/{md_file.name}",
-        })
+        agent = manifest.entry(md_file, _agent_entry)
+        if agent:
+            agents.append(agent)
 
     return agents
 
 
-def parse_skills(skills_dir: Path) -> List[Dict[str, Any]]:
-    """Parse all skill SKILL.md files."""
-    skills = []
-    for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-        content = skill_md.read_text(encoding='utf-8')
-        fm = parse_frontmatter(content)
-        if not fm:
-            continue
+def _skill_entry(skill_md: Path, content: str) -> Optional[Dict[str, Any]]:
+    fm = parse_frontmatter(content)
+    if not fm:
+        return None
+
+    name = fm.get("name", skill_md.parent.name)
+    tools_str = fm.get("allowed-tools", fm.get("tools", ""))
 
-        name = fm.get("name", skill_md.parent.name)
-        tools_str = fm.get("allowed-tools", fm.get("tools", ""))
+    skill_data = {
+        "name": name,
+        "description": fm.get("description", ""),
+        "tools": [t.strip() for t in tools_str.split(",") if t.strip()],
+        "file": f".agents/skills/{skill_md.parent.name}/SKILL.md",
+    }
 
-        skill_data = {
-            "name": name,
-            "description": fm.get("description", ""),
-            "tools": [t.strip() for t in tools_str.split(",") if t.strip()],
-            "file": f".agents/skills/{skill_md.parent.name}/SKILL.md",
-        }
+    if fm.get("version"):
+        skill_data["version"] = fm["version"]
+    if fm.get("priority"):
+        skill_data["priority"] = fm["priority"]
 
-        if fm.get("version"):
-            skill_data["version"] = fm["version"]
-        if fm.get("priority"):
-            skill_data["priority"] = fm["priority"]
+    return skill_data
 
-        skills.append(skill_data)
+
+def _sub_skill_entry(skill_md: Path, content: str) -> Optional[Dict[str, Any]]:
+    fm = parse_frontmatter(content)
+    if not fm:
+        return None
+
+    parent_name = skill_md.parent.parent.name
+    sub_name = skill_md.parent.name
+    name = fm.get("name", f"{parent_name}/{sub_name}")
+    tools_str = fm.get("allowed-tools", fm.get("tools", ""))
+
+    return {
+        "name": name,
+        "description": fm.get("description", ""),
+        "tools": [t.strip() for t in tools_str.split(",") if t.strip()],
+        "file": f".agents/skills/{parent_name}/{sub_name}/SKILL.md",
+        "parent": parent_name,
+    }
+
+
+def parse_skills(skills_dir: Path, manifest: Optional[Manifest] = None) -> List[Dict[str, Any]]:
+    """Parse all skill SKILL.md files."""
+    manifest = manifest or Manifest(skills_dir)
+    skills = []
+    for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
+        skill = manifest.entry(skill_md, _skill_entry)
+        if skill:
+            skills.append(skill)
 
     # Also check for sub-skills (e.g., game-development/2d-games/SKILL.md)
     for skill_md in sorted(skills_dir.glob("*/*/SKILL.md")):
-        content = skill_md.read_text(encoding='utf-8')
-        fm = parse_frontmatter(content)
-        if not fm:
-            continue
-
-        parent_name = skill_md.parent.parent.name
-        sub_name = skill_md.parent.name
-        name = fm.get("name", f"{parent_name}/{sub_name}")
-        tools_str = fm.get("allowed-tools", fm.get("tools", ""))
-
-        skills.append({
-            "name": name,
-            "description": fm.get("description", ""),
-            "tools": [t.strip() for t in tools_str.split(",") if t.strip()],
-            "file": f".agents/skills/{parent_name}/{sub_name}/SKILL.md",
-            "parent": parent_name,
-        })
+        skill = manifest.entry(skill_md, _sub_skill_entry)
+        if skill:
+            skills.append(skill)
 
     return skills
 
 
-def parse_workflows(workflows_dir: Path) -> List[Dict[str, Any]]:
-    """Parse all workflow markdown files."""
-    workflows = []
-    for md_file in sorted(workflows_dir.glob("*.md")):
-        content = md_file.read_text(encoding='utf-8')
-        fm = parse_frontmatter(content)
+def _workflow_entry(md_file: Path, content: str) -> Dict[str, Any]:
+    fm = parse_frontmatter(content)
 
-        name = md_file.stem
-        description = fm.get("description", "")
+    name = md_file.stem
+    description = fm.get("description", "")
 
-        # Extract usage example from content if present
-        usage = ""
-        usage_match = re.search(r'[Uu]sage[:\s]*\n\s*```\s*\n(.+?)\n\s*```', content)
-        if not usage_match:
-            usage_match = re.search(r'[Ee]xample[:\s]*\n\s*```\s*\n(.+?)\n\s*```', content)
-        if usage_match:
-            usage = usage_match.group(1).strip().split('\n')[0]
+    return {
+        "cmd": f"/{name}",
+        "name": name,
+        "description": description,
+        "file": f".agents/workflows/{md_file.name}",
+    }
 
-        workflows.append({
-            "cmd": f"/{name}",
-            "name": name,
-            "description": description,
-            "file": f".agents/workflows/{md_file.name}",
-        })
 
-    return workflows
+def parse_workflows(workflows_dir: Path, manifest: Optional[Manifest] = None) -> List[Dict[str, Any]]:
+    """Parse all workflow markdown files."""
+    manifest = manifest or Manifest(workflows_dir)
+    return [manifest.entry(md_file, _workflow_entry) for md_file in sorted(workflows_dir.glob("*.md"))]
 
 
 def generate_summary(agents: list, skills: list, workflows: list) -> Dict[str, Any]:
@@ -144,49 +247,89 @@ def generate_summary(agents: list, skills: list, workflows: list) -> Dict[str, A
     }
 
 
+def build(root: Path, out_dir: Path) -> Dict[str, Any]:
+    """
+    Rebuild the JSON files from the manifest. Returns counts, the files
+    rewritten and how many sources had to be parsed.
+    """
+    manifest = Manifest(root, root / MANIFEST_FILE)
+    agents = parse_agents(root / ".agents" / "agents", manifest)
+    skills = parse_skills(root / ".agents" / "skills", manifest)
+    workflows = parse_workflows(root / ".agents" / "workflows", manifest)
+    summary = generate_summary(agents, skills, workflows)
+    manifest.save()
+
+    written = []
+    for name, data in [
+        ("agents.json", agents),
+        ("skills.json", skills),
+        ("workflows.json", workflows),
+        ("summary.json", summary),
+    ]:
+        if write_json_atomic(out_dir / name, data):
+            written.append(name)
+
+    return {
+        "agents": len(agents),
+        "skills": len(skills),
+        "workflows": len(workflows),
+        "sources": len(manifest.seen),
+        "parsed": manifest.parsed,
+        "written": written,
+    }
+
+
+def watch(root: Path, out_dir: Path, interval: float = WATCH_INTERVAL):
+    """
+    Keep the JSON files in step with .agents/ for the web UI's dev server.
+    Each pass only stats the sources; files are rewritten only on change.
+    """
+    print(f"Watching .agents/ -> {out_dir.relative_to(root)}/ (Ctrl+C to stop)")
+    while True:
+        result = build(root, out_dir)
+        if result["written"]:
+            stamp = time.strftime("%H:%M:%S")
+            print(f"[{stamp}] Parsed {result['parsed']}/{result['sources']} sources, "
+                  f"updated {', '.join(result['written'])}", flush=True)
+        time.sleep(interval)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate web JSON data from .agents/ markdown files")
     parser.add_argument("--out", default="web/src/data/generated",
                         help="Output directory for JSON files (default: web/src/data/generated)")
     parser.add_argument("--root", default=".", help="Project root (default: current directory)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and regenerate when .agents/ sources change")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL,
+                        help=f"Polling interval for --watch in seconds (default: {WATCH_INTERVAL:g})")
 
     args = parser.parse_args()
     root = Path(args.root).resolve()
     out_dir = root / args.out
 
     agents_dir = root / ".agents" / "agents"
-    skills_dir = root / ".agents" / "skills"
-    workflows_dir = root / ".agents" / "workflows"
 
     if not agents_dir.exists():
         print(f"Error: agents directory not found at {agents_dir}")
         return 1
 
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    # Parse all sources
-    agents = parse_agents(agents_dir)
-    skills = parse_skills(skills_dir)
-    workflows = parse_workflows(workflows_dir)
-    summary = generate_summary(agents, skills, workflows)
+    if args.watch:
+        try:
+            watch(root, out_dir, args.interval)
+        except KeyboardInterrupt:
+            pass
+        return 0
 
-    # Write JSON files
-    files_written = []
-    for name, data in [
-        ("agents.json", agents),
-        ("skills.json", skills),
-        ("workflows.json", workflows),
-        ("summary.json", summary),
-    ]:
-        out_file = out_dir / name
-        with open(out_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        files_written.append(str(out_file.relative_to(root)))
+    result = build(root, out_dir)
+    files_written = [str((out_dir / name).relative_to(root))
+                     for name in ("agents.json", "skills.json", "workflows.json", "summary.json")]
 
     print(f"Generated {len(files_written)} JSON files in {out_dir.relative_to(root)}/")
-    print(f"  Agents: {len(agents)}")
-    print(f"  Skills: {len(skills)}")
-    print(f"  Workflows: {len(workflows)}")
+    print(f"  Agents: {result['agents']}")
+    print(f"  Skills: {result['skills']}")
+    print(f"  Workflows: {result['workflows']}")
+    print(f"  Parsed: {result['parsed']} of {result['sources']} source files")
     for f in files_written:
         print(f"  -> {f}")
 
@@ -13,19 +13,76 @@ Uso:
             ...
         finally:
             lock_mgr.release_lock("backlog", "antigravity")
+
+    # Bloqueia numa fila FIFO até o recurso ser liberado (sem polling)
+    if lock_mgr.wait_for_lock("stories", "antigravity", max_wait=30):
+        ...
+
+    # Recursos hierárquicos e locks compartilhados (leitura): dois agentes
+    # em épicos diferentes não se bloqueiam; leitores convivem entre si
+    lock_mgr.wait_for_lock("stories/epic-3", "claude_code")
+    lock_mgr.wait_for_lock("stories", "codex", mode=LOCK_SHARED)
+
+    # Operações longas: um heartbeat renova o lease até release_lock
+    if lock_mgr.wait_for_lock("stories", "antigravity", timeout=60):
+        lock_mgr.start_heartbeat("stories", "antigravity")
+
+Estatísticas de contenção (espera, posse, falhas e leases vencidos por
+recurso): `python3 .agents/scripts/lock_manager.py stats [--json] [--days N]`.
+Com LOCK_TRACE=1, cada evento também é impresso em stderr.
+
+O lease de um lock é o mtime do seu arquivo: ele aponta para o instante em
+que o lock expira. Saber se um lock está vivo custa um stat, sem abrir o
+arquivo, e renovar custa um os.utime.
 """
 
 import os
 import sys
+import re
 import json
 import time
-from datetime import datetime, timedelta
+import select
+import threading
+import contextlib
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 sys.path.insert(0, str(Path(__file__).parent))
 from platform_compat import get_agent_source as _platform_get_agent_source
 
+# Teto do sono de um waiter sem aviso (ex.: o primeiro da fila morreu)
+WAKE_RECHECK = 5.0
+
+# Modos de lock: compartilhado (leitura) e exclusivo (escrita, o padrão)
+LOCK_SHARED = "S"
+LOCK_EXCLUSIVE = "X"
+
+# Um lock em "stories/epic-3" exerce sobre "stories" a intenção do seu modo
+# (IS/IX). Matriz de compatibilidade clássica entre modos e intenções.
+_INTENT = {LOCK_SHARED: "IS", LOCK_EXCLUSIVE: "IX"}
+_COMPATIBLE = {
+    "IS": {"IS", "IX", LOCK_SHARED},
+    "IX": {"IS", "IX"},
+    LOCK_SHARED: {"IS", LOCK_SHARED},
+    LOCK_EXCLUSIVE: set(),
+}
+
+# Sufixos reservados dentro de .agents/locks/
+_RESERVED_SUFFIXES = (".lock", ".shared", ".queue")
+
+# Eventos de instrumentação (JSON Lines em .agents/locks/), rotacionados
+# para STATS_FILE.1 ao passar de STATS_MAX_BYTES
+STATS_FILE = ".stats.jsonl"
+STATS_MAX_BYTES = 1024 * 1024
+# Limites superiores (ms) dos buckets do histograma de espera
+WAIT_BUCKETS_MS = (1, 10, 100, 1000, 10000, 60000)
+
 
 class LockManager:
     """Gerencia locks de recursos para prevenir edições concorrentes."""
@@ -41,32 +98,110 @@ class LockManager:
         self.locks_dir = locks_dir or Path(".agents/locks")
         self.locks_dir.mkdir(parents=True, exist_ok=True)
         self.default_timeout = default_timeout
+        # Latência (ns) entre a liberação e o despertar no último wait_for_lock
+        self.last_handoff_ns = None
+        # (resource, agent) -> _Heartbeat em execução
+        self._heartbeats = {}
+        # Profundidade do _mutex por thread (o flock é tomado só no nível externo)
+        self._mutex_state = threading.local()
 
     def _get_lock_file(self, resource: str) -> Path:
         """Retorna o caminho do arquivo de lock para um recurso."""
         return self.locks_dir / f"{resource}.lock"
 
+    def _shared_dir(self, resource: str) -> Path:
+        """Diretório com um arquivo por agente que detém o recurso em modo S."""
+        return self.locks_dir / f"{resource}.shared"
+
+    def _shared_file(self, resource: str, agent: str) -> Path:
+        safe_agent = re.sub(r"[^\w.-]", "_", agent)
+        return self._shared_dir(resource) / f"{safe_agent}.json"
+
+    def _validate_resource(self, resource: str) -> None:
+        """Recursos são caminhos relativos ("stories/epic-3/story-3.2")."""
+        parts = resource.split("/")
+        if resource.startswith("/") or any(
+            part in ("", ".", "..") or part.endswith(_RESERVED_SUFFIXES) for part in parts
+        ):
+            raise ValueError(f"Nome de recurso inválido: '{resource}'")
+
+    @staticmethod
+    def _ancestors(resource: str) -> list:
+        """"a/b/c" -> ["a", "a/b"]."""
+        parts = resource.split("/")
+        return ["/".join(parts[:i]) for i in range(1, len(parts))]
+
+    @contextlib.contextmanager
+    def _mutex(self):
+        """
+        Serializa verificação e criação de locks entre processos. Sem fcntl
+        (Windows) resta a criação atômica do .lock, que basta para o modo X
+        em recursos sem hierarquia. Reentrante na mesma thread.
+        """
+        depth = getattr(self._mutex_state, "depth", 0)
+        if fcntl is None or depth:
+            self._mutex_state.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._mutex_state.depth = depth
+            return
+        fd = os.open(str(self.locks_dir / ".mutex"), os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            self._mutex_state.depth = 1
+            yield
+        finally:
+            self._mutex_state.depth = 0
+            os.close(fd)
+
     def _get_agent_source(self) -> str:
         """Detecta qual agente está executando."""
         return _platform_get_agent_source()
 
-    def _is_stale(self, lock_data: dict) -> bool:
+    def _read_lease(self, resource: str, lock_file: Path, st: os.stat_result = None):
         """
-        Verifica se um lock está expirado (stale).
-
-        Args:
-            lock_data: Dados do lock
-
-        Returns:
-            True se o lock está expirado
+        (dados, expira_em) de um arquivo de lock, ou None se não existe.
+        Lease vencido (mtime no passado) é removido sem abrir o arquivo;
+        arquivo corrompido também é removido.
         """
         try:
-            locked_at = datetime.fromisoformat(lock_data['locked_at'])
-            timeout = lock_data.get('timeout', self.default_timeout)
-            expiration = locked_at + timedelta(seconds=timeout)
-            return datetime.now() > expiration
-        except (KeyError, ValueError):
-            return True  # Se dados inválidos, considera stale
+            st = st or lock_file.stat()
+            if not _lease_expired(st):
+                return json.loads(lock_file.read_text()), st.st_mtime
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, IOError):
+            pass
+        self._discard_lease(resource, lock_file, st)
+        return None
+
+    def _discard_lease(self, resource: str, lock_file: Path, st: os.stat_result) -> bool:
+        """
+        Remove um lock vencido ou corrompido visto em `st`. Sob o mutex,
+        confere que o arquivo ainda é o mesmo (inode e mtime): entre o stat
+        e o unlink outro processo pode ter renovado o lease ou recriado o
+        lock, e esse lock vivo não pode ser apagado.
+        """
+        with self._mutex():
+            try:
+                current = lock_file.stat()
+                if (current.st_ino, current.st_mtime_ns) != (st.st_ino, st.st_mtime_ns):
+                    return False
+                if not _lease_expired(current):
+                    json.loads(lock_file.read_text())
+                    return False  # Lido de novo, não está corrompido
+            except FileNotFoundError:
+                return False
+            except (json.JSONDecodeError, IOError):
+                pass
+            try:
+                lock_file.unlink()
+            except OSError:
+                return False
+        self._record("stale", resource)
+        self._wake_related(resource)
+        return True
 
     def get_lock_info(self, resource: str) -> Optional[dict]:
         """
@@ -78,58 +213,62 @@ class LockManager:
         Returns:
             Dict com informações do lock ou None se não existir
         """
-        lock_file = self._get_lock_file(resource)
-
-        if not lock_file.exists():
-            return None
-
-        try:
-            lock_data = json.loads(lock_file.read_text())
+        lease = self._read_lease(resource, self._get_lock_file(resource))
+        return lease[0] if lease else None
 
-            # Verifica se está stale
-            if self._is_stale(lock_data):
-                # Remove lock expirado
-                lock_file.unlink()
-                return None
-
-            return lock_data
-        except (json.JSONDecodeError, IOError):
-            # Se arquivo corrompido, remove
-            lock_file.unlink()
-            return None
-
-    def _atomic_create_file(self, file_path: Path, content: str) -> bool:
+    def _atomic_create_file(self, file_path: Path, content: str, timeout: float) -> bool:
         """
-        Cria um arquivo de forma atômica usando O_CREAT | O_EXCL.
+        Cria um arquivo de lock de forma atômica, já com o lease.
 
-        Esta operação é atômica no sistema de arquivos - se dois processos
-        tentarem criar o mesmo arquivo simultaneamente, apenas um terá sucesso.
+        O conteúdo e o mtime (lease) vão num arquivo temporário, publicado
+        com os.link - que, como O_CREAT | O_EXCL, falha se o destino já
+        existe. Assim nenhum processo vê o lock sem lease. Sem hard links,
+        volta ao O_CREAT | O_EXCL.
 
         Args:
             file_path: Caminho do arquivo
             content: Conteúdo a escrever
+            timeout: Duração do lease em segundos
 
         Returns:
             True se criou o arquivo, False se já existia
         """
+        tmp = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
         try:
+            tmp.write_text(content)
+            _set_lease(tmp, timeout)
+            try:
+                os.link(tmp, file_path)
+                return True
+            except FileExistsError:
+                return False
+            except OSError:
+                pass
+
             # O_CREAT | O_EXCL é atômico - falha se arquivo já existe
             fd = os.open(str(file_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
             try:
                 os.write(fd, content.encode('utf-8'))
             finally:
                 os.close(fd)
+            _set_lease(file_path, timeout)
             return True
         except FileExistsError:
             return False
         except OSError:
             return False
+        finally:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
 
     def acquire_lock(
         self,
         resource: str,
         agent: str = None,
         timeout: int = None,
+        mode: str = LOCK_EXCLUSIVE,
         **metadata
     ) -> bool:
         """
@@ -137,60 +276,204 @@ class LockManager:
 
         Usa operações atômicas (O_CREAT | O_EXCL) para prevenir race conditions.
 
+        Recursos podem ser hierárquicos ("stories/epic-3/story-3.2"): o lock
+        conflita com locks incompatíveis no próprio recurso, nos ancestrais
+        e nos descendentes. Em modo compartilhado (LOCK_SHARED) vários
+        agentes podem deter o mesmo recurso ao mesmo tempo.
+
         Args:
             resource: Nome do recurso a bloquear
             agent: Nome do agente (detectado automaticamente se não fornecido)
             timeout: Timeout em segundos (usa default_timeout se não fornecido)
+            mode: LOCK_EXCLUSIVE (padrão) ou LOCK_SHARED
             **metadata: Metadados adicionais para o lock
 
         Returns:
             True se conseguiu adquirir o lock, False caso contrário
         """
+        agent = agent or self._get_agent_source()
+        started = time.monotonic()
+        acquired = self._acquire(resource, agent, timeout, None, metadata, mode)
+        self._record("acquire", resource, agent=agent, mode=mode, ok=acquired,
+                     contended=not acquired, wait_ms=_ms_since(started))
+        return acquired
+
+    def _acquire(self, resource: str, agent: Optional[str], timeout: Optional[int],
+                 ticket: Optional[str], metadata: dict, mode: str = LOCK_EXCLUSIVE) -> bool:
+        """acquire_lock; com waiters na fila, só o primeiro (ticket) pode criar o lock."""
+        self._validate_resource(resource)
+        if mode not in (LOCK_SHARED, LOCK_EXCLUSIVE):
+            raise ValueError(f"Modo de lock inválido: '{mode}'")
+
         lock_file = self._get_lock_file(resource)
         agent = agent or self._get_agent_source()
         timeout = timeout or self.default_timeout
+        shared_file = self._shared_file(resource, agent)
+
+        with self._mutex():
+            # Verifica se já existe lock (e se está stale)
+            existing_lock = self.get_lock_info(resource)
+
+            if existing_lock and existing_lock['locked_by'] == agent:
+                # Renova o lease (só o mtime; locked_at guarda o início).
+                # O lock exclusivo também cobre pedidos em modo S.
+                return self._renew(lock_file, timeout)
+
+            existing_hold = self._read_lease(resource, shared_file)
+            if mode == LOCK_SHARED and existing_hold:
+                return self._renew(shared_file, timeout)
+
+            # Lock incompatível de outro agente (aqui, acima ou abaixo na hierarquia)
+            if self._conflicts(resource, mode, agent):
+                return False
+
+            # Fairness FIFO: recurso livre vai para o primeiro da fila de espera
+            waiters = self._live_waiters(resource)
+            if waiters and waiters[0] != ticket:
+                return False
+
+            # Cria novo lock usando operação atômica
+            lock_data = {
+                "locked_by": agent,
+                "locked_at": datetime.now().isoformat(),
+                "pid": os.getpid(),
+                "timeout": timeout,
+                **metadata
+            }
+
+            if mode == LOCK_SHARED:
+                return self._write_hold(shared_file, {**lock_data, "mode": LOCK_SHARED}, timeout)
+
+            content = json.dumps(lock_data, indent=2)
+            lock_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # Security fix: Usa criação atômica para prevenir race condition (TOCTOU)
+            if self._atomic_create_file(lock_file, content, timeout):
+                if existing_hold:
+                    # Upgrade S -> X: o lock exclusivo substitui o compartilhado
+                    self._remove_hold(resource, shared_file)
+                return True
 
-        # Verifica se já existe lock (e se está stale)
-        existing_lock = self.get_lock_info(resource)
-
-        if existing_lock:
-            # Verifica se é o mesmo agente
-            if existing_lock['locked_by'] == agent:
-                # Renova o lock (reescrita é segura para o mesmo agente)
-                existing_lock['locked_at'] = datetime.now().isoformat()
-                lock_file.write_text(json.dumps(existing_lock, indent=2))
+            # Se falhou, pode ser que outro processo criou o lock entre nossa verificação
+            # e a tentativa de criação. Verificamos novamente.
+            existing_lock = self.get_lock_info(resource)
+            if existing_lock and existing_lock['locked_by'] == agent:
+                # É nosso lock (caso raro de retry)
                 return True
 
-            # Lock pertence a outro agente e não está stale
             return False
 
-        # Cria novo lock usando operação atômica
-        lock_data = {
-            "locked_by": agent,
-            "locked_at": datetime.now().isoformat(),
-            "pid": os.getpid(),
-            "timeout": timeout,
-            **metadata
-        }
-
-        content = json.dumps(lock_data, indent=2)
+    def _renew(self, lock_file: Path, timeout: int) -> bool:
+        try:
+            _set_lease(lock_file, timeout)
+        except OSError:
+            return False
+        return True
 
-        # Security fix: Usa criação atômica para prevenir race condition (TOCTOU)
-        if self._atomic_create_file(lock_file, content):
-            return True
+    def _write_hold(self, hold_file: Path, hold: dict, timeout: int) -> bool:
+        """Grava um lock compartilhado de forma atômica (tmp com lease + rename)."""
+        tmp = hold_file.with_name(f".{hold_file.name}.{os.getpid()}.tmp")
+        try:
+            hold_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(hold, indent=2))
+            _set_lease(tmp, timeout)
+            os.replace(tmp, hold_file)
+        except OSError:
+            return False
+        return True
 
-        # Se falhou, pode ser que outro processo criou o lock entre nossa verificação
-        # e a tentativa de criação. Verificamos novamente.
-        existing_lock = self.get_lock_info(resource)
-        if existing_lock and existing_lock['locked_by'] == agent:
-            # É nosso lock (caso raro de retry)
-            return True
+    def _remove_hold(self, resource: str, hold_file: Path) -> bool:
+        """Remove um lock compartilhado (e o diretório .shared, se ficou vazio)."""
+        try:
+            hold_file.unlink()
+        except FileNotFoundError:
+            return False
+        try:
+            self._shared_dir(resource).rmdir()
+        except OSError:
+            pass
+        return True
 
-        return False
+    def _holders(self, resource: str) -> list:
+        """Locks vivos no próprio recurso: o exclusivo e/ou os compartilhados."""
+        found = [(resource, LOCK_EXCLUSIVE, self._get_lock_file(resource), None)]
+        shared = self._shared_dir(resource)
+        try:
+            names = sorted(os.listdir(shared))
+        except OSError:
+            names = []
+        found += [(resource, LOCK_SHARED, shared / name, None)
+                  for name in names if not name.startswith(".") and name.endswith(".json")]
+        return self._load_holders(found)
+
+    def _load_holders(self, found: list) -> list:
+        """Lê os locks (resource, mode, path, stat) que ainda têm lease."""
+        holders = []
+        for resource, mode, path, st in found:
+            lease = self._read_lease(resource, path, st)
+            if lease:
+                data, expires = lease
+                holders.append({**data, "mode": mode, "resource": resource, "expires": expires})
+        return holders
+
+    def _scan(self, resource: str = "") -> list:
+        """
+        (resource, mode, path, stat) de cada lock sob `resource` (todos, por
+        padrão): uma passada de os.scandir por diretório, sem abrir arquivos.
+        """
+        found = []
+        stack = [os.path.join(self.locks_dir, resource)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    entries = list(entries)
+            except OSError:
+                continue
+            for entry in entries:
+                name = entry.name
+                try:
+                    if name.startswith("."):
+                        continue
+                    if name.endswith(".lock") and entry.is_file():
+                        found.append((self._resource_of(entry.path, ".lock"), LOCK_EXCLUSIVE,
+                                      Path(entry.path), entry.stat()))
+                    elif name.endswith(".shared") and entry.is_dir():
+                        owner = self._resource_of(entry.path, ".shared")
+                        with os.scandir(entry.path) as holds:
+                            found += [(owner, LOCK_SHARED, Path(hold.path), hold.stat())
+                                      for hold in holds
+                                      if hold.name.endswith(".json") and not hold.name.startswith(".")]
+                    elif entry.is_dir() and not name.endswith(".queue"):
+                        stack.append(entry.path)
+                except OSError:
+                    continue  # Removido durante a varredura
+        return sorted(found, key=lambda item: (item[0], item[1], item[2].name))
+
+    def _resource_of(self, path: str, suffix: str) -> str:
+        return Path(path).relative_to(self.locks_dir).as_posix()[:-len(suffix)]
+
+    def _subtree_holders(self, resource: str) -> list:
+        """Locks vivos nos descendentes de um recurso (stories -> stories/epic-3/...)."""
+        return self._load_holders(self._scan(resource))
+
+    def _conflicts(self, resource: str, mode: str, agent: str) -> list:
+        """
+        Locks de outros agentes incompatíveis com `mode` em `resource`: no
+        próprio recurso, nos ancestrais (que recebem a intenção do modo) e
+        nos descendentes (cuja intenção recai sobre o recurso).
+        """
+        intent = _INTENT[mode]
+        conflicts = [h for h in self._holders(resource) if h['mode'] not in _COMPATIBLE[mode]]
+        for ancestor in self._ancestors(resource):
+            conflicts += [h for h in self._holders(ancestor) if h['mode'] not in _COMPATIBLE[intent]]
+        conflicts += [h for h in self._subtree_holders(resource)
+                      if _INTENT[h['mode']] not in _COMPATIBLE[mode]]
+        return [h for h in conflicts if h['locked_by'] != agent]
 
     def release_lock(self, resource: str, agent: str = None) -> bool:
         """
-        Libera um lock de um recurso.
+        Libera um lock de um recurso (exclusivo e/ou compartilhado do agente).
 
         Args:
             resource: Nome do recurso
@@ -202,55 +485,226 @@ class LockManager:
         lock_file = self._get_lock_file(resource)
         agent = agent or self._get_agent_source()
 
-        if not lock_file.exists():
-            return True  # Já liberado
+        shared_file = self._shared_file(resource, agent)
+        released = []  # (modo, dados) de cada lock liberado
 
-        lock_info = self.get_lock_info(resource)
+        self._stop_heartbeat(resource, agent)
+        with self._mutex():
+            hold = self._read_lease(resource, shared_file)
+            if hold and self._remove_hold(resource, shared_file):
+                released.append((LOCK_SHARED, hold[0]))
 
-        if not lock_info:
-            return True  # Lock expirado ou inválido
+            lock_info = self.get_lock_info(resource)
+            if lock_info:
+                if lock_info['locked_by'] == agent:
+                    try:
+                        lock_file.unlink()
+                    except IOError:
+                        return False
+                    released.append((LOCK_EXCLUSIVE, lock_info))
+                elif not released:
+                    return False  # Não pode liberar lock de outro agente
+
+        for mode, lock_data in released:
+            self._record("release", resource, agent=agent, mode=mode, hold_ms=_held_ms(lock_data))
+        if released:
+            self._wake_related(resource)
+        return True
+
+    def _queue_dir(self, resource: str) -> Path:
+        """Fila FIFO de espera de um recurso (um named pipe por waiter)."""
+        return self.locks_dir / f"{resource}.queue"
+
+    def _live_waiters(self, resource: str) -> list:
+        """
+        Waiters vivos em ordem de chegada. Waiters que morreram (pipe sem
+        leitor) são removidos da fila.
+        """
+        try:
+            entries = sorted(os.listdir(self._queue_dir(resource)))
+        except OSError:
+            return []
 
-        # Verifica se o lock pertence a este agente
-        if lock_info['locked_by'] != agent:
-            return False  # Não pode liberar lock de outro agente
+        live = []
+        for name in entries:
+            if name.startswith(".") or not name.endswith(".fifo"):
+                continue
+            path = self._queue_dir(resource) / name
+            try:
+                fd = os.open(str(path), os.O_WRONLY | os.O_NONBLOCK)
+            except OSError:  # ENXIO: ninguém mais lê este pipe
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+                continue
+            os.close(fd)
+            live.append(name)
+        return live
+
+    def _wake_next(self, resource: str) -> None:
+        """Acorda o primeiro waiter vivo da fila, informando o instante da liberação."""
+        queue = self._queue_dir(resource)
+        if not queue.is_dir():
+            return
+        for name in sorted(os.listdir(queue)):
+            if name.startswith(".") or not name.endswith(".fifo"):
+                continue
+            try:
+                fd = os.open(str(queue / name), os.O_WRONLY | os.O_NONBLOCK)
+            except OSError:
+                try:
+                    (queue / name).unlink()
+                except OSError:
+                    pass
+                continue
+            try:
+                os.write(fd, f"{time.time_ns()}\n".encode())
+            except OSError:
+                pass  # Pipe cheio: o waiter já tem um aviso pendente
+            finally:
+                os.close(fd)
+            return
 
-        try:
-            lock_file.unlink()
-            return True
-        except IOError:
-            return False
+    def _wake_related(self, resource: str) -> None:
+        """
+        Acorda as filas que um lock liberado pode destravar: a do próprio
+        recurso, as dos ancestrais e as dos descendentes.
+        """
+        for related in (resource, *self._ancestors(resource)):
+            self._wake_next(related)
+        for dirpath, dirnames, _ in os.walk(self.locks_dir / resource):
+            base = Path(dirpath).relative_to(self.locks_dir).as_posix()
+            for name in dirnames:
+                if name.endswith(".queue"):
+                    self._wake_next(f"{base}/{name[:-len('.queue')]}")
+            dirnames[:] = [n for n in dirnames if not n.endswith(_RESERVED_SUFFIXES)]
+
+    def _enqueue(self, resource: str):
+        """
+        Entra na fila de espera: cria o named pipe já aberto (leitura e uma
+        escrita própria, para não ver EOF) e só então o publica com rename.
+        """
+        queue = self._queue_dir(resource)
+        queue.mkdir(parents=True, exist_ok=True)
+        ticket = f"{time.time_ns():020d}-{os.getpid()}-{os.urandom(3).hex()}.fifo"
+        tmp = queue / f".{ticket}"
+        os.mkfifo(str(tmp), 0o600)
+        rfd = os.open(str(tmp), os.O_RDONLY | os.O_NONBLOCK)
+        wfd = os.open(str(tmp), os.O_WRONLY | os.O_NONBLOCK)
+        os.rename(tmp, queue / ticket)
+        return ticket, rfd, wfd
+
+    def _expires_in(self, holders: list) -> Optional[float]:
+        """Segundos até o primeiro dos leases vencer (None se não há locks)."""
+        if not holders:
+            return None
+        return max(0.0, min(h['expires'] for h in holders) - time.time())
+
+    def _show_conflict(self, resource: str, conflict: dict) -> None:
+        where = "" if conflict['resource'] == resource else f" em '{conflict['resource']}'"
+        print(f"⏳ Recurso '{resource}' bloqueado por '{conflict['locked_by']}'{where}. Aguardando...")
 
     def wait_for_lock(
         self,
         resource: str,
         agent: str = None,
         max_wait: int = 30,
-        check_interval: float = 0.5
+        check_interval: float = 0.5,
+        mode: str = LOCK_EXCLUSIVE
     ) -> bool:
         """
         Aguarda até conseguir adquirir um lock.
 
+        Waiters entram numa fila FIFO (.agents/locks/<resource>.queue/) e
+        bloqueiam num named pipe; release_lock acorda o primeiro da fila na
+        hora. Sem mkfifo (Windows), volta ao polling a cada check_interval.
+
         Args:
             resource: Nome do recurso
             agent: Nome do agente
             max_wait: Tempo máximo de espera em segundos
-            check_interval: Intervalo entre tentativas em segundos
+            check_interval: Intervalo entre tentativas em segundos (só no polling)
+            mode: LOCK_EXCLUSIVE (padrão) ou LOCK_SHARED
 
         Returns:
             True se conseguiu adquirir, False se timeout
         """
         agent = agent or self._get_agent_source()
+        started = time.monotonic()
+
+        if self._acquire(resource, agent, None, None, {}, mode):
+            acquired, contended = True, False
+        elif not hasattr(os, "mkfifo"):
+            acquired, contended = self._poll_for_lock(resource, agent, max_wait, check_interval, mode), True
+        else:
+            acquired, contended = self._queue_for_lock(resource, agent, max_wait, mode), True
+
+        self._record("acquire", resource, agent=agent, mode=mode, ok=acquired,
+                     contended=contended, wait_ms=_ms_since(started))
+        return acquired
+
+    def _queue_for_lock(self, resource: str, agent: str, max_wait: int, mode: str) -> bool:
+        """Espera na fila FIFO do recurso (named pipe) até adquirir ou o prazo acabar."""
+        deadline = time.monotonic() + max_wait
+        ticket, rfd, wfd = self._enqueue(resource)
+        acquired = False
+        shown = None
+        self.last_handoff_ns = None
+
+        try:
+            while True:
+                if self._acquire(resource, agent, None, ticket, {}, mode):
+                    acquired = True
+                    return True
+
+                # Mostra mensagem informativa (uma vez por dono do lock)
+                conflicts = self._conflicts(resource, mode, agent)
+                if conflicts and conflicts[0]['locked_by'] != shown:
+                    shown = conflicts[0]['locked_by']
+                    self._show_conflict(resource, conflicts[0])
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+
+                # Dorme até ser acordado, um lock expirar ou o prazo acabar
+                expires_in = self._expires_in(conflicts)
+                wait = min(remaining, WAKE_RECHECK if expires_in is None else max(expires_in, 0.01))
+                if select.select([rfd], [], [], wait)[0]:
+                    # Aviso de release_lock: mede a latência até acordarmos
+                    try:
+                        released_ns = int(os.read(rfd, 4096).split()[-1])
+                        self.last_handoff_ns = time.time_ns() - released_ns
+                    except (OSError, ValueError, IndexError):
+                        pass
+        finally:
+            os.close(wfd)
+            os.close(rfd)
+            try:
+                (self._queue_dir(resource) / ticket).unlink()
+            except OSError:
+                pass
+            if acquired and mode == LOCK_SHARED:
+                # O próximo da fila também pode ser um leitor
+                self._wake_next(resource)
+            elif not acquired and not self._conflicts(resource, mode, agent):
+                # Desistimos com o recurso livre: passa a vez ao próximo
+                self._wake_next(resource)
+
+    def _poll_for_lock(self, resource: str, agent: str, max_wait: int, check_interval: float,
+                       mode: str = LOCK_EXCLUSIVE) -> bool:
+        """Espera por polling (plataformas sem named pipes)."""
         start_time = time.time()
 
         while time.time() - start_time < max_wait:
-            if self.acquire_lock(resource, agent):
+            if self._acquire(resource, agent, None, None, {}, mode):
                 return True
 
             # Mostra mensagem informativa
-            lock_info = self.get_lock_info(resource)
-            if lock_info:
-                locked_by = lock_info['locked_by']
-                print(f"⏳ Recurso '{resource}' bloqueado por '{locked_by}'. Aguardando...")
+            conflicts = self._conflicts(resource, mode, agent)
+            if conflicts:
+                self._show_conflict(resource, conflicts[0])
 
             time.sleep(check_interval)
 
@@ -258,7 +712,7 @@ class LockManager:
 
     def force_release(self, resource: str) -> bool:
         """
-        Força a liberação de um lock (use com cuidado!).
+        Força a liberação de um lock, exclusivo e compartilhados (use com cuidado!).
 
         Args:
             resource: Nome do recurso
@@ -267,55 +721,264 @@ class LockManager:
             True se conseguiu liberar
         """
         lock_file = self._get_lock_file(resource)
+        shared = self._shared_dir(resource)
+        for key in [key for key in self._heartbeats if key[0] == resource]:
+            self._stop_heartbeat(*key)
 
-        if not lock_file.exists():
-            return True
+        with self._mutex():
+            if not lock_file.exists() and not shared.is_dir():
+                return True
+
+            try:
+                if lock_file.exists():
+                    lock_file.unlink()
+                if shared.is_dir():
+                    for hold_file in shared.iterdir():
+                        hold_file.unlink()
+                    shared.rmdir()
+            except IOError:
+                return False
+        self._record("force_release", resource)
+        self._wake_related(resource)
+        return True
+
+    def start_heartbeat(self, resource: str, agent: str = None) -> bool:
+        """
+        Renova em background o lease do lock do agente (a cada 1/3 do
+        timeout) até release_lock. Operações longas não precisam de um
+        timeout inflado: se o processo morrer, o lock expira sozinho.
+
+        Args:
+            resource: Nome do recurso (já adquirido pelo agente)
+            agent: Nome do agente (detectado automaticamente se não fornecido)
+
+        Returns:
+            True se o heartbeat foi iniciado, False se o agente não detém o lock
+        """
+        agent = agent or self._get_agent_source()
+        lock_info = self.get_lock_info(resource)
+        if lock_info and lock_info['locked_by'] == agent:
+            lock_file = self._get_lock_file(resource)
+        else:
+            lock_file = self._shared_file(resource, agent)
+            lease = self._read_lease(resource, lock_file)
+            if not lease:
+                return False
+            lock_info = lease[0]
 
+        self._stop_heartbeat(resource, agent)
         try:
-            lock_file.unlink()
-            return True
-        except IOError:
+            heartbeat = _Heartbeat(lock_file, lock_info.get('timeout', self.default_timeout))
+        except OSError:
             return False
+        self._heartbeats[(resource, agent)] = heartbeat
+        heartbeat.start()
+        return True
+
+    def _stop_heartbeat(self, resource: str, agent: str) -> None:
+        heartbeat = self._heartbeats.pop((resource, agent), None)
+        if heartbeat:
+            heartbeat.stop()
 
     def list_active_locks(self) -> dict:
         """
         Lista todos os locks ativos.
 
+        Locks compartilhados aparecem com mode "S" e os agentes que os
+        detêm em locked_by, separados por vírgula. Leases vencidos são
+        descartados pelo mtime, sem abrir os arquivos.
+
         Returns:
             Dict com resource -> lock_info
         """
         active_locks = {}
 
-        for lock_file in self.locks_dir.glob("*.lock"):
-            resource = lock_file.stem
-            lock_info = self.get_lock_info(resource)
+        for holder in self._load_holders(self._scan()):
+            resource = holder.pop('resource')
+            del holder['expires']
 
-            if lock_info:  # Ignora locks stale
-                active_locks[resource] = lock_info
+            # _scan ordena S antes de X: o lock exclusivo prevalece
+            if holder['mode'] == LOCK_EXCLUSIVE:
+                del holder['mode']
+            elif resource in active_locks:
+                active_locks[resource]['locked_by'] += f", {holder['locked_by']}"
+                continue
+            active_locks[resource] = holder
 
         return active_locks
 
     def cleanup_stale_locks(self) -> int:
         """
-        Remove todos os locks expirados.
+        Remove todos os locks expirados (pelo mtime, sem abrir os arquivos).
 
         Returns:
             Número de locks removidos
         """
         count = 0
 
-        for lock_file in self.locks_dir.glob("*.lock"):
-            try:
-                lock_data = json.loads(lock_file.read_text())
-                if self._is_stale(lock_data):
-                    lock_file.unlink()
-                    count += 1
-            except (json.JSONDecodeError, IOError):
-                lock_file.unlink()
+        for resource, _, lock_file, st in self._scan():
+            if _lease_expired(st) and self._discard_lease(resource, lock_file, st):
                 count += 1
 
         return count
 
+    def _record(self, event: str, resource: str, **fields) -> None:
+        """Anexa um evento ao log de estatísticas (O_APPEND: uma linha por write)."""
+        line = json.dumps({"ts": round(time.time(), 3), "event": event,
+                           "resource": resource, **fields}, ensure_ascii=False)
+        if os.environ.get("LOCK_TRACE"):
+            print(f"[lock] {line}", file=sys.stderr)
+
+        stats_file = self.locks_dir / STATS_FILE
+        try:
+            if stats_file.stat().st_size > STATS_MAX_BYTES:
+                os.replace(stats_file, self.locks_dir / f"{STATS_FILE}.1")
+        except OSError:
+            pass
+        try:
+            fd = os.open(str(stats_file), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, (line + "\n").encode("utf-8"))
+            finally:
+                os.close(fd)
+        except OSError:
+            pass  # Instrumentação nunca impede o lock
+
+    def stats(self, days_back: Optional[float] = None) -> dict:
+        """
+        Estatísticas de contenção por recurso, a partir do log de eventos.
+
+        Args:
+            days_back: Considera só os últimos N dias (None = todo o log)
+
+        Returns:
+            {"since": ISO ou None, "resources": {resource: {...}}}, recursos
+            ordenados pelo tempo total de espera (o mais disputado primeiro).
+            Por recurso: acquires, failures, contended, stale, forced,
+            wait_ms {count, total, p50, p95, max, histogram} e
+            hold_ms {count, avg, max}.
+        """
+        since = time.time() - days_back * 86400 if days_back is not None else None
+        waits, holds, counts = {}, {}, {}
+
+        for stats_file in (self.locks_dir / f"{STATS_FILE}.1", self.locks_dir / STATS_FILE):
+            try:
+                lines = stats_file.read_text(encoding="utf-8").splitlines()
+            except OSError:
+                continue
+            for line in lines:
+                try:
+                    event = json.loads(line)
+                    if since is not None and event["ts"] < since:
+                        continue
+                    resource, kind = event["resource"], event["event"]
+                except (ValueError, KeyError, TypeError):
+                    continue  # Linha truncada
+
+                count = counts.setdefault(resource, {
+                    "acquires": 0, "failures": 0, "contended": 0, "stale": 0, "forced": 0,
+                })
+                if kind == "acquire":
+                    count["acquires" if event.get("ok") else "failures"] += 1
+                    count["contended"] += bool(event.get("contended"))
+                    waits.setdefault(resource, []).append(event.get("wait_ms", 0))
+                elif kind == "release":
+                    holds.setdefault(resource, []).append(event.get("hold_ms", 0))
+                elif kind == "stale":
+                    count["stale"] += 1
+                elif kind == "force_release":
+                    count["forced"] += 1
+
+        resources = {
+            resource: {**count,
+                       "wait_ms": _wait_summary(waits.get(resource, [])),
+                       "hold_ms": _hold_summary(holds.get(resource, []))}
+            for resource, count in counts.items()
+        }
+        return {
+            "since": datetime.fromtimestamp(since).isoformat(timespec="seconds") if since else None,
+            "resources": dict(sorted(resources.items(),
+                                     key=lambda item: (-item[1]["wait_ms"]["total"], item[0]))),
+        }
+
+
+def _ms_since(started: float) -> float:
+    return round((time.monotonic() - started) * 1000, 3)
+
+
+def _held_ms(lock_data: dict) -> Optional[float]:
+    """Tempo de posse (ms) desde locked_at."""
+    try:
+        locked_at = datetime.fromisoformat(lock_data['locked_at'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return round((datetime.now() - locked_at).total_seconds() * 1000, 3)
+
+
+def _percentile(ordered: list, q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _wait_summary(waits: list) -> dict:
+    """Contagem, total, p50/p95/máx e histograma (buckets WAIT_BUCKETS_MS) das esperas."""
+    ordered = sorted(w for w in waits if w is not None)
+    histogram = {str(bound): 0 for bound in WAIT_BUCKETS_MS}
+    histogram["+inf"] = 0
+    for wait in ordered:
+        bucket = next((str(bound) for bound in WAIT_BUCKETS_MS if wait <= bound), "+inf")
+        histogram[bucket] += 1
+    return {
+        "count": len(ordered),
+        "total": round(sum(ordered), 3),
+        "p50": _percentile(ordered, 0.5) if ordered else None,
+        "p95": _percentile(ordered, 0.95) if ordered else None,
+        "max": ordered[-1] if ordered else None,
+        "histogram": histogram,
+    }
+
+
+def _hold_summary(holds: list) -> dict:
+    ordered = [h for h in holds if h is not None]
+    return {
+        "count": len(ordered),
+        "avg": round(sum(ordered) / len(ordered), 3) if ordered else None,
+        "max": max(ordered) if ordered else None,
+    }
+
+
+class _Heartbeat(threading.Thread):
+    """Estende o lease (mtime) de um arquivo de lock enquanto ele for nosso."""
+
+    def __init__(self, lock_file: Path, timeout: float):
+        super().__init__(daemon=True)
+        self.lock_file = lock_file
+        self.timeout = timeout
+        # Outro dono (após expirar) teria outro inode: não renovamos o dele
+        self.inode = lock_file.stat().st_ino
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.timeout / 3):
+            try:
+                if self.lock_file.stat().st_ino != self.inode:
+                    return
+                _set_lease(self.lock_file, self.timeout)
+            except OSError:
+                return
+
+    def stop(self):
+        self.stopped.set()
+
+
+def _set_lease(lock_file: Path, timeout: float) -> None:
+    """Lease = mtime no instante em que o lock expira."""
+    expires = time.time() + timeout
+    os.utime(lock_file, (expires, expires))
+
+
+def _lease_expired(st: os.stat_result) -> bool:
+    return st.st_mtime < time.time()
+
 
 def main():
     """CLI para gerenciar locks manualmente."""
@@ -325,6 +988,7 @@ def main():
         print("  list     - Lista locks ativos")
         print("  cleanup  - Remove locks expirados")
         print("  force-release <resource> - Força liberação de um lock")
+        print("  stats [--json] [--days N] - Contenção por recurso (espera, posse, falhas)")
         sys.exit(0)
 
     cmd = sys.argv[1].lower()
@@ -343,9 +1007,43 @@ def main():
 
                 print(f"  • {resource}")
                 print(f"    Bloqueado por: {info['locked_by']}")
+                if info.get('mode') == LOCK_SHARED:
+                    print("    Modo: compartilhado (leitura)")
                 print(f"    Há {minutes} minuto(s)")
                 print()
 
+    elif cmd == "stats":
+        options = sys.argv[2:]
+        days = None
+        if "--days" in options:
+            try:
+                days = float(options[options.index("--days") + 1])
+            except (IndexError, ValueError):
+                print("❌ Uso: lock_manager.py stats [--json] [--days N]")
+                sys.exit(1)
+        stats = lock_mgr.stats(days)
+
+        if "--json" in options:
+            print(json.dumps(stats, indent=2, ensure_ascii=False))
+        elif not stats["resources"]:
+            print("📭 Nenhum evento de lock registrado")
+        else:
+            period = f"desde {stats['since']}" if stats["since"] else "todo o histórico"
+            print(f"📈 Contenção de locks ({period}):\n")
+            for resource, info in stats["resources"].items():
+                wait, hold = info["wait_ms"], info["hold_ms"]
+                print(f"  • {resource}")
+                print(f"    Aquisições: {info['acquires']} "
+                      f"({info['contended']} com espera, {info['failures']} falha(s))")
+                if wait["count"]:
+                    print(f"    Espera: p50 {wait['p50']:.0f} ms · p95 {wait['p95']:.0f} ms · "
+                          f"máx {wait['max']:.0f} ms · total {wait['total'] / 1000:.1f} s")
+                if hold["count"]:
+                    print(f"    Posse: média {hold['avg'] / 1000:.1f} s · máx {hold['max'] / 1000:.1f} s")
+                if info["stale"] or info["forced"]:
+                    print(f"    Leases vencidos: {info['stale']} · Liberações forçadas: {info['forced']}")
+                print()
+
     elif cmd == "cleanup":
         count = lock_mgr.cleanup_stale_locks()
         print(f"✅ {count} lock(s) expirado(s) removido(s)")
@@ -7,6 +7,7 @@ Uso:
     python3 .agents/scripts/metrics.py collect [--days N]
     python3 .agents/scripts/metrics.py weekly
     python3 .agents/scripts/metrics.py insights
+    python3 .agents/scripts/metrics.py --benchmark [SESSOES]
 
 Métricas coletadas:
     - Tempo por Epic/Story
@@ -14,10 +15,23 @@ Métricas coletadas:
     - Score de foco
     - Padrões de sessão
     - Distribuição por agente
+
+Dias encerrados são resumidos uma vez em .agents/metrics/daily_rollups.json;
+cada coleta combina esses rollups e recalcula apenas o dia corrente.
+
+--benchmark gera logs diários sintéticos (até SESSOES sessões, padrão 3000)
+num diretório temporário e mede os parsers de log; o tempo por sessão deve
+ficar estável conforme o log cresce.
 """
 
+import os
 import sys
 import json
+import bisect
+import functools
+import itertools
+import tempfile
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -25,77 +39,68 @@ from collections import defaultdict
 import re
 
 sys.path.insert(0, str(Path(__file__).parent))
-from platform_compat import find_backlog, find_logs_dir
+from platform_compat import find_backlog, find_logs_dir, iter_log_files, parse_log_content
+from _session_store import open_store
+
+# Rollups diários persistidos (um por log de dia encerrado)
+ROLLUPS_FILE = Path(".agents/metrics/daily_rollups.json")
+ROLLUPS_VERSION = 1
+
+# "Story 3.1", "Epic 2", "Story-3.1", "#3.1"
+STORY_ID_PATTERN = re.compile(r'(?:Story|Epic)(?:\s+|-)(\d+(?:\.\d+)?)|#(\d+\.\d+)', re.IGNORECASE)
+EPIC_ID_PATTERN = re.compile(r'^(\d+)')
+COMPLETION_PATTERN = re.compile(r'\b(?:conclu[íi]d[oa]|done|finished|✅)\b', re.IGNORECASE)
 
 
 def extract_story_ids(text: str) -> List[str]:
     """Extrai IDs de Stories/Epics de texto."""
-    patterns = [
-        r'(?:Story|Epic)\s+(\d+(?:\.\d+)?)',
-        r'(?:Story|Epic)-(\d+(?:\.\d+)?)',
-        r'#(\d+\.\d+)',
-    ]
-
-    story_ids = set()
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            story_ids.add(match.group(1))
+    return list(_story_ids(text))
 
-    return sorted(list(story_ids))
 
+@functools.lru_cache(maxsize=4096)
+def _story_ids(text: str) -> tuple:
+    # Atividades se repetem muito entre sessões e coletas: memoiza por texto
+    return tuple(sorted(set(m.group(1) or m.group(2) for m in STORY_ID_PATTERN.finditer(text))))
 
-def parse_session_log(filepath: Path) -> List[dict]:
-    """Extrai sessões de um arquivo de log."""
-    content = filepath.read_text(encoding="utf-8")
 
-    # Extrair data
-    date_match = re.search(r"LOG DIÁRIO — (\d{4}-\d{2}-\d{2})", content)
-    if not date_match:
-        return []
-
-    date = date_match.group(1)
-
-    sessions = []
+def extract_story_ids_batch(texts: List[str]) -> List[List[str]]:
+    """
+    Extrai IDs de Stories/Epics de cada texto de uma lista, varrendo os
+    textos distintos de uma só vez, unidos por NUL (que nenhum padrão
+    atravessa).
+    """
+    unique = list(dict.fromkeys(texts))
+    if any("\0" in text for text in unique):
+        return [extract_story_ids(text) for text in texts]
 
-    # Regex para sessões
-    session_pattern = re.compile(
-        r"^\d+\.\s+(\d{1,2}:\d{2})\s*[—–-]\s*(\d{1,2}:\d{2})\s*\((\d{1,2}:\d{2})\)\s*(?:\[.*?([a-z_]+)\])?",
-        re.MULTILINE | re.IGNORECASE
-    )
+    found = [set() for _ in unique]
+    ends = list(itertools.accumulate(len(t) + 1 for t in unique))
 
-    for match in session_pattern.finditer(content):
-        start = match.group(1)
-        end = match.group(2)
-        duration_str = match.group(3)
-        agent = match.group(4) if match.group(4) else "antigravity"
+    for match in STORY_ID_PATTERN.finditer("\0".join(unique)):
+        found[bisect.bisect_right(ends, match.start())].add(match.group(1) or match.group(2))
 
-        # Parse duration
-        dur_match = re.match(r"(\d{1,2}):(\d{2})", duration_str)
-        if dur_match:
-            hours, minutes = int(dur_match.group(1)), int(dur_match.group(2))
-            duration_minutes = hours * 60 + minutes
-        else:
-            duration_minutes = 0
+    by_text = {text: sorted(ids) for text, ids in zip(unique, found)}
+    return [list(by_text[text]) for text in texts]
 
-        # Extrair atividades
-        start_pos = match.end()
-        next_session = session_pattern.search(content, start_pos)
-        end_pos = next_session.start() if next_session else len(content)
 
-        section = content[start_pos:end_pos]
-        activities = re.findall(r"^\s+-\s+(.+)$", section, re.MULTILINE)
+def parse_session_log(filepath: Path) -> List[dict]:
+    """Extrai sessões de um arquivo de log."""
+    parsed = parse_log_content(filepath.read_text(encoding="utf-8"))
+    if parsed is None:
+        return []
 
-        sessions.append({
+    date, _, entries = parsed
+    return [
+        {
             'date': date,
             'start': start,
             'end': end,
             'duration_minutes': duration_minutes,
-            'agent': agent,
+            'agent': agent or "antigravity",
             'activities': activities
-        })
-
-    return sessions
+        }
+        for start, end, duration_minutes, activities, agent in entries
+    ]
 
 
 def get_sessions_in_range(days_back: int = 7) -> List[dict]:
@@ -107,21 +112,25 @@ def get_sessions_in_range(days_back: int = 7) -> List[dict]:
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days_back)
 
-    all_sessions = []
-
-    for year_dir in logs_dir.iterdir():
-        if not year_dir.is_dir():
-            continue
-
-        for log_file in year_dir.glob("*.md"):
-            try:
-                file_date = datetime.strptime(log_file.stem, "%Y-%m-%d")
-            except ValueError:
-                continue
+    # Sessões vêm do store colunar; sem SQLite, relê os logs Markdown
+    store = open_store(logs_dir)
+    if store is not None:
+        with store:
+            return [
+                {
+                    'date': row['date'],
+                    'start': row['start'],
+                    'end': row['end'],
+                    'duration_minutes': row['duration_minutes'],
+                    'agent': row['agent'] or "antigravity",
+                    'activities': row['activities'],
+                }
+                for row in store.sessions_in_range(start_date, end_date)
+            ]
 
-            if start_date.date() <= file_date.date() <= end_date.date():
-                sessions = parse_session_log(log_file)
-                all_sessions.extend(sessions)
+    all_sessions = []
+    for log_file in iter_log_files(logs_dir, start_date, end_date):
+        all_sessions.extend(parse_session_log(log_file))
 
     return sorted(all_sessions, key=lambda s: (s['date'], s['start']))
 
@@ -135,30 +144,34 @@ def calculate_time_per_epic(sessions: List[dict]) -> Dict[str, int]:
     """
     epic_time = defaultdict(int)
 
+    activities = [(session, activity) for session in sessions for activity in session['activities']]
+    all_story_ids = extract_story_ids_batch([activity for _, activity in activities])
+
+    # Analisa atividades para identificar Epics
+    for (session, _), story_ids in zip(activities, all_story_ids):
+        # Extrai Epic IDs (ex: "3.1" -> "Epic 3")
+        epic_ids = [f"Epic {EPIC_ID_PATTERN.match(sid).group(1)}" for sid in story_ids]
+
+        # Divide tempo da sessão entre Epics mencionados
+        # (simplificado: assume distribuição igual)
+        unique_epics = len(set(epic_ids))
+        for epic_id in epic_ids:
+            epic_time[epic_id] += session['duration_minutes'] // unique_epics
+
+    return dict(epic_time)
+
+
+def find_completed_stories(sessions: List[dict]) -> set:
+    """IDs de Stories/Epics mencionados em atividades de conclusão."""
+    completed_stories = set()
+
     for session in sessions:
-        # Analisa atividades para identificar Epics
         for activity in session['activities']:
-            story_ids = extract_story_ids(activity)
-
-            for story_id in story_ids:
-                # Extrai Epic ID (ex: "3.1" -> "Epic 3")
-                epic_match = re.match(r'^(\d+)', story_id)
-                if epic_match:
-                    epic_id = f"Epic {epic_match.group(1)}"
-
-                    # Divide tempo da sessão entre Epics mencionados
-                    # (simplificado: assume distribuição igual)
-                    epic_pattern = re.compile(r'^(\d+)')
-                    unique_epics = len(set(
-                        "Epic " + epic_pattern.match(sid).group(1)
-                        for sid in story_ids
-                        if epic_pattern.match(sid)
-                    ))
-
-                    if unique_epics > 0:
-                        epic_time[epic_id] += session['duration_minutes'] // unique_epics
+            # Detecta conclusão
+            if COMPLETION_PATTERN.search(activity):
+                completed_stories.update(extract_story_ids(activity))
 
-    return dict(epic_time)
+    return completed_stories
 
 
 def calculate_velocity(sessions: List[dict], backlog_path: Optional[Path]) -> Dict[str, float]:
@@ -172,14 +185,7 @@ def calculate_velocity(sessions: List[dict], backlog_path: Optional[Path]) -> Di
         return {'stories_per_week': 0.0, 'completion_rate': 0.0}
 
     # Conta stories concluídas mencionadas nas atividades
-    completed_stories = set()
-
-    for session in sessions:
-        for activity in session['activities']:
-            # Detecta conclusão
-            if re.search(r'\b(?:conclu[íi]d[oa]|done|finished|✅)\b', activity, re.IGNORECASE):
-                story_ids = extract_story_ids(activity)
-                completed_stories.update(story_ids)
+    completed_stories = find_completed_stories(sessions)
 
     # Calcula stories por semana
     total_days = len(set(s['date'] for s in sessions))
@@ -281,53 +287,200 @@ def calculate_agent_distribution(sessions: List[dict]) -> Dict[str, any]:
     return dict(agent_stats)
 
 
-def collect_metrics(days_back: int = 7) -> Dict[str, any]:
+def rollup_sessions(sessions: List[dict]) -> dict:
     """
-    Coleta todas as métricas do período.
+    Resume as sessões de um log diário em contadores que se somam entre dias.
 
-    Args:
-        days_back: Número de dias para analisar
+    Sessões devem vir ordenadas por (date, start); a ordem das listas e
+    dicionários do rollup preserva a ordem em que cada chave apareceu.
+    """
+    start_hours = []
+    hourly = defaultdict(int)
+    agents = defaultdict(lambda: {'sessions': 0, 'minutes': 0})
 
-    Returns:
-        Dict com todas as métricas
+    for session in sessions:
+        start_match = re.match(r'(\d{1,2}):\d{2}', session['start'])
+        if start_match:
+            hour = int(start_match.group(1))
+            start_hours.append(hour)
+            hourly[str(hour)] += session['duration_minutes']
+
+        agents[session['agent']]['sessions'] += 1
+        agents[session['agent']]['minutes'] += session['duration_minutes']
+
+    return {
+        'sessions': len(sessions),
+        'dates': sorted(set(s['date'] for s in sessions)),
+        'first_date': sessions[0]['date'] if sessions else None,
+        'last_date': sessions[-1]['date'] if sessions else None,
+        'minutes': sum(s['duration_minutes'] for s in sessions),
+        'time_per_epic': calculate_time_per_epic(sessions),
+        'completed_stories': sorted(find_completed_stories(sessions)),
+        'start_hours': start_hours,
+        'hourly': dict(hourly),
+        'agents': dict(agents),
+    }
+
+
+def _load_rollups() -> Dict[str, dict]:
+    try:
+        data = json.loads(ROLLUPS_FILE.read_text(encoding='utf-8'))
+        if data.get('version') == ROLLUPS_VERSION:
+            return data.get('days', {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _save_rollups(days: Dict[str, dict]):
+    try:
+        ROLLUPS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = ROLLUPS_FILE.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'version': ROLLUPS_VERSION, 'days': days}), encoding='utf-8')
+        os.replace(tmp, ROLLUPS_FILE)
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar os rollups diários: {e}", file=sys.stderr)
+
+
+def get_daily_rollups(days_back: int = 7) -> List[dict]:
     """
-    sessions = get_sessions_in_range(days_back)
+    Rollups dos logs diários dos últimos N dias, em ordem de data.
 
-    if not sessions:
-        return {
-            'error': 'Nenhuma sessão encontrada no período',
-            'days_back': days_back
+    Dias encerrados são resumidos uma vez e persistidos em ROLLUPS_FILE,
+    validados pelo tamanho e mtime do log (edições manuais recalculam o
+    dia); o dia corrente é sempre recalculado.
+    """
+    logs_dir = find_logs_dir()
+    if not logs_dir:
+        return []
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days_back)
+    today = end_date.strftime('%Y-%m-%d')
+
+    stored = _load_rollups()
+    changed = False
+    rollups = []
+
+    for log_file in sorted(iter_log_files(logs_dir, start_date, end_date), key=lambda p: p.stem):
+        st = log_file.stat()
+        source = [st.st_size, st.st_mtime_ns]
+        rollup = stored.get(log_file.stem)
+
+        if rollup is None or rollup['source'] != source:
+            sessions = sorted(parse_session_log(log_file), key=lambda s: (s['date'], s['start']))
+            rollup = rollup_sessions(sessions)
+            if log_file.stem < today:
+                rollup['source'] = source
+                stored[log_file.stem] = rollup
+                changed = True
+
+        rollups.append(rollup)
+
+    if changed:
+        _save_rollups(stored)
+
+    return rollups
+
+
+def combine_rollups(rollups: List[dict], backlog_path: Optional[Path]) -> Dict[str, any]:
+    """
+    Combina rollups diários nas métricas do período (mesmos resultados de
+    calculate_* sobre as sessões brutas).
+    """
+    epic_time = defaultdict(int)
+    hourly = defaultdict(int)
+    agent_stats = defaultdict(lambda: {'sessions': 0, 'minutes': 0})
+    completed_stories = set()
+    dates = set()
+    start_hours = []
+    total_minutes = 0
+    total_sessions = 0
+
+    for rollup in rollups:
+        total_sessions += rollup['sessions']
+        total_minutes += rollup['minutes']
+        dates.update(rollup['dates'])
+        completed_stories.update(rollup['completed_stories'])
+        start_hours.extend(rollup['start_hours'])
+        for epic, minutes in rollup['time_per_epic'].items():
+            epic_time[epic] += minutes
+        for hour, minutes in rollup['hourly'].items():
+            hourly[int(hour)] += minutes
+        for agent, stats in rollup['agents'].items():
+            agent_stats[agent]['sessions'] += stats['sessions']
+            agent_stats[agent]['minutes'] += stats['minutes']
+
+    # Velocidade
+    if not backlog_path:
+        velocity = {'stories_per_week': 0.0, 'completion_rate': 0.0}
+    else:
+        weeks = len(dates) / 7.0 if dates else 1
+        velocity = {
+            'stories_completed': len(completed_stories),
+            'stories_per_week': round(len(completed_stories) / weeks if weeks > 0 else 0, 2),
+            'total_weeks': round(weeks, 2)
         }
 
-    backlog = find_backlog()
-    epic_time = calculate_time_per_epic(sessions)
-    velocity = calculate_velocity(sessions, backlog)
-    focus_score = calculate_focus_score(sessions, epic_time)
-    patterns = analyze_session_patterns(sessions)
-    agent_dist = calculate_agent_distribution(sessions)
+    # Foco: top 3 Epics sobre o tempo total
+    focus_score = 0.0
+    if epic_time and total_minutes:
+        top_epics_time = sum(t for _, t in sorted(epic_time.items(), key=lambda x: x[1], reverse=True)[:3])
+        focus_score = round((top_epics_time / total_minutes) * 100, 2)
+
+    patterns = {
+        'avg_session_duration_minutes': round(total_minutes / total_sessions, 2),
+        'most_productive_hour': max(hourly.items(), key=lambda x: x[1])[0] if hourly else None,
+        'most_common_start_hour': max(set(start_hours), key=start_hours.count) if start_hours else None,
+        'total_sessions': total_sessions,
+        'hourly_distribution': dict(hourly)
+    }
 
-    total_minutes = sum(s['duration_minutes'] for s in sessions)
+    for stats in agent_stats.values():
+        stats['percentage'] = round((stats['minutes'] / total_minutes * 100), 2) if total_minutes > 0 else 0
 
     return {
         'period': {
-            'days_back': days_back,
-            'start_date': sessions[0]['date'],
-            'end_date': sessions[-1]['date'],
-            'total_sessions': len(sessions)
+            'start_date': rollups[0]['first_date'],
+            'end_date': rollups[-1]['last_date'],
+            'total_sessions': total_sessions
         },
         'time_metrics': {
             'total_minutes': total_minutes,
             'total_hours': round(total_minutes / 60, 2),
-            'time_per_epic': epic_time
+            'time_per_epic': dict(epic_time)
         },
         'velocity': velocity,
         'focus_score': focus_score,
         'session_patterns': patterns,
-        'agent_distribution': agent_dist,
-        'generated_at': datetime.now().isoformat()
+        'agent_distribution': dict(agent_stats),
     }
 
 
+def collect_metrics(days_back: int = 7) -> Dict[str, any]:
+    """
+    Coleta todas as métricas do período, combinando os rollups diários.
+
+    Args:
+        days_back: Número de dias para analisar
+
+    Returns:
+        Dict com todas as métricas
+    """
+    rollups = [r for r in get_daily_rollups(days_back) if r['sessions']]
+
+    if not rollups:
+        return {
+            'error': 'Nenhuma sessão encontrada no período',
+            'days_back': days_back
+        }
+
+    metrics = combine_rollups(rollups, find_backlog())
+    metrics['period'] = {'days_back': days_back, **metrics['period']}
+    metrics['generated_at'] = datetime.now().isoformat()
+    return metrics
+
+
 def generate_weekly_insights(metrics: Dict[str, any]) -> str:
     """Gera insights em texto baseado nas métricas."""
     if 'error' in metrics:
@@ -488,13 +641,82 @@ def cmd_insights():
     print(insights)
 
 
+def synthetic_log(sessions: int, date: str = "2026-01-05") -> str:
+    """Log diário sintético com `sessions` sessões no formato de auto_session."""
+    agents = ["\U0001f916 antigravity", "\U0001f535 claude_code", "\U0001f7e2 codex"]
+    lines = [f"# LOG DIÁRIO — {date}", "- Projeto: benchmark", "- Fuso: America/Sao_Paulo", "",
+             "## Sessoes", ""]
+    for i in range(sessions):
+        start = (8 * 60 + i) % (24 * 60)
+        end = (start + 1) % (24 * 60)
+        lines += [
+            f"{i + 1}. {start // 60:02d}:{start % 60:02d} — {end // 60:02d}:{end % 60:02d} (00:01) "
+            f"[{agents[i % len(agents)]}]",
+            "   - Atividades:",
+            f"     - Story {i % 7 + 1}.{i % 5 + 1}: implementação da tela {i}",
+            f"     - Revisão do Epic {i % 7 + 1} com testes",
+            "     - Deploy concluído ✅" if i % 4 == 0 else "     - Ajustes de layout",
+            "",
+        ]
+    lines += ["## Resumo do Dia", "- Inicio do dia: 08:00", "- Tempo total: 00:00", ""]
+    return "\n".join(lines)
+
+
+def benchmark(max_sessions: int = 3000, rounds: int = 3) -> List[dict]:
+    """
+    Tempo dos parsers de log (metrics/platform_compat e auto_session) em
+    logs sintéticos de tamanho crescente, gravados num diretório temporário.
+    """
+    from auto_session import _parse_sessions
+
+    sizes = sorted({max(1, max_sessions // 30), max(1, max_sessions // 3), max_sessions})
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for sessions in sizes:
+            log_file = Path(tmp) / f"{sessions}.md"
+            log_file.write_text(synthetic_log(sessions), encoding="utf-8")
+            content = log_file.read_text(encoding="utf-8")
+
+            timings = {}
+            for name, parse in (("parse_session_log", lambda: parse_session_log(log_file)),
+                                ("auto_session", lambda: _parse_sessions(content))):
+                best = None
+                for _ in range(rounds):
+                    start = time.perf_counter()
+                    parsed = parse()
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                if len(parsed) != sessions:
+                    raise RuntimeError(f"{name}: {len(parsed)} de {sessions} sessões")
+                timings[name] = best
+
+            results.append({"sessions": sessions, "kb": log_file.stat().st_size / 1024, **timings})
+    return results
+
+
+def cmd_benchmark(max_sessions: int = 3000):
+    """Comando: Benchmark dos parsers de log com logs sintéticos."""
+    print(f"Parsers de log diário: logs sintéticos de até {max_sessions} sessões (melhor de 3)")
+    print(f"  {'Sessões':>8} {'KB':>8}  {'parse_session_log':>24}  {'auto_session':>24}")
+    for row in benchmark(max_sessions):
+        cells = [f"{row[name] * 1000:8.1f} ms {row[name] / row['sessions'] * 1e6:6.1f} us/s"
+                 for name in ("parse_session_log", "auto_session")]
+        print(f"  {row['sessions']:>8} {row['kb']:>8.0f}  {cells[0]:>24}  {cells[1]:>24}")
+
+
 def main():
+    if "--benchmark" in sys.argv:
+        idx = sys.argv.index("--benchmark")
+        cmd_benchmark(int(sys.argv[idx + 1]) if idx + 1 < len(sys.argv) else 3000)
+        return
+
     if len(sys.argv) < 2:
         print(__doc__)
         print("\nComandos disponíveis:")
         print("  collect [--days N]  Coleta métricas dos últimos N dias (padrão: 7)")
         print("  weekly              Gera relatório semanal com insights")
         print("  insights            Exibe insights sem salvar")
+        print("  --benchmark [N]     Mede os parsers de log com logs sintéticos (até N sessões)")
         sys.exit(0)
 
     cmd = sys.argv[1].lower()
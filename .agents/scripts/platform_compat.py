@@ -279,6 +279,35 @@ class Session(NamedTuple):
     agent_source: str = "unknown"
 
 
+# Completed session entry: "1. 14:30 — 15:45 (01:15) [🔵 claude_code]"
+SESSION_PATTERN = re.compile(
+    r"^\d+\.\s+(\d{1,2}:\d{2})\s*[—–-]\s*(\d{1,2}:\d{2})\s*\((\d{1,2}:\d{2})\)\s*(?:\[.*?([a-z_]+)\])?",
+    re.MULTILINE | re.IGNORECASE,
+)
+# Indented activity bullet under an entry
+ACTIVITY_PATTERN = re.compile(r"^\s+-\s+(.+)$", re.MULTILINE)
+
+
+def iter_log_entries(content: str, entry_pattern=SESSION_PATTERN, stop_pattern=None):
+    """
+    Yields (entry_match, body) for each session entry of a daily log, in a
+    single sweep of entry_pattern. The body runs up to the next entry; the
+    last one stops at stop_pattern (when given) or the end of the log.
+    """
+    previous = None
+    for match in entry_pattern.finditer(content):
+        if previous is not None:
+            yield previous, content[previous.end():match.start()]
+        previous = match
+
+    if previous is not None:
+        end = len(content)
+        stop = stop_pattern.search(content, previous.end()) if stop_pattern else None
+        if stop:
+            end = stop.start()
+        yield previous, content[previous.end():end]
+
+
 def _parse_duration(duration_str: str) -> int:
     """Converts 'HH:MM' to minutes."""
     match = re.match(r"(\d{1,2}):(\d{2})", duration_str)
@@ -289,57 +318,75 @@ def _parse_duration(duration_str: str) -> int:
 
 def parse_log_file(filepath: Path) -> List[Session]:
     """Extracts sessions from a daily log markdown file."""
-    content = filepath.read_text(encoding="utf-8")
+    parsed = parse_log_content(filepath.read_text(encoding="utf-8"))
+    if parsed is None:
+        return []
+    date, project, entries = parsed
+    return [
+        Session(date=date, project=project, start=start, end=end, duration_minutes=duration,
+                activities=activities, agent_source=agent or "unknown")
+        for start, end, duration, activities, agent in entries
+    ]
 
+
+def parse_log_content(content: str) -> Optional[tuple]:
+    """
+    Parses a daily log into (date, project, entries), or None without a
+    LOG DIARIO header. Entries are (start, end, duration_minutes,
+    activities, agent) with agent None when the entry has no badge.
+    """
     date_match = re.search(r"LOG DI[AÁ]RIO\s*[—–-]\s*(\d{4}-\d{2}-\d{2})", content)
     project_match = re.search(r"- Projeto:\s*(.+)", content)
 
     if not date_match:
-        return []
+        return None
 
     date = date_match.group(1)
     project = project_match.group(1).strip() if project_match else "Unknown"
 
-    sessions: List[Session] = []
-    session_pattern = re.compile(
-        r"^\d+\.\s+(\d{1,2}:\d{2})\s*[—–-]\s*(\d{1,2}:\d{2})\s*\((\d{1,2}:\d{2})\)\s*(?:\[.*?([a-z_]+)\])?",
-        re.MULTILINE | re.IGNORECASE,
-    )
-
-    for match in session_pattern.finditer(content):
-        start_pos = match.end()
-        next_match = session_pattern.search(content, start_pos)
-        end_pos = next_match.start() if next_match else len(content)
-        section = content[start_pos:end_pos]
-        activities = re.findall(r"^\s+-\s+(.+)$", section, re.MULTILINE)
-
-        sessions.append(Session(
-            date=date,
-            project=project,
-            start=match.group(1),
-            end=match.group(2),
-            duration_minutes=_parse_duration(match.group(3)),
-            activities=activities,
-            agent_source=match.group(4) or "unknown",
-        ))
+    entries = [
+        (match.group(1), match.group(2), _parse_duration(match.group(3)),
+         ACTIVITY_PATTERN.findall(body), match.group(4))
+        for match, body in iter_log_entries(content)
+    ]
 
-    return sessions
+    return date, project, entries
 
 
 def get_logs_in_range(logs_dir: Path, start_date: datetime, end_date: datetime) -> List[Session]:
-    """Returns all sessions in a date range."""
+    """Returns all sessions in a date range (served by the session store when available)."""
+    from _session_store import open_store
+    store = open_store(logs_dir)
+    if store is not None:
+        with store:
+            return [
+                Session(date=row["date"], project=row["project"], start=row["start"], end=row["end"],
+                        duration_minutes=row["duration_minutes"], activities=row["activities"],
+                        agent_source=row["agent"] or "unknown")
+                for row in store.sessions_in_range(start_date, end_date)
+            ]
+
     all_sessions: List[Session] = []
+    for log_file in iter_log_files(logs_dir, start_date, end_date):
+        all_sessions.extend(parse_log_file(log_file))
+    return sorted(all_sessions, key=lambda s: (s.date, s.start))
+
+
+def iter_log_files(logs_dir: Path, start_date: datetime, end_date: datetime):
+    """Yields daily log files (YYYY/YYYY-MM-DD.md) dated within a range."""
     for year_dir in logs_dir.iterdir():
         if not year_dir.is_dir():
             continue
+        # Year directories outside the range cannot hold matching logs
+        if year_dir.name.isdigit() and not start_date.year <= int(year_dir.name) <= end_date.year:
+            continue
         for log_file in year_dir.glob("*.md"):
             try:
                 file_date = datetime.strptime(log_file.stem, "%Y-%m-%d")
             except ValueError:
                 continue
             if start_date.date() <= file_date.date() <= end_date.date():
-                all_sessions.extend(parse_log_file(log_file))
-    return sorted(all_sessions, key=lambda s: (s.date, s.start))
+                yield log_file
 
 
 def get_last_activity_by_agent(logs_dir: Path, days_back: int = 7) -> Dict[str, dict]:
@@ -375,30 +422,16 @@ def get_last_activity_by_agent(logs_dir: Path, days_back: int = 7) -> Dict[str,
 # Bootstrap: ensure docs structure exists (idempotent)
 # ---------------------------------------------------------------------------
 
-import subprocess as _subprocess
-
-
 def _get_git_branch() -> str:
     """Returns current git branch or 'unknown' if git is unavailable."""
-    try:
-        return _subprocess.check_output(
-            ["git", "branch", "--show-current"],
-            text=True, stderr=_subprocess.DEVNULL,
-        ).strip() or "unknown"
-    except (FileNotFoundError, _subprocess.CalledProcessError):
-        return "unknown"
+    from _git_queries import git_branch
+    return git_branch()
 
 
 def _get_git_available() -> bool:
     """Returns True if we are inside a git repository."""
-    try:
-        _subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            capture_output=True, check=True,
-        )
-        return True
-    except (FileNotFoundError, _subprocess.CalledProcessError):
-        return False
+    from _git_queries import git_available
+    return git_available()
 
 
 _BACKLOG_TEMPLATE = """\
@@ -578,13 +611,13 @@ def parse_story_frontmatter(story_path: Path) -> dict:
         Dict with keys: story, epic, status, agent, tool, depends_on, unlocks, priority.
         Returns empty dict if file not found or no frontmatter.
     """
-    if not story_path.exists():
-        return {}
+    from _frontmatter import read_frontmatter
 
-    content = story_path.read_text(encoding="utf-8")
+    # Only the header is read (and cached by path, mtime and size)
+    content = read_frontmatter(story_path)
 
     # Check for frontmatter delimiters
-    if not content.startswith("---"):
+    if not content:
         return {}
 
     end_idx = content.find("---", 3)
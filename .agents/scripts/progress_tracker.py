@@ -13,7 +13,6 @@ Outputs:
 
 import re
 import sys
-import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import NamedTuple, Optional
@@ -26,6 +25,8 @@ from platform_compat import (
     parse_story_frontmatter,
     _PROJECT_STATUS_TEMPLATE,
 )
+from _backlog_index import index_content
+from _git_queries import git_branch, git_log
 
 
 class Epic(NamedTuple):
@@ -49,38 +50,15 @@ def parse_backlog(content: str) -> list[Epic]:
     Works with both lean and fat backlog formats.
     Only counts top-level story checkboxes (- [x] / - [ ]).
     """
-    epics: list[Epic] = []
-
-    epic_pattern = re.compile(
-        r"^##\s+Epic\s+(\d+):\s+(.+?)\s*(?:\[(?:P\d+)\])?\s*(?:\[OWNER:\s*(.+?)\])?\s*(?:\[MODEL:\s*(.+?)\])?\s*(?:[✅🔴⏳].*)?$",
-        re.MULTILINE,
-    )
-
-    epic_matches = list(epic_pattern.finditer(content))
-
-    for idx, match in enumerate(epic_matches):
-        epic_num = int(match.group(1))
-        epic_name = match.group(2).strip()
-        epic_owner = match.group(3).strip() if match.group(3) else None
-        epic_model = match.group(4).strip() if match.group(4) else None
-
-        start_pos = match.end()
-        end_pos = epic_matches[idx + 1].start() if idx + 1 < len(epic_matches) else len(content)
-        epic_content = content[start_pos:end_pos]
-
-        # Count only top-level story checkboxes (not indented subtasks)
-        done = len(re.findall(r"^-\s*\[(?:x|X)\]", epic_content, re.MULTILINE))
-        pending = len(re.findall(r"^-\s*\[\s\]", epic_content, re.MULTILINE))
-        total = done + pending
-
-        if total > 0:
-            epics.append(Epic(
-                num=epic_num, name=epic_name,
-                total=total, done=done,
-                owner=epic_owner, model=epic_model,
-            ))
-
-    return epics
+    return [
+        Epic(
+            num=epic["num"], name=epic["name"],
+            total=epic["done"] + epic["pending"], done=epic["done"],
+            owner=epic["owner"], model=epic["model"],
+        )
+        for epic in index_content(content).epics
+        if epic["done"] + epic["pending"] > 0
+    ]
 
 
 def generate_bar(percent: float, width: int = 10) -> str:
@@ -92,22 +70,10 @@ def generate_bar(percent: float, width: int = 10) -> str:
 
 def _get_git_info() -> dict:
     """Get current git branch and recent commits."""
-    info = {"branch": "unknown", "commits": "(nenhum commit registrado)"}
-    try:
-        info["branch"] = subprocess.check_output(
-            ["git", "branch", "--show-current"],
-            text=True, stderr=subprocess.DEVNULL,
-        ).strip() or "unknown"
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        pass
-    try:
-        info["commits"] = subprocess.check_output(
-            ["git", "log", "-3", "--oneline"],
-            text=True, stderr=subprocess.DEVNULL,
-        ).strip() or "(nenhum commit registrado)"
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        pass
-    return info
+    return {
+        "branch": git_branch(),
+        "commits": (git_log("-3", "--oneline") or "").strip() or "(nenhum commit registrado)",
+    }
 
 
 def _clean_story_title(title: str) -> str:
@@ -117,17 +83,12 @@ def _clean_story_title(title: str) -> str:
 
 def _find_next_pending_story(content: str) -> Optional[dict]:
     """Find the first unchecked story in the backlog and read its story file metadata."""
-    # Match lean or fat format
-    pattern = re.compile(
-        r"^-\s*\[\s\]\s*(?:\*\*)?Story\s+(\d+\.\d+):?\*?\*?\s*(.+?)$",
-        re.MULTILINE,
-    )
-    match = pattern.search(content)
-    if not match:
+    story = next((s for s in index_content(content).stories if s["status"] == "pending"), None)
+    if not story:
         return None
 
-    story_id = match.group(1)
-    story_title = _clean_story_title(match.group(2).strip())
+    story_id = story["id"]
+    story_title = _clean_story_title(story["title"])
 
     result = {
         "id": story_id,
@@ -152,20 +113,13 @@ def _find_next_pending_story(content: str) -> Optional[dict]:
 
 def _find_story_after(content: str, current_story_id: str) -> Optional[dict]:
     """Find the story immediately after the given story ID in the backlog."""
-    pattern = re.compile(
-        r"^-\s*\[[ xX]\]\s*(?:\*\*)?Story\s+(\d+\.\d+):?\*?\*?\s*(.+?)$",
-        re.MULTILINE,
-    )
-    matches = list(pattern.finditer(content))
-
     found_current = False
-    for match in matches:
-        sid = match.group(1)
+    for story in index_content(content).stories:
+        sid = story["id"]
         if found_current:
             # Return the next unchecked story
-            check_line = content[match.start():match.end()]
-            if "[ ]" in check_line:
-                result = {"id": sid, "title": _clean_story_title(match.group(2).strip())}
+            if story["status"] == "pending":
+                result = {"id": sid, "title": _clean_story_title(story["title"])}
                 story_file = find_story_file(sid)
                 if story_file:
                     fm = parse_story_frontmatter(story_file)
@@ -198,12 +152,8 @@ def _validate_coverage(content: str) -> list[str]:
     """Validate bidirectional coverage: backlog checkboxes <-> story files."""
     warnings = []
 
-    # Extract all story IDs from backlog
-    pattern = re.compile(
-        r"^-\s*\[[ xX]\]\s*(?:\*\*)?Story\s+(\d+\.\d+)",
-        re.MULTILINE,
-    )
-    backlog_ids = set(m.group(1) for m in pattern.finditer(content))
+    # All story IDs from the backlog
+    backlog_ids = set(s["id"] for s in index_content(content).stories)
 
     # Extract all story IDs from files
     stories_dir = find_stories_dir()
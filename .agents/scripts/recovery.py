@@ -116,17 +116,22 @@ def safe_execute(command, rollback_fn=None, cwd=None, timeout=120):
         raise
 
 
-def git_checkpoint(label):
+def git_checkpoint(label, paths=None):
     """
     Create a git stash checkpoint before risky operations.
 
     Args:
         label: Label for the checkpoint (used in stash message)
+        paths: Optional list of paths; only their tracked changes are stashed,
+               so concurrent work elsewhere in the tree is left alone
 
     Returns:
         True if stash was created, False if working tree was clean
     """
     try:
+        if paths is not None:
+            return _git_checkpoint_paths(label, [str(p) for p in paths])
+
         # Check if there are changes to stash
         result = subprocess.run(
             ["git", "status", "--porcelain"],
@@ -147,6 +152,33 @@ def git_checkpoint(label):
         return False
 
 
+def _git_checkpoint_paths(label, paths):
+    """git_checkpoint restricted to the tracked files among `paths`."""
+    # Untracked paths are never stashed, and git stash push rejects them as pathspecs
+    tracked = []
+    if paths:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--", *paths],
+            capture_output=True, text=True, check=True
+        )
+        tracked = [p for p in result.stdout.split("\0") if p]
+
+    changed = tracked and subprocess.run(
+        ["git", "diff", "--quiet", "HEAD", "--", *tracked],
+        capture_output=True, text=True
+    ).returncode != 0
+    if not changed:
+        logger.info("Checkpoint '%s': paths clean, nothing to stash.", label)
+        return False
+
+    subprocess.run(
+        ["git", "stash", "push", "-m", f"recovery-checkpoint: {label}", "--", *tracked],
+        capture_output=True, text=True, check=True
+    )
+    logger.info("Checkpoint '%s' created (%d path(s)).", label, len(tracked))
+    return True
+
+
 def git_rollback(label):
     """
     Restore to a previously created checkpoint.
@@ -167,7 +199,8 @@ def git_rollback(label):
         target_msg = f"recovery-checkpoint: {label}"
         stash_ref = None
         for line in result.stdout.splitlines():
-            if target_msg in line:
+            # Exact label: "shard-epic stories" must not match "shard-epic stories/epic-1"
+            if line.endswith(target_msg):
                 stash_ref = line.split(":")[0]
                 break
 
@@ -21,11 +21,14 @@ Options:
     --output DIR      Override stories directory (default: docs/stories/)
 """
 
+import os
 import re
 import sys
 import argparse
 import hashlib
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -38,9 +41,18 @@ from platform_compat import (
     parse_story_frontmatter,
     STORY_TEMPLATE,
 )
-from lock_manager import LockManager
+from lock_manager import LockManager, LOCK_SHARED
+from _backlog_index import index_content
+from _frontmatter import read_frontmatter
 from recovery import git_checkpoint, git_rollback
 
+# Spec-hash manifest of story files (relative to project root) and I/O pool size
+MANIFEST_FILE = Path(".agents/.cache/story_manifest.json")
+IO_WORKERS = 8
+
+# Lock serializing git stash push/pop (the stash stack is shared by the whole repo)
+STASH_LOCK = "git-stash"
+
 
 # ---------------------------------------------------------------------------
 # Parsing (works with BOTH lean and fat backlog formats)
@@ -51,77 +63,30 @@ def parse_backlog(content: str) -> list[dict]:
     Parse BACKLOG.md into a list of epics with their stories.
 
     Works with both lean (checkbox-only) and fat (with descriptions) formats.
+    The parse itself comes from the shared backlog index (cached by content hash).
 
     Returns:
         List of dicts: [{epic_num, epic_name, owner, model, stories: [{id, title, status, description}]}]
     """
-    epics = []
-
-    epic_pattern = re.compile(
-        r"^##\s+Epic\s+(\d+):\s+(.+?)\s*(?:\[(?:P\d+)\])?\s*(?:\[OWNER:\s*(.+?)\])?\s*(?:\[MODEL:\s*(.+?)\])?\s*(?:[✅🔴⏳].*)?$",
-        re.MULTILINE,
-    )
-
-    epic_matches = list(epic_pattern.finditer(content))
-
-    for idx, match in enumerate(epic_matches):
-        epic_num = int(match.group(1))
-        epic_name = match.group(2).strip()
-        epic_owner = match.group(3).strip() if match.group(3) else None
-        epic_model = match.group(4).strip() if match.group(4) else None
-
-        start_pos = match.end()
-        end_pos = epic_matches[idx + 1].start() if idx + 1 < len(epic_matches) else len(content)
-        epic_content = content[start_pos:end_pos]
-
-        stories = _extract_stories(epic_content, epic_num)
-
-        epics.append({
-            "epic_num": epic_num,
-            "epic_name": epic_name,
-            "owner": epic_owner,
-            "model": epic_model,
-            "stories": stories,
-        })
-
-    return epics
-
-
-def _extract_stories(epic_content: str, epic_num: int) -> list[dict]:
-    """Extract stories from an epic's content block.
-
-    Supports both formats:
-      - Lean: - [ ] Story 1.1: Title
-      - Fat:  - [ ] **Story 1.1:** Title (with description below)
-    """
-    stories = []
-
-    # Match both lean and fat formats
-    story_pattern = re.compile(
-        r"^-\s*\[([ xX])\]\s*(?:\*\*)?Story\s+(\d+\.\d+):?\*?\*?\s*(.+?)$",
-        re.MULTILINE,
-    )
-
-    story_matches = list(story_pattern.finditer(epic_content))
-
-    for idx, match in enumerate(story_matches):
-        checked = match.group(1).lower() == "x"
-        story_id = match.group(2)
-        story_title = match.group(3).strip()
-
-        # Extract description (indented lines until next story or end)
-        desc_start = match.end()
-        desc_end = story_matches[idx + 1].start() if idx + 1 < len(story_matches) else len(epic_content)
-        description = epic_content[desc_start:desc_end].strip()
-
-        stories.append({
-            "id": story_id,
-            "title": story_title,
-            "status": "done" if checked else "pending",
-            "description": description,
-        })
-
-    return stories
+    index = index_content(content)
+    return [
+        {
+            "epic_num": epic["num"],
+            "epic_name": epic["name"],
+            "owner": epic["owner"],
+            "model": epic["model"],
+            "stories": [
+                {
+                    "id": story["id"],
+                    "title": story["title"],
+                    "status": story["status"],
+                    "description": index.description(story),
+                }
+                for story in index.epic_stories(epic)
+            ],
+        }
+        for epic in index.epics
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -391,6 +356,83 @@ def _find_existing_shard(output_dir: Path, story_id: str) -> Path | None:
     return None
 
 
+def _index_story_files(output_dir: Path) -> dict[str, list[Path]]:
+    """Map safe story IDs ('1-1') to all their shard files, from a single directory listing."""
+    shards: dict[str, list[Path]] = {}
+    if not output_dir.is_dir():
+        return shards
+    for name in sorted(os.listdir(output_dir)):
+        if name.startswith("STORY-") and name.endswith(".md") and "_" in name:
+            shards.setdefault(name[len("STORY-"):name.index("_")], []).append(output_dir / name)
+    return shards
+
+
+class StoryManifest:
+    """
+    Cached spec_hash of each story file, keyed by path and validated by
+    size and mtime, so unchanged files are not re-read by generate.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == 1:
+                self._entries = data.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    def spec_hash(self, story_file: Path) -> str | None:
+        """spec_hash from the file's frontmatter, read only if the file changed."""
+        st = story_file.stat()
+        entry = self._entries.get(str(story_file))
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            return entry["spec_hash"]
+        spec_hash = _extract_frontmatter_field(read_frontmatter(story_file, st) or "", "spec_hash")
+        self.record(story_file, spec_hash, st)
+        return spec_hash
+
+    def record(self, story_file: Path, spec_hash: str | None, st: os.stat_result = None):
+        st = st or story_file.stat()
+        with self._lock:
+            self._entries[str(story_file)] = {
+                "size": st.st_size, "mtime_ns": st.st_mtime_ns, "spec_hash": spec_hash,
+            }
+
+    def save(self):
+        # Drop files that no longer exist
+        entries = {k: v for k, v in self._entries.items() if Path(k).exists()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": 1, "files": entries}), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Aviso: manifesto de stories nao salvo: {e}")
+
+
+def _write_story_file(plan: dict, force: bool) -> tuple[Path, str]:
+    """Render a planned story file and write it atomically (temp file + rename)."""
+    story, target, existing = plan["story"], plan["target"], plan["existing"]
+
+    # Preserve Agent Workspace from existing file
+    workspace = ""
+    source_file = existing or target
+    if source_file.exists() and not force:
+        workspace = extract_agent_workspace(source_file)
+
+    new_content = generate_story_content(story, plan["epic"], workspace)
+    tmp = target.with_name(f".{target.name}.tmp")
+    tmp.write_text(new_content, encoding="utf-8")
+    os.replace(tmp, target)
+
+    if existing and existing != target:
+        existing.unlink()
+    return target, story["spec_hash"]
+
+
 # ---------------------------------------------------------------------------
 # Commands
 # ---------------------------------------------------------------------------
@@ -408,14 +450,16 @@ def generate_command(args: argparse.Namespace) -> int:
 
     output_dir = Path(args.output)
 
-    if not lock_mgr.wait_for_lock("stories", agent, max_wait=30):
-        print("Recurso 'stories' bloqueado por outro agente. Tente novamente.")
+    # Only the epic/story being generated is locked: agents on other epics proceed
+    scope = _lock_scope(args)
+    if not lock_mgr.wait_for_lock(scope, agent, max_wait=30):
+        print(f"Recurso '{scope}' bloqueado por outro agente. Tente novamente.")
         return 1
+    lock_mgr.start_heartbeat(scope, agent)
 
-    checkpoint_label = "shard-epic"
+    # Per-scope label: concurrent runs on other epics must not pop this stash
+    checkpoint_label = f"shard-epic {scope}"
     had_checkpoint = False
-    if not args.dry_run:
-        had_checkpoint = git_checkpoint(checkpoint_label)
 
     try:
         content = backlog_path.read_text(encoding="utf-8")
@@ -433,67 +477,66 @@ def generate_command(args: argparse.Namespace) -> int:
         created = 0
         updated = 0
         skipped = 0
+        force = getattr(args, 'force', False)
+
+        # One directory listing and the manifest replace per-story globs and reads
+        shards = _index_story_files(output_dir)
+        manifest = StoryManifest(MANIFEST_FILE)
 
+        plans = []
         for epic in epics:
             for story in epic["stories"]:
                 story = dict(story)
+                story["spec_hash"] = story.get("spec_hash") or compute_story_spec_hash(story)
                 filename = _safe_filename(story["id"], story["title"])
                 target = output_dir / filename
-                existing = _find_existing_shard(output_dir, story["id"])
+                # The canonical file wins over duplicates: only a true rename unlinks a shard
+                candidates = shards.get(story["id"].replace(".", "-"), [])
+                existing = target if target in candidates else next(iter(candidates), None)
+                current_file = existing or (target if target.exists() else None)
+                plans.append({"story": story, "epic": epic, "filename": filename, "target": target,
+                              "existing": existing, "current": current_file})
+
+        # Spec hashes of files not in the manifest are read in parallel
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+            old_hashes = list(pool.map(
+                lambda plan: manifest.spec_hash(plan["current"]) if plan["current"] else None, plans))
+
+        writes = []
+        for plan, old_hash in zip(plans, old_hashes):
+            existing, filename = plan["existing"], plan["filename"]
+            needs_rename = bool(existing and existing.name != filename)
+
+            action = "create"
+            if plan["current"]:
+                if needs_rename:
+                    action = "update"
+                elif old_hash == plan["story"]["spec_hash"] and not force:
+                    action = "skip"
+                else:
+                    action = "update"
 
-                # Preserve Agent Workspace from existing file
-                workspace = ""
-                source_file = existing or target
-                if source_file.exists() and not getattr(args, 'force', False):
-                    workspace = extract_agent_workspace(source_file)
+            if action == "create":
+                created += 1
+            elif action == "update":
+                updated += 1
+            else:
+                skipped += 1
 
-                story_hash = story.get("spec_hash") or compute_story_spec_hash(story)
-                story["spec_hash"] = story_hash
-                new_content = generate_story_content(story, epic, workspace)
+            if args.dry_run:
+                print(f"  [DRY-RUN] {action.upper()}: {filename}")
+            elif action != "skip":
+                writes.append(plan)
 
-                current_file = None
-                if existing and existing.exists():
-                    current_file = existing
-                elif target.exists():
-                    current_file = target
-
-                needs_rename = bool(existing and existing.exists() and existing.name != filename)
-
-                action = "create"
-                if current_file and current_file.exists():
-                    if needs_rename:
-                        action = "update"
-                    else:
-                        old = current_file.read_text(encoding="utf-8")
-                        old_hash = _extract_frontmatter_field(old, "spec_hash")
-                        if old_hash == story_hash and not getattr(args, 'force', False):
-                            action = "skip"
-                        else:
-                            action = "update"
+        if writes:
+            had_checkpoint = _stash_checkpoint(lock_mgr, agent, checkpoint_label, writes)
 
-                if args.dry_run:
-                    print(f"  [DRY-RUN] {action.upper()}: {filename}")
-                    if action == "create":
-                        created += 1
-                    elif action == "update":
-                        updated += 1
-                    else:
-                        skipped += 1
-                    continue
-
-                if action == "skip":
-                    skipped += 1
-                    continue
-
-                if existing and existing.exists() and existing.name != filename:
-                    existing.unlink()
-
-                if action == "update":
-                    updated += 1
-                else:
-                    created += 1
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+            for target, spec_hash in pool.map(lambda plan: _write_story_file(plan, force), writes):
+                manifest.record(target, spec_hash)
 
-                target.write_text(new_content, encoding="utf-8")
+        if not args.dry_run:
+            manifest.save()
 
         total = created + updated + skipped
         print(f"\n📦 Generate {'(dry-run) ' if args.dry_run else ''}concluido!")
@@ -506,13 +549,42 @@ def generate_command(args: argparse.Namespace) -> int:
 
     except Exception as e:
         print(f"Erro durante generate: {e}")
-        if had_checkpoint and not args.dry_run:
+        if had_checkpoint:
             print("Rollback automatico...")
-            git_rollback(checkpoint_label)
+            _stash_rollback(lock_mgr, agent, checkpoint_label)
         return 1
 
     finally:
-        lock_mgr.release_lock("stories", agent)
+        lock_mgr.release_lock(scope, agent)
+
+
+def _stash_checkpoint(lock_mgr: LockManager, agent: str, label: str, writes: list) -> bool:
+    """
+    git_checkpoint limited to the story files this run rewrites, so another
+    agent's files in the same tree are neither stashed nor popped back.
+    The stash stack itself is repo-wide: pushes and pops hold STASH_LOCK.
+    """
+    paths = set()
+    for plan in writes:
+        paths.add(plan["target"])
+        if plan["existing"]:
+            paths.add(plan["existing"])
+    if not lock_mgr.wait_for_lock(STASH_LOCK, agent, max_wait=30):
+        raise RuntimeError(f"Recurso '{STASH_LOCK}' bloqueado por outro agente.")
+    try:
+        return git_checkpoint(label, sorted(paths))
+    finally:
+        lock_mgr.release_lock(STASH_LOCK, agent)
+
+
+def _stash_rollback(lock_mgr: LockManager, agent: str, label: str) -> bool:
+    if not lock_mgr.wait_for_lock(STASH_LOCK, agent, max_wait=30):
+        print(f"Rollback nao executado: recurso '{STASH_LOCK}' bloqueado. Use: recovery.py rollback '{label}'")
+        return False
+    try:
+        return git_rollback(label)
+    finally:
+        lock_mgr.release_lock(STASH_LOCK, agent)
 
 
 def migrate_command(args: argparse.Namespace) -> int:
@@ -648,6 +720,20 @@ def status_command(args: argparse.Namespace) -> int:
         print("BACKLOG.md nao encontrado.")
         return 1
 
+    # Shared lock: several readers at once, but never mid-generate
+    lock_mgr = LockManager()
+    agent = get_agent_source()
+    scope = _lock_scope(args)
+    if not lock_mgr.wait_for_lock(scope, agent, max_wait=30, mode=LOCK_SHARED):
+        print(f"Recurso '{scope}' bloqueado por outro agente. Tente novamente.")
+        return 1
+    try:
+        return _status_report(backlog_path, output_dir, args)
+    finally:
+        lock_mgr.release_lock(scope, agent)
+
+
+def _status_report(backlog_path: Path, output_dir: Path, args: argparse.Namespace) -> int:
     content = backlog_path.read_text(encoding="utf-8")
     epics = parse_backlog(content)
     epics = _filter_epics(epics, args)
@@ -780,6 +866,15 @@ def _filter_epics(epics: list[dict], args: argparse.Namespace) -> list[dict]:
     return epics
 
 
+def _lock_scope(args: argparse.Namespace) -> str:
+    """Lock resource covering --story / --epic: stories[/epic-N[/story-N.M]]."""
+    if getattr(args, 'story', None):
+        return f"stories/epic-{int(args.story.split('.')[0])}/story-{args.story}"
+    if getattr(args, 'epic', None):
+        return f"stories/epic-{int(args.epic)}"
+    return "stories"
+
+
 def _extract_frontmatter_field(content: str, field: str) -> str | None:
     """Extract a field value from YAML frontmatter."""
     m = re.search(rf'^{field}:\s*"?([^"\n]+)"?\s*$', content, re.MULTILINE)
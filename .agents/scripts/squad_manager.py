@@ -6,7 +6,7 @@ Manages squads: reusable packages of agents + skills + workflows.
 
 Usage:
     python3 .agents/scripts/squad_manager.py create <name> [--template basic|specialist]
-    python3 .agents/scripts/squad_manager.py list
+    python3 .agents/scripts/squad_manager.py list [--json]
     python3 .agents/scripts/squad_manager.py validate <name>
     python3 .agents/scripts/squad_manager.py activate <name>
     python3 .agents/scripts/squad_manager.py deactivate <name>
@@ -17,16 +17,16 @@ Usage:
 
 import sys
 import os
+import json
+import stat
 import shutil
 import argparse
 import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+sys.path.insert(0, str(Path(__file__).parent))
+from _squad_manifest import load_manifest
 
 
 # Paths
@@ -35,56 +35,14 @@ SQUADS_DIR = FRAMEWORK_ROOT / "squads"
 TEMPLATES_DIR = SQUADS_DIR / ".templates"
 AGENTS_DIR = FRAMEWORK_ROOT / ".agents"
 
+# Symlink checks: thread pool size, and minimum checks per worker thread
+STATUS_WORKERS = 8
+STATUS_PARALLEL_MIN = 64
+
 
 def _parse_yaml(filepath: Path) -> dict:
-    """Parse a YAML file. Falls back to basic parsing if PyYAML not installed."""
-    text = filepath.read_text(encoding="utf-8")
-    if HAS_YAML:
-        return yaml.safe_load(text) or {}
-    # Minimal YAML parser for squad.yaml (flat keys + simple lists)
-    result = {}
-    current_key = None
-    current_list = None
-    for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if stripped.startswith("- "):
-            if current_list is not None:
-                current_list.append(stripped[2:].strip().strip('"').strip("'"))
-            continue
-        if ":" in stripped:
-            key, _, val = stripped.partition(":")
-            key = key.strip()
-            val = val.strip().strip('"').strip("'")
-            if val:
-                # Navigate nested keys
-                indent = len(line) - len(line.lstrip())
-                if indent == 0:
-                    result[key] = val
-                    current_key = key
-                    current_list = None
-                else:
-                    if current_key and isinstance(result.get(current_key), dict):
-                        result[current_key][key] = val
-                    else:
-                        result[key] = val
-                    current_list = None
-            else:
-                indent = len(line) - len(line.lstrip())
-                if indent == 0:
-                    result[key] = {}
-                    current_key = key
-                    current_list = None
-                else:
-                    # This is a nested key that might contain a list
-                    if current_key and isinstance(result.get(current_key), dict):
-                        result[current_key][key] = []
-                        current_list = result[current_key][key]
-                    else:
-                        result[key] = []
-                        current_list = result[key]
-    return result
+    """Parse a squad.yaml (libyaml C loader when available, see _squad_manifest)."""
+    return load_manifest(filepath)
 
 
 def _get_squad_dir(name: str) -> Path:
@@ -115,48 +73,86 @@ def _get_components(manifest: dict) -> dict:
 
 def _check_symlink(link_path: Path, squad_dir: Path) -> str:
     """Check a single symlink status. Returns: 'ok', 'missing', 'drift', 'core'."""
-    if not link_path.exists() and not link_path.is_symlink():
+    return _link_status(str(link_path), str(squad_dir.resolve()))
+
+
+def _link_status(link_path: str, squad_root: str) -> str:
+    """Status of one link against an already resolved squad directory."""
+    try:
+        st = os.lstat(link_path)
+    except OSError:
         return "missing"
-    if link_path.is_symlink():
-        try:
-            target = link_path.resolve()
-            if str(squad_dir.resolve()) in str(target):
-                return "ok"
-            else:
-                return "drift"
-        except OSError:
-            return "drift"
-    # Exists but is NOT a symlink = core file, not ours
-    return "core"
+    if not stat.S_ISLNK(st.st_mode):
+        # Exists but is NOT a symlink = core file, not ours
+        return "core"
+    try:
+        target = os.path.realpath(link_path)
+    except (OSError, RuntimeError):
+        return "drift"
+    return "ok" if squad_root in target else "drift"
 
 
-def _compute_squad_status(squad_dir: Path, components: dict) -> dict:
-    """Compute granular squad status by checking ALL components.
+def _link_statuses(keys: list) -> list:
+    return [_link_status(link_path, squad_root) for link_path, squad_root in keys]
 
-    Returns dict with:
-        state: 'inactive' | 'partial' | 'active' | 'drift'
-        total: int (expected symlinks, excluding core-blocked)
-        linked: int (correctly linked)
-        missing: list of missing component paths
-        drifted: list of drifted component paths
-        core_blocked: list of components blocked by core files
+
+def _component_links(components: dict) -> list:
+    """(comp_type, comp_name, link_path) for every component that gets a symlink."""
+    links = []
+    for agent_name in components["agents"]:
+        links.append(("agents", agent_name, AGENTS_DIR / "agents" / f"{agent_name}.md"))
+    for skill_name in components["skills"]:
+        links.append(("skills", skill_name, AGENTS_DIR / "skills" / skill_name))
+    for wf_name in components["workflows"]:
+        links.append(("workflows", wf_name, AGENTS_DIR / "workflows" / f"{wf_name}.md"))
+    return links
+
+
+def compute_statuses(squads: list) -> list:
+    """Compute the status of many squads at once.
+
+    squads is a list of (squad_dir, components). Every symlink of every
+    squad is collected in one pass, each squad directory is resolved once,
+    and the distinct (link, squad) checks run in a thread pool (lstat and
+    realpath are I/O-bound). Returns one _compute_squad_status dict per
+    squad, in the same order.
     """
+    plans = []
+    pending = {}
+    for squad_dir, components in squads:
+        squad_root = str(squad_dir.resolve())
+        links = [(comp_type, comp_name, (str(link_path), squad_root))
+                 for comp_type, comp_name, link_path in _component_links(components)]
+        for _, _, key in links:
+            pending[key] = None
+        plans.append(links)
+
+    keys = list(pending)
+    workers = min(STATUS_WORKERS, len(keys) // STATUS_PARALLEL_MIN)
+    if workers < 2:
+        results = _link_statuses(keys)
+    else:
+        # One contiguous chunk per worker: per-link tasks cost more than the syscalls
+        size = -(-len(keys) // workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(_link_statuses, [keys[i:i + size] for i in range(0, len(keys), size)])
+            results = [status for chunk in chunks for status in chunk]
+    status_of = dict(zip(keys, results))
+
+    return [_summarize_status([(comp_type, comp_name, status_of[key])
+                               for comp_type, comp_name, key in links])
+            for links in plans]
+
+
+def _summarize_status(checks: list) -> dict:
+    """Fold (comp_type, comp_name, link status) checks into a squad status."""
     missing = []
     drifted = []
     core_blocked = []
     linked = 0
     total = 0
 
-    checks = []
-    for agent_name in components["agents"]:
-        checks.append(("agents", agent_name, AGENTS_DIR / "agents" / f"{agent_name}.md"))
-    for skill_name in components["skills"]:
-        checks.append(("skills", skill_name, AGENTS_DIR / "skills" / skill_name))
-    for wf_name in components["workflows"]:
-        checks.append(("workflows", wf_name, AGENTS_DIR / "workflows" / f"{wf_name}.md"))
-
-    for comp_type, comp_name, link_path in checks:
-        status = _check_symlink(link_path, squad_dir)
+    for comp_type, comp_name, status in checks:
         if status == "core":
             core_blocked.append(f"{comp_type}/{comp_name}")
             continue
@@ -189,6 +185,55 @@ def _compute_squad_status(squad_dir: Path, components: dict) -> dict:
     }
 
 
+def _compute_squad_status(squad_dir: Path, components: dict) -> dict:
+    """Compute granular squad status by checking ALL components.
+
+    Returns dict with:
+        state: 'inactive' | 'partial' | 'active' | 'drift'
+        total: int (expected symlinks, excluding core-blocked)
+        linked: int (correctly linked)
+        missing: list of missing component paths
+        drifted: list of drifted component paths
+        core_blocked: list of components blocked by core files
+    """
+    return compute_statuses([(squad_dir, components)])[0]
+
+
+def squad_report() -> dict:
+    """Structured status of every installed squad (used by `list`)."""
+    squads = sorted(
+        d for d in SQUADS_DIR.iterdir()
+        if d.is_dir() and not d.name.startswith(".")
+    ) if SQUADS_DIR.exists() else []
+
+    entries = []
+    valid = []
+    for squad_dir in squads:
+        manifest_path = squad_dir / "squad.yaml"
+        if not manifest_path.exists():
+            entries.append({"name": squad_dir.name, "version": None, "state": "invalid",
+                            "error": "No manifest"})
+            continue
+        manifest = _parse_yaml(manifest_path)
+        components = _get_components(manifest)
+        entry = {
+            "name": squad_dir.name,
+            "version": manifest.get("version", "?"),
+            "components": {key: list(components[key]) for key in ("agents", "skills", "workflows")},
+        }
+        entries.append(entry)
+        valid.append((entry, squad_dir, components))
+
+    statuses = compute_statuses([(squad_dir, components) for _, squad_dir, components in valid])
+    for (entry, _, _), info in zip(valid, statuses):
+        entry.update(info)
+
+    summary = {"squads": len(entries)}
+    for state in ("active", "partial", "inactive", "drift", "invalid"):
+        summary[state] = sum(1 for e in entries if e["state"] == state)
+    return {"squads": entries, "summary": summary}
+
+
 def cmd_create(name: str, template: str = "basic"):
     """Create a new squad from template."""
     squad_dir = _get_squad_dir(name)
@@ -219,18 +264,18 @@ def cmd_create(name: str, template: str = "basic"):
     print(f"  4. Run: python3 .agents/scripts/squad_manager.py activate {name}")
 
 
-def cmd_list():
+def cmd_list(as_json: bool = False):
     """List all squads with status."""
-    if not SQUADS_DIR.exists():
+    if not SQUADS_DIR.exists() and not as_json:
         print("No squads directory found.")
         return
 
-    squads = [
-        d for d in SQUADS_DIR.iterdir()
-        if d.is_dir() and not d.name.startswith(".")
-    ]
+    report = squad_report()
+    if as_json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
 
-    if not squads:
+    if not report["squads"]:
         print("No squads found.")
         print(f"\nCreate one with: python3 .agents/scripts/squad_manager.py create <name>")
         return
@@ -238,20 +283,17 @@ def cmd_list():
     print(f"{'Name':<25} {'Version':<10} {'Components':<20} {'Status':<15}")
     print("-" * 70)
 
-    for squad_dir in sorted(squads):
-        manifest_path = squad_dir / "squad.yaml"
-        if not manifest_path.exists():
-            print(f"{squad_dir.name:<25} {'?':<10} {'No manifest':<20} {'invalid':<15}")
+    for info in report["squads"]:
+        if info["state"] == "invalid":
+            print(f"{info['name']:<25} {'?':<10} {info['error']:<20} {'invalid':<15}")
             continue
 
-        manifest = _parse_yaml(manifest_path)
-        components = _get_components(manifest)
+        components = info["components"]
         n_agents = len(components["agents"])
         n_skills = len(components["skills"])
         n_workflows = len(components["workflows"])
         comp_str = f"{n_agents}A {n_skills}S {n_workflows}W"
 
-        info = _compute_squad_status(squad_dir, components)
         state = info["state"]
         if state == "partial":
             status_str = f"partial ({info['linked']}/{info['total']})"
@@ -260,8 +302,7 @@ def cmd_list():
         else:
             status_str = state
 
-        version = manifest.get("version", "?")
-        print(f"{squad_dir.name:<25} {version:<10} {comp_str:<20} {status_str:<15}")
+        print(f"{info['name']:<25} {info['version']:<10} {comp_str:<20} {status_str:<15}")
 
 
 def cmd_validate(name: str):
@@ -673,7 +714,7 @@ def main():
         epilog="""
 Commands:
   create <name>          Create new squad from template
-  list                   List all squads (with granular status)
+  list [--json]          List all squads (with granular status)
   validate <name>        Validate squad integrity
   activate <name>        Activate squad (create symlinks)
   deactivate <name>      Deactivate squad (remove symlinks)
@@ -691,6 +732,8 @@ Commands:
                         help="Template to use for create (default: basic)")
     parser.add_argument("--apply", action="store_true", default=False,
                         help="Execute repair actions (default: dry-run)")
+    parser.add_argument("--json", action="store_true", default=False,
+                        help="Structured JSON report (list)")
 
     args = parser.parse_args()
 
@@ -698,7 +741,7 @@ Commands:
     SQUADS_DIR.mkdir(exist_ok=True)
 
     if args.command == "list":
-        cmd_list()
+        cmd_list(as_json=args.json)
     elif args.command in ("validate", "activate", "auto-activate", "deactivate",
                           "info", "export", "create", "repair"):
         if not args.name:
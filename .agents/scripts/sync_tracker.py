@@ -15,7 +15,6 @@ Funcionalidades:
 """
 
 import sys
-import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -24,6 +23,7 @@ from typing import List, Dict, Optional
 sys.path.insert(0, str(Path(__file__).parent))
 from lock_manager import LockManager
 from platform_compat import find_logs_dir, get_last_activity_by_agent
+from _git_queries import git_log
 
 
 def get_active_locks() -> Dict[str, dict]:
@@ -55,38 +55,31 @@ def get_recent_backlog_commits(days_back: int = 7) -> List[dict]:
     Returns:
         Lista de commits com author, date, message
     """
-    try:
-        result = subprocess.run(
-            [
-                "git", "log",
-                f"--since={days_back} days ago",
-                "--pretty=format:%H|%an|%ai|%s",
-                "--", "docs/BACKLOG.md", "BACKLOG.md"
-            ],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        commits = []
-        for line in result.stdout.strip().split('\n'):
-            if not line:
-                continue
-
-            parts = line.split('|', 3)
-            if len(parts) == 4:
-                commits.append({
-                    'hash': parts[0],
-                    'author': parts[1],
-                    'date': parts[2],
-                    'message': parts[3]
-                })
-
-        return commits
-
-    except subprocess.CalledProcessError:
+    # Histórico do BACKLOG vem do cache por HEAD; a janela é filtrada aqui
+    output = git_log(
+        "--pretty=format:%H|%an|%ai|%ct|%s",
+        "--", "docs/BACKLOG.md", "BACKLOG.md"
+    )
+    if not output:
         return []
 
+    since = datetime.now().timestamp() - days_back * 86400
+    commits = []
+    for line in output.strip().split('\n'):
+        if not line:
+            continue
+
+        parts = line.split('|', 4)
+        if len(parts) == 5 and int(parts[3]) >= since:
+            commits.append({
+                'hash': parts[0],
+                'author': parts[1],
+                'date': parts[2],
+                'message': parts[4]
+            })
+
+    return commits
+
 
 def detect_concurrent_epic_work(days_back: int = 7) -> List[dict]:
     """
@@ -14,9 +14,15 @@ Usage:
     python3 .agents/scripts/validate_installation.py --mode strict
 """
 
+import os
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from _squad_manifest import load_manifest, parse_minimal, PARSE_ERRORS
 
 # ---------------------------------------------------------------------------
 # Core Manifests — single source of truth
@@ -116,7 +122,14 @@ CORE_WORKFLOWS = {
 }  # 22
 
 CORE_SCRIPTS = {
+    "_backlog_index.py",
     "_check_runner.py",
+    "_frontmatter.py",
+    "_git_queries.py",
+    "_scan_engine.py",
+    "_session_store.py",
+    "_squad_manifest.py",
+    "audit_suite.py",
     "auto_finish.py",
     "auto_preview.py",
     "auto_session.py",
@@ -138,7 +151,7 @@ CORE_SCRIPTS = {
     "validate_installation.py",
     "validate_traceability.py",
     "verify_all.py",
-}  # 25
+}  # 29
 
 
 # ---------------------------------------------------------------------------
@@ -186,7 +199,6 @@ def load_squad_expected(root: Path) -> dict[str, set[str]]:
         if not manifest.exists():
             continue
 
-        # Simple YAML parser (avoids PyYAML dependency)
         data = _parse_squad_yaml(manifest)
         for domain in ("agents", "skills", "workflows", "scripts"):
             for item in data.get(domain, []):
@@ -203,91 +215,82 @@ def load_squad_expected(root: Path) -> dict[str, set[str]]:
 
 
 def _parse_squad_yaml(path: Path) -> dict[str, list[str]]:
-    """Minimal YAML parser for squad.yaml components section."""
-    result: dict[str, list[str]] = {}
-    current_section = None
-    in_components = False
-
-    for line in path.read_text().splitlines():
-        stripped = line.strip()
-
-        if stripped == "components:":
-            in_components = True
-            continue
-
-        if in_components:
-            # End of components block (new top-level key)
-            if stripped and not stripped.startswith("-") and not stripped.startswith("#"):
-                if not line.startswith(" ") and not line.startswith("\t"):
-                    in_components = False
-                    current_section = None
-                    continue
-
-            # Sub-section header (e.g. "agents:")
-            if stripped.endswith(":") and not stripped.startswith("-"):
-                current_section = stripped[:-1].strip()
-                result[current_section] = []
-                continue
-
-            # List item
-            if stripped.startswith("- ") and current_section:
-                result[current_section].append(stripped[2:].strip())
-
-    return result
+    """Components section of a squad.yaml (domain -> item names)."""
+    try:
+        manifest = load_manifest(path)
+    except PARSE_ERRORS as e:
+        # One malformed squad must not abort the whole validation
+        print(f"  WARN {path}: invalid YAML, falling back to the minimal parser ({e.__class__.__name__})",
+              file=sys.stderr)
+        manifest = parse_minimal(path.read_text(encoding="utf-8", errors="replace"))
+    components = manifest.get("components") or {}
+    if not isinstance(components, dict):
+        return {}
+    return {domain: [str(item) for item in items]
+            for domain, items in components.items() if isinstance(items, list)}
+
+
+def scan_domain(
+    directory: Path,
+    suffix: Optional[str],
+    core_set: set[str],
+) -> tuple[set[str], list[str], list[str]]:
+    """
+    Scan a domain directory in one os.scandir pass.
 
+    suffix selects files by extension (".md", ".py"); None selects skill
+    directories (those with a SKILL.md). Entry types come from the DirEntry
+    cache and each symlink is resolved once.
 
-def scan_directory(directory: Path, pattern: str, name_extractor) -> tuple[set[str], list[str]]:
-    """Scan a directory and return (found_names, broken_symlinks)."""
+    Returns:
+        (found_names, broken_symlinks, shadowed_core)
+    """
     found = set()
     broken = []
-    if not directory.exists():
-        return found, broken
+    shadowed = []
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return found, broken, shadowed
+
+    for entry in entries:
+        target = os.path.realpath(entry.path) if entry.is_symlink() else None
+        alive = target is None or os.path.exists(target)
+
+        if suffix is not None:
+            name = entry.name if Path(entry.name).suffix == suffix else None
+        elif alive and entry.is_dir() and os.path.exists(os.path.join(entry.path, "SKILL.md")):
+            name = entry.name
+        else:
+            name = None
 
-    for item in sorted(directory.iterdir()):
-        # Check for broken symlinks first
-        if item.is_symlink() and not item.resolve().exists():
-            broken.append(str(item.relative_to(directory.parent.parent.parent)))
-            continue
-        name = name_extractor(item)
-        if name and item.match(pattern):
+        if not alive:
+            broken.append(str(Path(entry.path).relative_to(directory.parent.parent.parent)))
+        elif name:
             found.add(name)
 
-    return found, broken
-
-
-def detect_shadowed_core(directory: Path, core_set: set[str], name_extractor) -> list[str]:
-    """Detect core items that are symlinks pointing to non-core origins (squad overrides)."""
-    shadowed = []
-    if not directory.exists():
-        return shadowed
-
-    for item in sorted(directory.iterdir()):
-        name = name_extractor(item)
-        if name and name in core_set and item.is_symlink():
-            target = str(item.resolve())
-            # Core items should be regular files, not symlinks.
-            # Platform symlinks (.claude/*, .codex/*) are NOT in this directory,
-            # so any symlink here is a squad override.
+        # Core items should be regular files, not symlinks.
+        # Platform symlinks (.claude/*, .codex/*) are NOT in this directory,
+        # so any symlink here is a squad override.
+        if name and name in core_set and target is not None:
             shadowed.append(f"{name} -> {target}")
 
-    return shadowed
+    return found, broken, shadowed
 
 
 def validate_domain(
     label: str,
-    directory: Path,
-    pattern: str,
+    scan: tuple[set[str], list[str], list[str]],
     core_set: set[str],
     squad_expected: set[str],
-    name_extractor,
     result: ValidationResult,
     verbose: bool,
 ):
-    """Validate a single domain (agents, skills, workflows, scripts)."""
+    """Report a single scanned domain (agents, skills, workflows, scripts)."""
     print(f"  [{label}]")
 
-    actual, broken = scan_directory(directory, pattern, name_extractor)
-    shadowed = detect_shadowed_core(directory, core_set, name_extractor)
+    actual, broken, shadowed = scan
 
     # Set operations
     missing = sorted(core_set - actual)
@@ -335,6 +338,15 @@ def validate_domain(
     print()
 
 
+# (label, directory under .agents/, suffix or None for skill dirs, core set, squad key)
+DOMAINS = [
+    ("Agents", "agents", ".md", CORE_AGENTS, "agents"),
+    ("Skills", "skills", None, CORE_SKILLS, "skills"),
+    ("Workflows", "workflows", ".md", CORE_WORKFLOWS, "workflows"),
+    ("Scripts", "scripts", ".py", CORE_SCRIPTS, "scripts"),
+]
+
+
 # ---------------------------------------------------------------------------
 # Main validation
 # ---------------------------------------------------------------------------
@@ -352,56 +364,27 @@ def validate_installation(verbose: bool = False, mode: str = "warn"):
 
     result = ValidationResult()
 
-    # Load squad whitelist
-    squad_expected = load_squad_expected(root)
+    # Squad whitelist and all domains are scanned concurrently; reports stay in order
+    with ThreadPoolExecutor(max_workers=len(DOMAINS) + 1) as pool:
+        squad_future = pool.submit(load_squad_expected, root)
+        scans = [pool.submit(scan_domain, agents_dir / subdir, suffix, core_set)
+                 for _, subdir, suffix, core_set, _ in DOMAINS]
+        squad_expected = squad_future.result()
+        scans = [scan.result() for scan in scans]
 
     # --- 1. Core Integrity ---
     print("[1/7] Core Integrity")
     print("-" * 64)
 
-    validate_domain(
-        label="Agents",
-        directory=agents_dir / "agents",
-        pattern="*.md",
-        core_set=CORE_AGENTS,
-        squad_expected=squad_expected["agents"],
-        name_extractor=lambda p: p.name if p.suffix == ".md" else None,
-        result=result,
-        verbose=verbose,
-    )
-
-    validate_domain(
-        label="Skills",
-        directory=agents_dir / "skills",
-        pattern="*",
-        core_set=CORE_SKILLS,
-        squad_expected=squad_expected["skills"],
-        name_extractor=lambda p: p.name if p.is_dir() and (p / "SKILL.md").exists() else None,
-        result=result,
-        verbose=verbose,
-    )
-
-    validate_domain(
-        label="Workflows",
-        directory=agents_dir / "workflows",
-        pattern="*.md",
-        core_set=CORE_WORKFLOWS,
-        squad_expected=squad_expected["workflows"],
-        name_extractor=lambda p: p.name if p.suffix == ".md" else None,
-        result=result,
-        verbose=verbose,
-    )
-
-    validate_domain(
-        label="Scripts",
-        directory=script_dir,
-        pattern="*.py",
-        core_set=CORE_SCRIPTS,
-        squad_expected=squad_expected["scripts"],
-        name_extractor=lambda p: p.name if p.suffix == ".py" else None,
-        result=result,
-        verbose=verbose,
-    )
+    for (label, _, _, core_set, squad_key), scan in zip(DOMAINS, scans):
+        validate_domain(
+            label=label,
+            scan=scan,
+            core_set=core_set,
+            squad_expected=squad_expected[squad_key],
+            result=result,
+            verbose=verbose,
+        )
 
     # --- 2. Instruction Files ---
     print("[2/7] Instruction Files")
@@ -546,7 +529,8 @@ def validate_installation(verbose: bool = False, mode: str = "warn"):
     print("=" * 64)
 
     # Counts
-    print(f"  Core expected: {21} agents | {41} skills | {22} workflows | {22} scripts")
+    print(f"  Core expected: {len(CORE_AGENTS)} agents | {len(CORE_SKILLS)} skills | "
+          f"{len(CORE_WORKFLOWS)} workflows | {len(CORE_SCRIPTS)} scripts")
     print()
 
     has_issues = False
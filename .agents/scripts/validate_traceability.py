@@ -12,13 +12,18 @@ Uso:
 
 import os
 import re
+import sys
 import json
+import bisect
 import argparse
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 
+sys.path.insert(0, str(Path(__file__).parent))
+from _backlog_index import load_backlog
+
 # Paths
 DOCS_DIR = Path("docs")
 PLANNING_DIR = DOCS_DIR / "planning"
@@ -126,40 +131,107 @@ def extract_stories(backlog_content: str) -> List[Dict]:
     return stories
 
 
-def check_story_has_ac(backlog_content: str, story_id: str) -> bool:
-    """Verifica se uma story tem Acceptance Criteria"""
-    # Encontra a seção da story
-    story_pattern = rf'Story\s+{story_id.replace("Story-", "")}[:\s]+'
-    match = re.search(story_pattern, backlog_content, re.IGNORECASE)
+# Menção de story que abre uma seção ("Story 1.1:") e fronteiras de seção
+STORY_MENTION_PATTERN = re.compile(r'Story\s+(\d+\.\d+)[:\s]+', re.IGNORECASE)
+SECTION_BOUNDARY_PATTERN = re.compile(r'(###?\s*Story|##\s*Epic)')
+STORY_LINE_PATTERN = re.compile(r'Story\s+(\d+\.\d+)', re.IGNORECASE)
+# Menções de RF no backlog em minúsculas (rf-01, rf01, rf--01...)
+RF_TOKEN_PATTERN = re.compile(r'rf-*\d+')
 
-    if not match:
-        return False
+AC_PATTERNS = [
+    re.compile(r'Critérios?\s+de\s+Aceite', re.IGNORECASE),
+    re.compile(r'Acceptance\s+Criteria', re.IGNORECASE),
+    re.compile(r'Given\s+.+When\s+.+Then', re.IGNORECASE),
+    re.compile(r'DADO\s+.+QUANDO\s+.+ENTÃO', re.IGNORECASE),
+    re.compile(r'-\s*\[\s*\]\s*.+', re.IGNORECASE),  # Checkboxes como AC
+]
 
-    # Pega conteúdo após a story até a próxima story ou epic
-    start_pos = match.end()
-    next_section = re.search(r'(###?\s*Story|##\s*Epic)', backlog_content[start_pos:])
-    end_pos = start_pos + next_section.start() if next_section else len(backlog_content)
 
-    section_content = backlog_content[start_pos:end_pos]
+@dataclass
+class StoryIndex:
+    """
+    Índice do backlog construído em uma única passada:
+    - sections: story ID -> (início, fim) da seção após a primeira menção
+    - rf_mentions: menção de RF -> [(linha, story corrente ou None)]
+    Cobertura e detecção de AC viram consultas em vez de novas buscas.
+    """
+    sections: Dict[str, List[int]]
+    rf_mentions: Dict[str, List[List]]
+
+    def __post_init__(self):
+        self._tokens = sorted(self.rf_mentions)
+
+    def _tokens_with_prefix(self, prefix: str):
+        # Tokens são maximais: "rf-1" ocorre no texto onde um token começa com ele
+        i = bisect.bisect_left(self._tokens, prefix)
+        while i < len(self._tokens) and self._tokens[i].startswith(prefix):
+            yield self._tokens[i]
+            i += 1
+
+    def mentions(self, pattern: str) -> bool:
+        """Se o RF (em minúsculas) aparece em algum lugar do backlog."""
+        return next(self._tokens_with_prefix(pattern), None) is not None
+
+    def stories_mentioning(self, pattern: str) -> List[str]:
+        """Stories correntes nas linhas que mencionam o RF, na ordem do backlog."""
+        lines = {}
+        for token in self._tokens_with_prefix(pattern):
+            for line, story in self.rf_mentions[token]:
+                lines[line] = story
+        return [lines[line] for line in sorted(lines) if lines[line]]
+
+
+def build_story_index(backlog_content: str) -> StoryIndex:
+    """Indexa seções de stories e menções de RF em uma passada pelo backlog."""
+    boundaries = [m.start() for m in SECTION_BOUNDARY_PATTERN.finditer(backlog_content)]
+    sections = {}
+    for match in STORY_MENTION_PATTERN.finditer(backlog_content):
+        story_id = match.group(1)
+        if story_id in sections:
+            continue
+        # Conteúdo após a story até a próxima story ou epic
+        start_pos = match.end()
+        i = bisect.bisect_left(boundaries, start_pos)
+        end_pos = boundaries[i] if i < len(boundaries) else len(backlog_content)
+        sections[story_id] = [start_pos, end_pos]
+
+    rf_mentions: Dict[str, List[List]] = {}
+    current_story = None
+    for line_no, line in enumerate(backlog_content.split('\n')):
+        story_match = STORY_LINE_PATTERN.search(line)
+        if story_match:
+            current_story = f"Story-{story_match.group(1)}"
+        for token in set(RF_TOKEN_PATTERN.findall(line.lower())):
+            rf_mentions.setdefault(token, []).append([line_no, current_story])
+
+    return StoryIndex(sections=sections, rf_mentions=rf_mentions)
+
+
+def story_index_data(backlog_content: str) -> Dict:
+    """StoryIndex em formato JSON, para o cache do índice de backlog."""
+    return asdict(build_story_index(backlog_content))
+
+
+def check_story_has_ac(backlog_content: str, story_id: str, index: Optional[StoryIndex] = None) -> bool:
+    """Verifica se uma story tem Acceptance Criteria"""
+    index = index or build_story_index(backlog_content)
 
-    # Verifica presença de AC
-    ac_patterns = [
-        r'Critérios?\s+de\s+Aceite',
-        r'Acceptance\s+Criteria',
-        r'Given\s+.+When\s+.+Then',
-        r'DADO\s+.+QUANDO\s+.+ENTÃO',
-        r'-\s*\[\s*\]\s*.+',  # Checkboxes como AC
-    ]
+    # Encontra a seção da story
+    section = index.sections.get(story_id.replace("Story-", ""))
+    if not section:
+        return False
 
-    for pattern in ac_patterns:
-        if re.search(pattern, section_content, re.IGNORECASE):
-            return True
+    section_content = backlog_content[section[0]:section[1]]
 
-    return False
+    # Verifica presença de AC
+    return any(pattern.search(section_content) for pattern in AC_PATTERNS)
 
 
-def map_requirements_to_stories(requirements: List[Dict], backlog_content: str) -> None:
+def map_requirements_to_stories(requirements: List[Dict], backlog_content: str,
+                                index: Optional[StoryIndex] = None) -> None:
     """Mapeia quais stories cobrem quais requisitos"""
+    index = index or build_story_index(backlog_content)
+
     for req in requirements:
         # Busca menções ao RF no backlog
         rf_patterns = [
@@ -170,18 +242,34 @@ def map_requirements_to_stories(requirements: List[Dict], backlog_content: str)
         ]
 
         for pattern in rf_patterns:
-            if pattern.lower() in backlog_content.lower():
-                req['covered'] = True
-                # Encontra qual story menciona
-                lines = backlog_content.split('\n')
-                current_story = None
-                for line in lines:
-                    story_match = re.search(r'Story\s+(\d+\.\d+)', line, re.IGNORECASE)
-                    if story_match:
-                        current_story = f"Story-{story_match.group(1)}"
-                    if pattern.lower() in line.lower() and current_story:
-                        if current_story not in req['stories']:
-                            req['stories'].append(current_story)
+            pattern = pattern.lower()
+            if RF_TOKEN_PATTERN.fullmatch(pattern):
+                if not index.mentions(pattern):
+                    continue
+                stories = index.stories_mentioning(pattern)
+            else:
+                if pattern not in backlog_content.lower():
+                    continue
+                stories = _stories_mentioning_scan(backlog_content, pattern)
+
+            req['covered'] = True
+            # Stories que mencionam o RF
+            for story in stories:
+                if story not in req['stories']:
+                    req['stories'].append(story)
+
+
+def _stories_mentioning_scan(backlog_content: str, pattern: str) -> List[str]:
+    """Busca linha a linha, para menções fora do formato indexado (rf-NN)."""
+    stories = []
+    current_story = None
+    for line in backlog_content.split('\n'):
+        story_match = STORY_LINE_PATTERN.search(line)
+        if story_match:
+            current_story = f"Story-{story_match.group(1)}"
+        if pattern in line.lower() and current_story:
+            stories.append(current_story)
+    return stories
 
 
 def find_orphan_stories(stories: List[Dict], requirements: List[Dict]) -> List[str]:
@@ -475,18 +563,23 @@ def main():
 
     # Lê conteúdo dos arquivos (tolerante a ausência)
     prd_content = read_file(PRD_PATH) or ""
-    backlog_content = read_file(BACKLOG_PATH) or ""
+    backlog_index = load_backlog(BACKLOG_PATH)
+    backlog_content = backlog_index.content if backlog_index else ""
 
-    # Extrai dados
+    # Extrai dados (stories do backlog vêm do índice compartilhado, em cache)
     requirements = extract_requirements(prd_content) if prd_content else []
-    stories = extract_stories(backlog_content) if backlog_content else []
+    stories = backlog_index.derived("traceability_stories", extract_stories) if backlog_content else []
+
+    # Índice de seções e menções de RF, construído uma vez (em cache com o backlog)
+    story_index = (StoryIndex(**backlog_index.derived("traceability_index", story_index_data))
+                   if backlog_index else build_story_index(""))
 
     # Mapeia cobertura
-    map_requirements_to_stories(requirements, backlog_content)
+    map_requirements_to_stories(requirements, backlog_content, story_index)
 
     # Verifica AC em cada story
     for story in stories:
-        story['has_acceptance_criteria'] = check_story_has_ac(backlog_content, story['id'])
+        story['has_acceptance_criteria'] = check_story_has_ac(backlog_content, story['id'], story_index)
 
     # Encontra órfãs
     orphan_stories = find_orphan_stories(stories, requirements)
@@ -9,6 +9,8 @@ Use this before deployment or major releases.
 Usage:
     python scripts/verify_all.py .
     python scripts/verify_all.py . --stop-on-fail
+    python scripts/verify_all.py . --jobs 1          # Sequential run
+    python scripts/verify_all.py . --no-cache        # Ignore cached results
 
 Includes ALL checks:
     P0: Framework Integrity (Installation Validation)
@@ -25,7 +27,9 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent))
 from _check_runner import (
     print_header, print_error, print_warning,
-    run_script_check, run_check, print_summary, Colors
+    check_spec, script_check_spec, run_checks_parallel,
+    first_required_failure, print_summary, ResultCache, CACHE_FILE,
+    FRAMEWORK_INPUTS, TRACEABILITY_INPUTS, WEB_SOURCE_INPUTS, Colors, DEFAULT_JOBS
 )
 
 # Complete verification suite organized by priority category
@@ -57,6 +61,16 @@ VERIFICATION_SUITE = [
     },
 ]
 
+# Per-check scheduling options (keyed by check name)
+CHECK_OPTIONS = {
+    "Installation Validation": {"inputs": FRAMEWORK_INPUTS},
+    "Traceability Validation": {"inputs": TRACEABILITY_INPUTS},
+    "TypeScript Check": {"inputs": WEB_SOURCE_INPUTS},
+    "Lint Check": {"inputs": WEB_SOURCE_INPUTS},
+    # The build re-runs the type checker, pointless if types already fail
+    "Build Check": {"depends_on": ["TypeScript Check"], "inputs": WEB_SOURCE_INPUTS},
+}
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -72,6 +86,10 @@ Examples:
     parser.add_argument("--url", help="URL for performance & E2E checks (optional)")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS,
+                        help=f"Maximum checks running concurrently (default: {DEFAULT_JOBS})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-run every check even if its inputs are unchanged")
 
     args = parser.parse_args()
 
@@ -87,38 +105,39 @@ Examples:
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
     start_time = datetime.now()
-    results = []
 
     web_dir = project_path / "web"
     has_web = web_dir.exists() and (web_dir / "package.json").exists()
 
+    specs = []
     for suite in VERIFICATION_SUITE:
         category = suite["category"]
-        print_header(f"{category.upper()}", width=70)
 
         # Python script checks
         for name, script_rel, required in suite.get("checks", []):
-            script = project_path / script_rel
-            result = run_script_check(name, script, str(project_path), timeout=600)
-            result["category"] = category
-            results.append(result)
-
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                _print_final_report(results, start_time)
-                sys.exit(1)
+            specs.append(script_check_spec(
+                name, project_path / script_rel, str(project_path),
+                required=required, timeout=600, category=category,
+                **CHECK_OPTIONS.get(name, {})))
 
         # Web checks (npm/npx commands in web/ dir)
         if has_web:
             for name, cmd, required in suite.get("web_checks", []):
-                result = run_check(name, cmd, str(web_dir), timeout=300)
-                result["category"] = category
-                results.append(result)
-
-                if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                    print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                    _print_final_report(results, start_time)
-                    sys.exit(1)
+                specs.append(check_spec(
+                    name, cmd, str(web_dir), required=required, timeout=300,
+                    category=category, **CHECK_OPTIONS.get(name, {})))
+
+    print_header(f"RUNNING {len(specs)} CHECKS ({args.jobs} parallel)", width=70)
+    cache = None if args.no_cache else ResultCache(project_path / CACHE_FILE)
+    results = run_checks_parallel(specs, jobs=args.jobs, stop_on_fail=args.stop_on_fail,
+                                  cache=cache)
+
+    if args.stop_on_fail:
+        critical = first_required_failure(specs, results)
+        if critical:
+            print_error(f"CRITICAL: {critical} failed. Stopping verification.")
+            _print_final_report(results, start_time)
+            sys.exit(1)
 
     all_passed = _print_final_report(results, start_time)
     sys.exit(0 if all_passed else 1)
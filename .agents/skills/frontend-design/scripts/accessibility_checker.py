@@ -4,7 +4,7 @@ Accessibility Checker - WCAG compliance audit
 Checks HTML files for accessibility issues.
 
 Usage:
-    python accessibility_checker.py <project_path>
+    python accessibility_checker.py <project_path> [--incremental] [--since REF]
 
 Checks:
     - Form labels
@@ -20,6 +20,10 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared single-pass scan engine lives in .agents/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from _scan_engine import ScanEngine, Auditor, FileContext, AuditIndex, incremental_flags
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -27,29 +31,60 @@ except:
     pass
 
 
-def find_html_files(project_path: Path) -> list:
-    """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
+class AccessibilityAuditor(Auditor):
+    """Collects accessibility issues for HTML/JSX/TSX files (first 50)."""
+
+    name = "accessibility_checker"
+    extensions = {'.html', '.jsx', '.tsx'}
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
-    
-    return files[:50]
+    max_files = 50
+    state_fields = ('all_issues',)
+
+    def __init__(self, project_path: Path):
+        super().__init__()
+        self.project_path = project_path
+        self.all_issues = []
 
+    def visit(self, ctx: FileContext) -> None:
+        issues = check_accessibility(ctx)
+        if issues:
+            self.all_issues.append({
+                "file": str(ctx.name),
+                "issues": issues
+            })
 
-def check_accessibility(file_path: Path) -> list:
+    def report(self) -> dict:
+        if not self.files_visited:
+            return {
+                "script": "accessibility_checker",
+                "project": str(self.project_path),
+                "files_checked": 0,
+                "issues_found": 0,
+                "passed": True,
+                "message": "No HTML files found"
+            }
+        total_issues = sum(len(item["issues"]) for item in self.all_issues)
+        return {
+            "script": "accessibility_checker",
+            "project": str(self.project_path),
+            "files_checked": self.files_visited,
+            "files_with_issues": len(self.all_issues),
+            "issues_found": total_issues,
+            # Accessibility issues are important but not blocking
+            "passed": total_issues < 5  # Allow minor issues
+        }
+
+
+def check_accessibility(ctx: FileContext) -> list:
     """Check a single file for accessibility issues."""
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = ctx.text
+        lower = ctx.lower
         
         # Check for form inputs without labels
-        inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
+        inputs = ctx.findall(r'<input[^>]*>', re.IGNORECASE)
         for inp in inputs:
             if 'type="hidden"' not in inp.lower():
                 if 'aria-label' not in inp.lower() and 'id=' not in inp.lower():
@@ -57,7 +92,7 @@ def check_accessibility(file_path: Path) -> list:
                     break
         
         # Check for buttons without accessible text
-        buttons = re.findall(r'<button[^>]*>[^<]*</button>', content, re.IGNORECASE)
+        buttons = ctx.findall(r'<button[^>]*>[^<]*</button>', re.IGNORECASE)
         for btn in buttons:
             # Check if button has text content or aria-label
             if 'aria-label' not in btn.lower():
@@ -67,36 +102,36 @@ def check_accessibility(file_path: Path) -> list:
                     break
         
         # Check for missing lang attribute
-        if '<html' in content.lower() and 'lang=' not in content.lower():
+        if '<html' in lower and 'lang=' not in lower:
             issues.append("Missing lang attribute on <html>")
         
         # Check for missing skip link
-        if '<main' in content.lower() or '<body' in content.lower():
-            if 'skip' not in content.lower() and '#main' not in content.lower():
+        if '<main' in lower or '<body' in lower:
+            if 'skip' not in lower and '#main' not in lower:
                 issues.append("Consider adding skip-to-main-content link")
         
         # Check for click handlers without keyboard support
-        onclick_count = content.lower().count('onclick=')
-        onkeydown_count = content.lower().count('onkeydown=') + content.lower().count('onkeyup=')
+        onclick_count = lower.count('onclick=')
+        onkeydown_count = lower.count('onkeydown=') + lower.count('onkeyup=')
         if onclick_count > 0 and onkeydown_count == 0:
             issues.append("onClick without keyboard handler (onKeyDown)")
         
         # Check for tabIndex misuse
-        if 'tabindex=' in content.lower():
-            if 'tabindex="-1"' not in content.lower() and 'tabindex="0"' not in content.lower():
-                positive_tabindex = re.findall(r'tabindex="([1-9]\d*)"', content, re.IGNORECASE)
+        if 'tabindex=' in lower:
+            if 'tabindex="-1"' not in lower and 'tabindex="0"' not in lower:
+                positive_tabindex = ctx.findall(r'tabindex="([1-9]\d*)"', re.IGNORECASE)
                 if positive_tabindex:
                     issues.append("Avoid positive tabIndex values")
         
         # Check for autoplay media
-        if 'autoplay' in content.lower():
-            if 'muted' not in content.lower():
+        if 'autoplay' in lower:
+            if 'muted' not in lower:
                 issues.append("Autoplay media should be muted")
         
         # Check for role usage
-        if 'role="button"' in content.lower():
+        if 'role="button"' in lower:
             # Divs with role button should have tabindex
-            div_buttons = re.findall(r'<div[^>]*role="button"[^>]*>', content, re.IGNORECASE)
+            div_buttons = ctx.findall(r'<div[^>]*role="button"[^>]*>', re.IGNORECASE)
             for div in div_buttons:
                 if 'tabindex' not in div.lower():
                     issues.append("role='button' without tabindex")
@@ -109,7 +144,10 @@ def check_accessibility(file_path: Path) -> list:
 
 
 def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    target = sys.argv[1] if len(sys.argv) > 1 and not sys.argv[1].startswith("--") else "."
+    project_path = Path(target).resolve()
+    incremental, since = incremental_flags(sys.argv)
+    index = AuditIndex(project_path, since=since) if incremental else None
     
     print(f"\n{'='*60}")
     print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
@@ -118,32 +156,16 @@ def main():
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-"*60)
     
-    # Find HTML files
-    files = find_html_files(project_path)
-    print(f"Found {len(files)} HTML/JSX/TSX files")
+    # Find and check HTML files in a single pass
+    auditor = AccessibilityAuditor(project_path)
+    ScanEngine(project_path, [auditor], index=index).run()
+    print(f"Found {auditor.files_visited} HTML/JSX/TSX files")
     
-    if not files:
-        output = {
-            "script": "accessibility_checker",
-            "project": str(project_path),
-            "files_checked": 0,
-            "issues_found": 0,
-            "passed": True,
-            "message": "No HTML files found"
-        }
-        print(json.dumps(output, indent=2))
+    if not auditor.files_visited:
+        print(json.dumps(auditor.report(), indent=2))
         sys.exit(0)
     
-    # Check each file
-    all_issues = []
-    
-    for f in files:
-        issues = check_accessibility(f)
-        if issues:
-            all_issues.append({
-                "file": str(f.name),
-                "issues": issues
-            })
+    all_issues = auditor.all_issues
     
     # Summary
     print("\n" + "="*60)
@@ -161,18 +183,10 @@ def main():
     else:
         print("No accessibility issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Accessibility issues are important but not blocking
-    passed = total_issues < 5  # Allow minor issues
-    
-    output = {
-        "script": "accessibility_checker",
-        "project": str(project_path),
-        "files_checked": len(files),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
+    output = auditor.report()
+    if index is not None:
+        output["incremental"] = index.summary()
+    passed = output["passed"]
     
     print("\n" + json.dumps(output, indent=2))
     
@@ -87,618 +87,839 @@ Analyzes code for compliance with:
    - Form labels
 
 Total: 80+ checks across all design principles
+
+Checks are declared in the RULES table below and evaluated against a
+per-file feature vector, so each pattern runs at most once per file.
+
+Usage:
+    python ux_audit.py <path> [--json] [--benchmark] [--incremental] [--since REF]
 """
 
 import sys
 import os
 import re
 import json
+import time
+from collections import namedtuple
+from functools import cached_property
 from pathlib import Path
 
-class UXAuditor:
-    def __init__(self):
-        self.issues = []
-        self.warnings = []
-        self.passed_count = 0
-        self.files_checked = 0
-    
-    def audit_file(self, filepath: str) -> None:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-        except: return
-        
-        self.files_checked += 1
-        filename = os.path.basename(filepath)
-
-        # Pre-calculate common flags
-        has_long_text = bool(re.search(r'<p|<div.*class=.*text|article|<span.*text', content, re.IGNORECASE))
-        has_form = bool(re.search(r'<form|<input|password|credit|card|payment', content, re.IGNORECASE))
-        complex_elements = len(re.findall(r'<input|<select|<textarea|<option', content, re.IGNORECASE))
-
-        # --- 1. PSYCHOLOGY LAWS ---
-        # Hick's Law
-        nav_items = len(re.findall(r'<NavLink|<Link|<a\s+href|nav-item', content, re.IGNORECASE))
-        if nav_items > 7:
-            self.issues.append(f"[Hick's Law] {filename}: {nav_items} nav items (Max 7)")
-        
-        # Fitts' Law
-        if re.search(r'height:\s*([0-3]\d)px', content) or re.search(r'h-[1-9]\b|h-10\b', content):
-            self.warnings.append(f"[Fitts' Law] {filename}: Small targets (< 44px)")
-        
-        # Miller's Law
-        form_fields = len(re.findall(r'<input|<select|<textarea', content, re.IGNORECASE))
-        if form_fields > 7 and not re.search(r'step|wizard|stage', content, re.IGNORECASE):
-            self.warnings.append(f"[Miller's Law] {filename}: Complex form ({form_fields} fields)")
-            
-        # Von Restorff
-        if 'button' in content.lower() and not re.search(r'primary|bg-primary|Button.*primary|variant=["\']primary', content, re.IGNORECASE):
-            self.warnings.append(f"[Von Restorff] {filename}: No primary CTA")
-
-        # Serial Position Effect - Important items at beginning/end
-        if nav_items > 3:
-            # Check if last nav item is important (contact, login, etc.)
-            nav_content = re.findall(r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', content, re.IGNORECASE)
-            if nav_content and len(nav_content) > 2:
-                last_item = nav_content[-1].lower() if nav_content else ''
-                if not any(x in last_item for x in ['contact', 'login', 'sign', 'get started', 'cta', 'button']):
-                    self.warnings.append(f"[Serial Position] {filename}: Last nav item may not be important. Place key actions at start/end.")
-
-        # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
-
-        # Visceral: First impressions (aesthetics, gradients, animations)
-        has_hero = bool(re.search(r'hero|<h1|banner', content, re.IGNORECASE))
-        if has_hero:
-            # Check for visual appeal elements
-            has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient', content))
-            has_animation = bool(re.search(r'@keyframes|transition:|animate-', content))
-            has_visual_interest = has_gradient or has_animation
-
-            if not has_visual_interest and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visceral] {filename}: Hero section lacks visual appeal. Consider gradients or subtle animations.")
-
-        # Behavioral: Instant feedback and usability
-        if 'onClick' in content or '@click' in content or 'onclick' in content:
-            has_feedback = re.search(r'transition|animate|hover:|focus:|disabled|loading|spinner', content, re.IGNORECASE)
-            has_state_change = re.search(r'setState|useState|disabled|loading', content)
-
-            if not has_feedback and not has_state_change:
-                self.warnings.append(f"[Behavioral] {filename}: Interactive elements lack immediate feedback. Add hover/focus/disabled states.")
-
-        # Reflective: Brand story, values, identity
-        has_reflective = bool(re.search(r'about|story|mission|values|why we|our journey|testimonials', content, re.IGNORECASE))
-        if has_long_text and not has_reflective:
-            self.warnings.append(f"[Reflective] {filename}: Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.")
-
-        # --- 1.6 TRUST BUILDING (Enhanced) ---
-
-        # Security signals
-        if has_form:
-            security_signals = re.findall(r'ssl|secure|encrypt|lock|padlock|https', content, re.IGNORECASE)
-            if len(security_signals) == 0 and not re.search(r'checkout|payment', content, re.IGNORECASE):
-                self.warnings.append(f"[Trust] {filename}: Form without security indicators. Add 'SSL Secure' or lock icon.")
-
-        # Social proof elements
-        social_proof = re.findall(r'review|testimonial|rating|star|trust|trusted by|customer|logo', content, re.IGNORECASE)
-        if len(social_proof) > 0:
-            self.passed_count += 1
-        else:
-            if has_long_text:
-                self.warnings.append(f"[Trust] {filename}: No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.")
-
-        # Authority indicators
-        has_footer = bool(re.search(r'footer|<footer', content, re.IGNORECASE))
-        if has_footer:
-            authority = re.findall(r'certif|award|media|press|featured|as seen in', content, re.IGNORECASE)
-            if len(authority) == 0:
-                self.warnings.append(f"[Trust] {filename}: Footer lacks authority signals. Add certifications, awards, or media mentions.")
-
-        # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
-
-        # Progressive disclosure
-        if complex_elements > 5:
-            has_progressive = re.search(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', content, re.IGNORECASE)
-            if not has_progressive:
-                self.warnings.append(f"[Cognitive Load] {filename}: Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.")
-
-        # Visual noise check
-        has_many_colors = len(re.findall(r'#[0-9a-fA-F]{3,6}|rgb|hsl', content)) > 15
-        has_many_borders = len(re.findall(r'border:|border-', content)) > 10
-        if has_many_colors and has_many_borders:
-            self.warnings.append(f"[Cognitive Load] {filename}: High visual noise detected. Many colors and borders increase cognitive load.")
-
-        # Familiar patterns
-        if has_form:
-            has_standard_labels = bool(re.search(r'<label|placeholder|aria-label', content, re.IGNORECASE))
-            if not has_standard_labels:
-                self.issues.append(f"[Cognitive Load] {filename}: Form inputs without labels. Use <label> for accessibility and clarity.")
-
-        # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
-
-        # Smart defaults
-        if has_form:
-            has_defaults = bool(re.search(r'checked|selected|default|value=["\'].*["\']', content))
-            radio_inputs = len(re.findall(r'type=["\']radio', content, re.IGNORECASE))
-            if radio_inputs > 0 and not has_defaults:
-                self.warnings.append(f"[Persuasion] {filename}: Radio buttons without default selection. Pre-select recommended option.")
-
-        # Anchoring (showing original price)
-        if re.search(r'price|pricing|cost|\$\d+', content, re.IGNORECASE):
-            has_anchor = bool(re.search(r'original|was|strike|del|save \d+%', content, re.IGNORECASE))
-            if not has_anchor:
-                self.warnings.append(f"[Persuasion] {filename}: Prices without anchoring. Show original price to frame discount value.")
-
-        # Social proof live indicators
-        has_social = bool(re.search(r'join|subscriber|member|user', content, re.IGNORECASE))
-        if has_social:
-            has_count = bool(re.findall(r'\d+[+kmb]|\d+,\d+', content))
-            if not has_count:
-                self.warnings.append(f"[Persuasion] {filename}: Social proof without specific numbers. Use 'Join 10,000+' format.")
-
-        # Progress indicators
-        if has_form:
-            has_progress = bool(re.search(r'progress|step \d+|complete|%|bar', content, re.IGNORECASE))
-            if complex_elements > 5 and not has_progress:
-                self.warnings.append(f"[Persuasion] {filename}: Long form without progress indicator. Add progress bar or 'Step X of Y'.")
-
-        # --- 2. TYPOGRAPHY SYSTEM (Complete Coverage) ---
-
-        # 2.1 Font Pairing - Too many font families
-        font_families = set()
-        # Check for @font-face, Google Fonts, font-family declarations
-        font_faces = re.findall(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', content, re.IGNORECASE)
-        google_fonts = re.findall(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', content, re.IGNORECASE)
-        font_family_css = re.findall(r'font-family:\s*([^;]+)', content, re.IGNORECASE)
-
-        for font in font_faces: font_families.add(font.strip().lower())
-        for font in google_fonts:
+# Shared single-pass scan engine lives in .agents/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from _scan_engine import ScanEngine, Auditor, FileContext, AuditIndex, compile_rule, incremental_flags
+
+I = re.IGNORECASE
+
+
+# ============================================================================
+#  PATTERNS (compiled once at import)
+# ============================================================================
+
+class P:
+    """Every pattern the rules use; shared by name so each runs once per file."""
+    # Layout / content
+    LONG_TEXT = compile_rule(r'<p|<div.*class=.*text|article|<span.*text', I)
+    FORM = compile_rule(r'<form|<input|password|credit|card|payment', I)
+    COMPLEX_ELEMENTS = compile_rule(r'<input|<select|<textarea|<option', I)
+    FORM_FIELDS = compile_rule(r'<input|<select|<textarea', I)
+    NAV_ITEMS = compile_rule(r'<NavLink|<Link|<a\s+href|nav-item', I)
+    NAV_CONTENT = compile_rule(r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', I)
+    HERO = compile_rule(r'hero|<h1|banner', I)
+    FOOTER = compile_rule(r'footer|<footer', I)
+    MULTI_STEP = compile_rule(r'step|wizard|stage', I)
+    PRIMARY_CTA = compile_rule(r'primary|bg-primary|Button.*primary|variant=["\']primary', I)
+
+    # Targets
+    SMALL_HEIGHT_PX = compile_rule(r'height:\s*([0-3]\d)px')
+    SMALL_HEIGHT_TW = compile_rule(r'h-[1-9]\b|h-10\b')
+
+    # Emotional design / trust / persuasion
+    FEEDBACK = compile_rule(r'transition|animate|hover:|focus:|disabled|loading|spinner', I)
+    STATE_CHANGE = compile_rule(r'setState|useState|disabled|loading')
+    REFLECTIVE = compile_rule(r'about|story|mission|values|why we|our journey|testimonials', I)
+    SECURITY_SIGNALS = compile_rule(r'ssl|secure|encrypt|lock|padlock|https', I)
+    CHECKOUT = compile_rule(r'checkout|payment', I)
+    SOCIAL_PROOF = compile_rule(r'review|testimonial|rating|star|trust|trusted by|customer|logo', I)
+    AUTHORITY = compile_rule(r'certif|award|media|press|featured|as seen in', I)
+    PROGRESSIVE = compile_rule(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', I)
+    LABELS = compile_rule(r'<label|placeholder|aria-label', I)
+    DEFAULTS = compile_rule(r'checked|selected|default|value=["\'].*["\']')
+    RADIO = compile_rule(r'type=["\']radio', I)
+    PRICE = compile_rule(r'price|pricing|cost|\$\d+', I)
+    PRICE_ANCHOR = compile_rule(r'original|was|strike|del|save \d+%', I)
+    SOCIAL = compile_rule(r'join|subscriber|member|user', I)
+    SOCIAL_COUNT = compile_rule(r'\d+[+kmb]|\d+,\d+')
+    PROGRESS = compile_rule(r'progress|step \d+|complete|%|bar', I)
+
+    # Typography
+    FONT_FACE = compile_rule(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', I)
+    GOOGLE_FONTS = compile_rule(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', I)
+    FONT_FAMILY = compile_rule(r'font-family:\s*([^;]+)', I)
+    LINE_LENGTH = compile_rule(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch')
+    TEXT_ELEMENTS = compile_rule(r'<p|<span|<div.*text|<h[1-6]', I)
+    LEADING = compile_rule(r'leading-|line-height:')
+    HEADING_TEXT = compile_rule(r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', I)
+    LINE_HEIGHT_VALUES = compile_rule(r'(?:leading-|line-height:\s*)([\d.]+)')
+    UPPERCASE = compile_rule(r'uppercase|text-transform:\s*uppercase', I)
+    TRACKING = compile_rule(r'tracking-|letter-spacing:')
+    DISPLAY_TEXT = compile_rule(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx')
+    TRACKING_TIGHT = compile_rule(r'tracking-tight|letter-spacing:\s*-[0-9]')
+    FONT_WEIGHTS = compile_rule(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', I)
+    FONT_SIZES = compile_rule(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)')
+    FLUID = compile_rule(r'clamp\(|responsive:')
+    HEADINGS = compile_rule(r'<(h[1-6])', I)
+    FONT_SIZE_VALUES = compile_rule(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)')
+    PARAGRAPHS = compile_rule(r'<p[^>]*>([^<]+)</p>', I)
+    SUBHEADINGS = compile_rule(r'<h[2-6]', I)
+
+    # Visual effects
+    TRANSLUCENT_BG = compile_rule(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+')
+    KEYFRAMES_TRANSITION = compile_rule(r'@keyframes|transition:')
+    EXPENSIVE_PROPS = compile_rule(r'width|height|top|left|right|bottom|margin|padding')
+    REDUCED_MOTION = compile_rule(r'prefers-reduced-motion')
+    BOX_SHADOW = compile_rule(r'box-shadow:\s*([^;]+)')
+    SHADOW_Y_OFFSET = compile_rule(r'\d+px\s+[1-9]\d*px')
+    OPACITIES = compile_rule(r'rgba?\([^)]+,\s*([\d.]+)\)')
+    GRADIENT = compile_rule(r'gradient|linear-gradient|radial-gradient|conic-gradient')
+    GRADIENT_ANY_CASE = compile_rule(r'gradient', I)
+    BACKGROUND = compile_rule(r'background:|bg-')
+    BORDER = compile_rule(r'border:|border-')
+    BORDER_DECL = compile_rule(r'border:')
+    TEXT_SHADOW = compile_rule(r'text-shadow:')
+    GLOW_SHADOW = compile_rule(r'box-shadow:\s*[^;]*0\s+0\s+')
+    IMAGES = compile_rule(r'<img|background-image:|bg-\[url')
+    OVERLAY = compile_rule(r'overlay|rgba\(0|gradient.*transparent|::after|::before')
+    WILL_CHANGE = compile_rule(r'will-change:')
+    WILL_CHANGE_VALUES = compile_rule(r'will-change:\s*([^;]+)')
+    BLUR = compile_rule(r'backdrop-filter|blur\(')
+
+    # Color
+    COLORS = compile_rule(r'#[0-9a-fA-F]{3,6}|rgb|hsl')
+    HEX = compile_rule(r'#[0-9a-fA-F]{3,6}')
+    HEX6 = compile_rule(r'#[0-9a-fA-F]{6}')
+    HSL = compile_rule(r'hsl\(')
+    HSL_HUES = compile_rule(r'hsl\((\d+),\s*\d+%,\s*\d+%\)')
+    BG_DECLARATIONS = compile_rule(r'(?:background|bg-|bg\[)([^;}\s]+)')
+    TEXT_DECLARATIONS = compile_rule(r'(?:color|text-)([^;}\s]+)')
+    PURE_BLACK = compile_rule(r'color:\s*#000000|#000\b')
+    PURE_WHITE_BG = compile_rule(r'background:\s*#ffffff|#fff\b')
+    DARK_MODE = compile_rule(r'dark:\s*|dark:')
+    LIGHT_ON_LIGHT = compile_rule(r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]')
+    DARK_ON_DARK = compile_rule(r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]')
+    BLUE = compile_rule(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}')
+    FOOD = compile_rule(r'restaurant|food|cooking|recipe|menu|dish|meal', I)
+    COLOR_VARS = compile_rule(r'--color-|color-|primary-|secondary-')
+
+    # Animation
+    DURATIONS = compile_rule(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)')
+    ENTRY_EASE_IN = compile_rule(r'ease-in\s+.*entry|fade-in.*ease-in')
+    EXIT_EASE_OUT = compile_rule(r'ease-out\s+.*exit|fade-out.*ease-out')
+    INTERACTIVE = compile_rule(r'<button|<a\s+href|onClick|@click')
+    HOVER_FOCUS = compile_rule(r'hover:|focus:|:hover|:focus')
+    ASYNC = compile_rule(r'async|await|fetch|axios|loading|isLoading')
+    LOADING_INDICATOR = compile_rule(r'skeleton|spinner|progress|loading|<circle.*animate')
+    ROUTING = compile_rule(r'router|navigate|Link.*to|useHistory')
+    PAGE_TRANSITION = compile_rule(r'AnimatePresence|motion\.|transition.*page|fade.*route')
+    SCROLL_ANIMATION = compile_rule(r'onScroll|scroll.*trigger|IntersectionObserver')
+    SCROLL_LAYOUT = compile_rule(r'onScroll.*[^\w](width|height|top|left)')
+
+    # Motion graphics
+    LOTTIE = compile_rule(r'lottie|Lottie|@lottie-react')
+    LOTTIE_FALLBACK = compile_rule(r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop')
+    GSAP = compile_rule(r'gsap|ScrollTrigger|from\(.*gsap')
+    GSAP_CLEANUP = compile_rule(r'kill\(|revert\(|useEffect.*return.*gsap')
+    SVG_ANIMATIONS = compile_rule(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset')
+    TRANSFORM_3D = compile_rule(r'transform3d|perspective\(|rotate3d|translate3d')
+    PERSPECTIVE = compile_rule(r'perspective:\s*\d+px|perspective\s*\(')
+    PARTICLES = compile_rule(r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js')
+    SCROLL_DRIVEN = compile_rule(r'IntersectionObserver.*animate|scroll.*progress|view-timeline')
+    THROTTLE = compile_rule(r'throttle|debounce|requestAnimationFrame')
+    ANIMATIONS = compile_rule(r'@keyframes|transition:|animate-')
+    FUNCTIONAL_ANIMATIONS = compile_rule(r'hover:|focus:|disabled|loading|error|success')
+
+    # Accessibility
+    IMG_NO_ALT = compile_rule(r'<img(?![^>]*alt=)[^>]*>')
+
+
+GENERIC_FONTS = {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}
+WEIGHT_NAMES = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
+# Common scale ratios: 1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618
+COMMON_RATIOS = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
+LAYOUT_PROPS = ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']
+PURPLE_HEXES = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
+                '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
+                '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
+                'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
+
+
+# ============================================================================
+#  FEATURES (computed once per file, on first use)
+# ============================================================================
+
+class Features:
+    """Feature vector of one file; rules read these instead of re-scanning."""
+
+    def __init__(self, ctx: FileContext):
+        self.ctx = ctx
+        self.text = ctx.text
+        self.lower = ctx.lower
+
+    def has(self, rule) -> bool:
+        return self.ctx.search(rule) is not None
+
+    def all(self, rule) -> list:
+        return self.ctx.findall(rule)
+
+    def count(self, rule) -> int:
+        return len(self.ctx.findall(rule))
+
+    @cached_property
+    def has_long_text(self): return self.has(P.LONG_TEXT)
+
+    @cached_property
+    def has_form(self): return self.has(P.FORM)
+
+    @cached_property
+    def complex_elements(self): return self.count(P.COMPLEX_ELEMENTS)
+
+    @cached_property
+    def nav_items(self): return self.count(P.NAV_ITEMS)
+
+    @cached_property
+    def form_fields(self): return self.count(P.FORM_FIELDS)
+
+    @cached_property
+    def has_hero(self): return self.has(P.HERO)
+
+    @cached_property
+    def has_gradient(self): return self.has(P.GRADIENT)
+
+    @cached_property
+    def has_background(self): return self.has(P.BACKGROUND)
+
+    @cached_property
+    def has_interaction(self):
+        return 'onClick' in self.text or '@click' in self.text or 'onclick' in self.text
+
+    @cached_property
+    def animates(self): return self.has(P.KEYFRAMES_TRANSITION)
+
+    @cached_property
+    def shadows(self): return self.all(P.BOX_SHADOW)
+
+    @cached_property
+    def paragraphs(self): return self.all(P.PARAGRAPHS)
+
+    @cached_property
+    def headings(self): return self.all(P.HEADINGS)
+
+    @cached_property
+    def has_lottie(self): return self.has(P.LOTTIE)
+
+    @cached_property
+    def has_gsap(self): return self.has(P.GSAP)
+
+    @cached_property
+    def font_families(self):
+        families = set()
+        for font in self.all(P.FONT_FACE): families.add(font.strip().lower())
+        for font in self.all(P.GOOGLE_FONTS):
             for f in font.replace('+', ' ').split('|'):
-                font_families.add(f.split(':')[0].strip().lower())
-        for family in font_family_css:
+                families.add(f.split(':')[0].strip().lower())
+        for family in self.all(P.FONT_FAMILY):
             # Extract first font from stack
             first_font = family.split(',')[0].strip().strip('"\'')
-
-            if first_font.lower() not in {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}:
-                font_families.add(first_font.lower())
-
-        if len(font_families) > 3:
-            self.issues.append(f"[Typography] {filename}: {len(font_families)} font families detected. Limit to 2-3 for cohesion.")
-
-        # 2.2 Line Length - Character-based width
-        if has_long_text and not re.search(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', content):
-            self.warnings.append(f"[Typography] {filename}: No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].")
-
-        # 2.3 Line Height - Proper leading ratios
-        # Check for text without proper line-height
-        text_elements = len(re.findall(r'<p|<span|<div.*text|<h[1-6]', content, re.IGNORECASE))
-        if text_elements > 0 and not re.search(r'leading-|line-height:', content):
-            self.warnings.append(f"[Typography] {filename}: Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3")
-
-        # Check for heading-specific line height issues
-        if re.search(r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', content, re.IGNORECASE):
-            # Extract line-height values
-            line_heights = re.findall(r'(?:leading-|line-height:\s*)([\d.]+)', content)
-            for lh in line_heights:
-                if float(lh) > 1.5:
-                    self.warnings.append(f"[Typography] {filename}: Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).")
-
-        # 2.4 Letter Spacing (Tracking)
-        # Uppercase without tracking
-        if re.search(r'uppercase|text-transform:\s*uppercase', content, re.IGNORECASE):
-            if not re.search(r'tracking-|letter-spacing:', content):
-                self.warnings.append(f"[Typography] {filename}: Uppercase text without tracking. ALL CAPS needs +5-10% spacing.")
-
-        # Large text (display/hero) should have negative tracking
-        if re.search(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', content):
-            if not re.search(r'tracking-tight|letter-spacing:\s*-[0-9]', content):
-                self.warnings.append(f"[Typography] {filename}: Large display text without tracking-tight. Big text needs -1% to -4% spacing.")
-
-        # 2.5 Weight and Emphasis - Contrast levels
-        # Check for adjacent weight levels (poor contrast)
-        weights = re.findall(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', content, re.IGNORECASE)
-        weight_values = []
-        for w in weights:
+            if first_font.lower() not in GENERIC_FONTS:
+                families.add(first_font.lower())
+        return families
+
+    @cached_property
+    def font_weights(self):
+        values = []
+        for w in self.all(P.FONT_WEIGHTS):
             val = w[0] or w[1]
             if val:
                 # Map named weights to numbers
-                weight_map = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
-                val = weight_map.get(val.lower(), val)
+                val = WEIGHT_NAMES.get(val.lower(), val)
                 try:
-                    weight_values.append(int(val))
+                    values.append(int(val))
                 except: pass
+        return values
 
-        # Check for adjacent weights (400/500, 500/600, etc.)
-        for i in range(len(weight_values) - 1):
-            diff = abs(weight_values[i] - weight_values[i+1])
-            if diff == 100:
-                self.warnings.append(f"[Typography] {filename}: Adjacent font weights ({weight_values[i]}/{weight_values[i+1]}). Skip at least 2 levels for contrast.")
-
-        # Too many weight levels
-        unique_weights = set(weight_values)
-        if len(unique_weights) > 4:
-            self.warnings.append(f"[Typography] {filename}: {len(unique_weights)} font weights. Limit to 3-4 per page.")
-
-        # 2.6 Responsive Typography - Fluid sizing with clamp()
-        has_font_sizes = bool(re.search(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', content))
-        if has_font_sizes and not re.search(r'clamp\(|responsive:', content):
-            self.warnings.append(f"[Typography] {filename}: Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)")
-
-        # 2.7 Hierarchy - Heading structure
-        headings = re.findall(r'<(h[1-6])', content, re.IGNORECASE)
-        if headings:
-            # Check for skipped levels (h1 -> h3)
-            for i in range(len(headings) - 1):
-                curr = int(headings[i][1])
-                next_h = int(headings[i+1][1])
-                if next_h > curr + 1:
-                    self.warnings.append(f"[Typography] {filename}: Skipped heading level (h{curr} -> h{next_h}). Maintain sequential hierarchy.")
-
-            # Check if h1 exists for main content
-            if 'h1' not in [h.lower() for h in headings] and has_long_text:
-                self.warnings.append(f"[Typography] {filename}: No h1 found. Each page should have one primary heading.")
-
-        # 2.8 Modular Scale - Consistent sizing
-        # Extract font-size values
-        font_sizes = re.findall(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', content)
-        size_values = []
-        for size, unit in font_sizes:
+    @cached_property
+    def font_sizes_rem(self):
+        sizes = []
+        for size, unit in self.all(P.FONT_SIZE_VALUES):
             if unit == 'rem' or unit == 'em':
-                size_values.append(float(size))
+                sizes.append(float(size))
             elif unit == 'px':
-                size_values.append(float(size) / 16)  # Normalize to rem
-
-        if len(size_values) > 2:
-            # Check if sizes follow a modular scale roughly
-            sorted_sizes = sorted(set(size_values))
-            ratios = []
-            for i in range(1, len(sorted_sizes)):
-                if sorted_sizes[i-1] > 0:
-                    ratios.append(sorted_sizes[i] / sorted_sizes[i-1])
-
-            # Common scale ratios: 1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618
-            common_ratios = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
-            for ratio in ratios[:3]:  # Check first 3 ratios
-                if not any(abs(ratio - cr) < 0.05 for cr in common_ratios):
-                    self.warnings.append(f"[Typography] {filename}: Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third).")
-                    break
-
-        # 2.9 Readability - Content chunking
-        # Check for very long paragraphs (>5 lines estimated)
-        paragraphs = re.findall(r'<p[^>]*>([^<]+)</p>', content, re.IGNORECASE)
-        for p in paragraphs:
-            word_count = len(p.split())
-            if word_count > 100:  # ~5-6 lines
-                self.warnings.append(f"[Typography] {filename}: Long paragraph detected ({word_count} words). Break into 3-4 line chunks for readability.")
-
-        # Check for missing subheadings in long content
-        if len(paragraphs) > 5:
-            subheadings = len(re.findall(r'<h[2-6]', content, re.IGNORECASE))
-            if subheadings == 0:
-                self.warnings.append(f"[Typography] {filename}: Long content without subheadings. Add h2/h3 to break up text.")
-
-        # --- 3. VISUAL EFFECTS (visual-effects.md) ---
-        
-        # Glassmorphism Check
-        if 'backdrop-filter' in content or 'blur(' in content:
-            if not re.search(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', content):
-                self.warnings.append(f"[Visual] {filename}: Blur used without semi-transparent background (Glassmorphism fail)")
-        
-        # GPU Acceleration / Performance
-        if re.search(r'@keyframes|transition:', content):
-            expensive_props = re.findall(r'width|height|top|left|right|bottom|margin|padding', content)
-            if expensive_props:
-                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible.")
-            
-            # Reduced Motion
-            if not re.search(r'prefers-reduced-motion', content):
-                self.warnings.append(f"[Accessibility] {filename}: Animations found without prefers-reduced-motion check")
-
-        # Natural Shadows
-        shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in shadows:
-            # Check if natural (Y > X) or multiple layers
-            if ',' not in shadow and not re.search(r'\d+px\s+[1-9]\d*px', shadow): # Simple heuristic for Y-offset
-                 self.warnings.append(f"[Visual] {filename}: Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.")
-
-        # --- 3.1 NEOMORPHISM CHECK ---
-        # Check for neomorphism patterns (dual shadows with opposite directions)
-        neo_shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in neo_shadows:
-            # Neomorphism has two shadows: positive offset + negative offset
-            if ',' in shadow and '-' in shadow:
-                # Check for inset pattern (pressed state)
-                if 'inset' in shadow:
-                    self.warnings.append(f"[Visual] {filename}: Neomorphism inset detected. Ensure adequate contrast for accessibility.")
-
-        # --- 3.2 SHADOW HIERARCHY ---
-        # Count shadow levels to check for elevation consistency
-        shadow_count = len(shadows)
-        if shadow_count > 0:
-            # Check for shadow opacity levels (should indicate hierarchy)
-            opacities = re.findall(r'rgba?\([^)]+,\s*([\d.]+)\)', content)
-            shadow_opacities = [float(o) for o in opacities if float(o) < 0.5]
-            if shadow_count >= 3 and len(shadow_opacities) > 0:
-                # Check if there's variety in shadow opacities for different elevations
-                unique_opacities = len(set(shadow_opacities))
-                if unique_opacities < 2:
-                    self.warnings.append(f"[Visual] {filename}: All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.")
-
-        # --- 3.3 GRADIENT CHECKS ---
-        # Check for gradient usage
-        has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient|conic-gradient', content))
-        if has_gradient:
-            # Warn about mesh/aurora gradients (can be overused)
-            gradient_count = len(re.findall(r'gradient', content, re.IGNORECASE))
-            if gradient_count > 5:
-                self.warnings.append(f"[Visual] {filename}: Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration.")
-        else:
-            # Check if hero section exists without gradient
-            if has_hero and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visual] {filename}: Hero section without visual interest. Consider gradient for depth.")
-
-        # --- 3.4 BORDER EFFECTS ---
-        # Check for gradient borders or animated borders
-        has_border = bool(re.search(r'border:|border-', content))
-        if has_border:
-            # Check for overly complex borders
-            border_count = len(re.findall(r'border:', content))
-            if border_count > 8:
-                self.warnings.append(f"[Visual] {filename}: Many border declarations ({border_count}). Simplify for cleaner look.")
-
-        # --- 3.5 GLOW EFFECTS ---
-        # Check for text-shadow or multiple box-shadow layers (glow effects)
-        text_shadows = re.findall(r'text-shadow:', content)
-        for ts in text_shadows:
-            # Multiple text-shadow layers indicate glow
-            if ',' in ts:
-                self.warnings.append(f"[Visual] {filename}: Text glow effect detected. Ensure readability is maintained.")
-
-        # Check for box-shadow glow (multiple layers with 0 offset)
-        glow_shadows = re.findall(r'box-shadow:\s*[^;]*0\s+0\s+', content)
-        if len(glow_shadows) > 2:
-            self.warnings.append(f"[Visual] {filename}: Multiple glow effects detected. Use sparingly for emphasis only.")
-
-        # --- 3.6 OVERLAY TECHNIQUES ---
-        # Check for image overlays (for readability)
-        has_images = bool(re.search(r'<img|background-image:|bg-\[url', content))
-        if has_images and has_long_text:
-            has_overlay = bool(re.search(r'overlay|rgba\(0|gradient.*transparent|::after|::before', content))
-            if not has_overlay:
-                self.warnings.append(f"[Visual] {filename}: Text over image without overlay. Add gradient overlay for readability.")
-
-        # --- 3.7 PERFORMANCE: will-change ---
-        # Check for will-change usage
-        if re.search(r'will-change:', content):
-            will_change_props = re.findall(r'will-change:\s*([^;]+)', content)
-            for prop in will_change_props:
-                prop = prop.strip().lower()
-                if prop in ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']:
-                    self.issues.append(f"[Performance] {filename}: will-change on '{prop}' (layout property). Use only for transform/opacity.")
-
-        # Check for excessive will-change usage
-        will_change_count = len(re.findall(r'will-change:', content))
-        if will_change_count > 3:
-            self.warnings.append(f"[Performance] {filename}: Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations.")
-
-        # --- 3.8 EFFECT SELECTION ---
-        # Check for effect overuse (too many visual effects)
-        effect_count = (
-            (1 if has_gradient else 0) +
-            shadow_count +
-            len(re.findall(r'backdrop-filter|blur\(', content)) +
-            len(re.findall(r'text-shadow:', content))
+                sizes.append(float(size) / 16)  # Normalize to rem
+        return sizes
+
+    @cached_property
+    def effect_count(self):
+        return (
+            (1 if self.has_gradient else 0) +
+            len(self.shadows) +
+            self.count(P.BLUR) +
+            self.count(P.TEXT_SHADOW)
         )
-        if effect_count > 10:
-            self.warnings.append(f"[Visual] {filename}: Many visual effects ({effect_count}). Ensure effects serve purpose, not decoration.")
-
-        # Check for static/flat design (no depth)
-        if has_long_text and effect_count == 0:
-            self.warnings.append(f"[Visual] {filename}: Flat design with no depth. Consider shadows or subtle gradients for hierarchy.")
-
-        # --- 4. COLOR SYSTEM (color-system.md) ---
-
-        # 4.1 PURPLE BAN - Critical check from color-system.md
-        purple_hexes = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
-                        '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
-                        '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
-                        'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
-        for purple in purple_hexes:
-            if purple.lower() in content.lower():
-                self.issues.append(f"[Color] {filename}: PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
+
+
+# ============================================================================
+#  RULES (evaluated in order against the feature vector)
+# ============================================================================
+
+ISSUE, WARNING, PASS = 'issue', 'warning', 'pass'
+
+Rule = namedtuple('Rule', ['name', 'tag', 'check'])
+RULES = []
+
+
+def rule(tag: str):
+    """Register a check; it yields (level, message) pairs for one file."""
+    def register(check):
+        RULES.append(Rule(check.__name__, tag, check))
+        return check
+    return register
+
+
+# --- 1. PSYCHOLOGY LAWS ---
+
+@rule("Hick's Law")
+def hicks_law(f):
+    if f.nav_items > 7:
+        yield ISSUE, f"{f.nav_items} nav items (Max 7)"
+
+@rule("Fitts' Law")
+def fitts_law(f):
+    if f.has(P.SMALL_HEIGHT_PX) or f.has(P.SMALL_HEIGHT_TW):
+        yield WARNING, "Small targets (< 44px)"
+
+@rule("Miller's Law")
+def millers_law(f):
+    if f.form_fields > 7 and not f.has(P.MULTI_STEP):
+        yield WARNING, f"Complex form ({f.form_fields} fields)"
+
+@rule("Von Restorff")
+def von_restorff(f):
+    if 'button' in f.lower and not f.has(P.PRIMARY_CTA):
+        yield WARNING, "No primary CTA"
+
+@rule("Serial Position")
+def serial_position(f):
+    # Important items at beginning/end
+    if f.nav_items > 3:
+        # Check if last nav item is important (contact, login, etc.)
+        nav_content = f.all(P.NAV_CONTENT)
+        if nav_content and len(nav_content) > 2:
+            last_item = nav_content[-1].lower() if nav_content else ''
+            if not any(x in last_item for x in ['contact', 'login', 'sign', 'get started', 'cta', 'button']):
+                yield WARNING, "Last nav item may not be important. Place key actions at start/end."
+
+# --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
+
+@rule("Visceral")
+def visceral(f):
+    # First impressions (aesthetics, gradients, animations)
+    if f.has_hero:
+        has_visual_interest = f.has_gradient or f.has(P.ANIMATIONS)
+        if not has_visual_interest and not f.has_background:
+            yield WARNING, "Hero section lacks visual appeal. Consider gradients or subtle animations."
+
+@rule("Behavioral")
+def behavioral(f):
+    # Instant feedback and usability
+    if f.has_interaction:
+        if not f.has(P.FEEDBACK) and not f.has(P.STATE_CHANGE):
+            yield WARNING, "Interactive elements lack immediate feedback. Add hover/focus/disabled states."
+
+@rule("Reflective")
+def reflective(f):
+    # Brand story, values, identity
+    if f.has_long_text and not f.has(P.REFLECTIVE):
+        yield WARNING, "Long-form content without brand story/values. Add 'About' or 'Why We Exist' section."
+
+# --- 1.6 TRUST BUILDING (Enhanced) ---
+
+@rule("Trust")
+def security_signals(f):
+    if f.has_form and not f.has(P.SECURITY_SIGNALS) and not f.has(P.CHECKOUT):
+        yield WARNING, "Form without security indicators. Add 'SSL Secure' or lock icon."
+
+@rule("Trust")
+def social_proof(f):
+    if f.has(P.SOCIAL_PROOF):
+        yield PASS, ""
+    elif f.has_long_text:
+        yield WARNING, "No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos."
+
+@rule("Trust")
+def authority(f):
+    if f.has(P.FOOTER) and not f.has(P.AUTHORITY):
+        yield WARNING, "Footer lacks authority signals. Add certifications, awards, or media mentions."
+
+# --- 1.7 COGNITIVE LOAD MANAGEMENT ---
+
+@rule("Cognitive Load")
+def progressive_disclosure(f):
+    if f.complex_elements > 5 and not f.has(P.PROGRESSIVE):
+        yield WARNING, "Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle."
+
+@rule("Cognitive Load")
+def visual_noise(f):
+    if f.count(P.COLORS) > 15 and f.count(P.BORDER) > 10:
+        yield WARNING, "High visual noise detected. Many colors and borders increase cognitive load."
+
+@rule("Cognitive Load")
+def familiar_patterns(f):
+    if f.has_form and not f.has(P.LABELS):
+        yield ISSUE, "Form inputs without labels. Use <label> for accessibility and clarity."
+
+# --- 1.8 PERSUASIVE DESIGN (Ethical) ---
+
+@rule("Persuasion")
+def smart_defaults(f):
+    if f.has_form and f.count(P.RADIO) > 0 and not f.has(P.DEFAULTS):
+        yield WARNING, "Radio buttons without default selection. Pre-select recommended option."
+
+@rule("Persuasion")
+def anchoring(f):
+    # Show original price to frame the discount
+    if f.has(P.PRICE) and not f.has(P.PRICE_ANCHOR):
+        yield WARNING, "Prices without anchoring. Show original price to frame discount value."
+
+@rule("Persuasion")
+def social_numbers(f):
+    if f.has(P.SOCIAL) and not f.has(P.SOCIAL_COUNT):
+        yield WARNING, "Social proof without specific numbers. Use 'Join 10,000+' format."
+
+@rule("Persuasion")
+def progress_indicators(f):
+    if f.has_form and f.complex_elements > 5 and not f.has(P.PROGRESS):
+        yield WARNING, "Long form without progress indicator. Add progress bar or 'Step X of Y'."
+
+# --- 2. TYPOGRAPHY SYSTEM ---
+
+@rule("Typography")
+def font_pairing(f):
+    if len(f.font_families) > 3:
+        yield ISSUE, f"{len(f.font_families)} font families detected. Limit to 2-3 for cohesion."
+
+@rule("Typography")
+def line_length(f):
+    if f.has_long_text and not f.has(P.LINE_LENGTH):
+        yield WARNING, "No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch]."
+
+@rule("Typography")
+def line_height(f):
+    if f.has(P.TEXT_ELEMENTS) and not f.has(P.LEADING):
+        yield WARNING, "Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3"
+
+@rule("Typography")
+def heading_line_height(f):
+    if f.has(P.HEADING_TEXT):
+        for lh in f.all(P.LINE_HEIGHT_VALUES):
+            if float(lh) > 1.5:
+                yield WARNING, f"Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3)."
+
+@rule("Typography")
+def uppercase_tracking(f):
+    if f.has(P.UPPERCASE) and not f.has(P.TRACKING):
+        yield WARNING, "Uppercase text without tracking. ALL CAPS needs +5-10% spacing."
+
+@rule("Typography")
+def display_tracking(f):
+    # Large text (display/hero) should have negative tracking
+    if f.has(P.DISPLAY_TEXT) and not f.has(P.TRACKING_TIGHT):
+        yield WARNING, "Large display text without tracking-tight. Big text needs -1% to -4% spacing."
+
+@rule("Typography")
+def weight_contrast(f):
+    # Adjacent weights (400/500, 500/600, etc.) have poor contrast
+    weights = f.font_weights
+    for i in range(len(weights) - 1):
+        if abs(weights[i] - weights[i+1]) == 100:
+            yield WARNING, f"Adjacent font weights ({weights[i]}/{weights[i+1]}). Skip at least 2 levels for contrast."
+
+@rule("Typography")
+def weight_count(f):
+    unique_weights = set(f.font_weights)
+    if len(unique_weights) > 4:
+        yield WARNING, f"{len(unique_weights)} font weights. Limit to 3-4 per page."
+
+@rule("Typography")
+def fluid_typography(f):
+    if f.has(P.FONT_SIZES) and not f.has(P.FLUID):
+        yield WARNING, "Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)"
+
+@rule("Typography")
+def heading_hierarchy(f):
+    headings = f.headings
+    if headings:
+        # Check for skipped levels (h1 -> h3)
+        for i in range(len(headings) - 1):
+            curr = int(headings[i][1])
+            next_h = int(headings[i+1][1])
+            if next_h > curr + 1:
+                yield WARNING, f"Skipped heading level (h{curr} -> h{next_h}). Maintain sequential hierarchy."
+
+        # Check if h1 exists for main content
+        if 'h1' not in [h.lower() for h in headings] and f.has_long_text:
+            yield WARNING, "No h1 found. Each page should have one primary heading."
+
+@rule("Typography")
+def modular_scale(f):
+    size_values = f.font_sizes_rem
+    if len(size_values) > 2:
+        sorted_sizes = sorted(set(size_values))
+        ratios = []
+        for i in range(1, len(sorted_sizes)):
+            if sorted_sizes[i-1] > 0:
+                ratios.append(sorted_sizes[i] / sorted_sizes[i-1])
+
+        for ratio in ratios[:3]:  # Check first 3 ratios
+            if not any(abs(ratio - cr) < 0.05 for cr in COMMON_RATIOS):
+                yield WARNING, f"Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third)."
                 break
 
-        # 4.2 60-30-10 Rule check
-        # Count color usage to estimate ratio
-        color_hex_count = len(re.findall(r'#[0-9a-fA-F]{3,6}', content))
-        hsl_count = len(re.findall(r'hsl\(', content))
-        total_colors = color_hex_count + hsl_count
-        if total_colors > 3:
-            # Check for dominant colors (should be ~60%)
-            bg_declarations = re.findall(r'(?:background|bg-|bg\[)([^;}\s]+)', content)
-            text_declarations = re.findall(r'(?:color|text-)([^;}\s]+)', content)
-            if len(bg_declarations) > 0 and len(text_declarations) > 0:
-                # Just warn if too many distinct colors
-                unique_hexes = set(re.findall(r'#[0-9a-fA-F]{6}', content))
-                if len(unique_hexes) > 5:
-                    self.warnings.append(f"[Color] {filename}: {len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).")
-
-        # 4.3 Color Scheme Pattern Detection
-        # Detect monochromatic (same hue, different lightness)
-        hsl_matches = re.findall(r'hsl\((\d+),\s*\d+%,\s*\d+%\)', content)
-        if len(hsl_matches) >= 3:
-            hues = [int(h) for h in hsl_matches]
-            hue_range = max(hues) - min(hues)
-            if hue_range < 10:
-                self.warnings.append(f"[Color] {filename}: Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast.")
-
-        # 4.4 Dark Mode Compliance
-        # Check for pure black (#000000) or pure white (#FFFFFF) text (forbidden)
-        if re.search(r'color:\s*#000000|#000\b', content):
-            self.warnings.append(f"[Color] {filename}: Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.")
-        if re.search(r'background:\s*#ffffff|#fff\b', content) and re.search(r'dark:\s*|dark:', content):
-            self.warnings.append(f"[Color] {filename}: Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.")
-
-        # 4.5 WCAG Contrast Pattern Check
-        # Look for potential low-contrast combinations
-        light_bg_light_text = bool(re.search(r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', content))
-        dark_bg_dark_text = bool(re.search(r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', content))
-        if light_bg_light_text or dark_bg_dark_text:
-            self.warnings.append(f"[Color] {filename}: Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
-
-        # 4.6 Color Psychology Context Check
-        # Warn if blue used for food/restaurant context
-        has_blue = bool(re.search(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', content))
-        has_food_context = bool(re.search(r'restaurant|food|cooking|recipe|menu|dish|meal', content, re.IGNORECASE))
-        if has_blue and has_food_context:
-            self.warnings.append(f"[Color] {filename}: Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).")
-
-        # 4.7 HSL-Based Palette Detection
-        # Check if using HSL for palette (recommended in color-system.md)
-        has_color_vars = bool(re.search(r'--color-|color-|primary-|secondary-', content))
-        if has_color_vars and not re.search(r'hsl\(', content):
-            self.warnings.append(f"[Color] {filename}: Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).")
-
-        # --- 5. ANIMATION GUIDE (animation-guide.md) ---
-
-        # 5.1 Duration Appropriateness
-        # Check for excessively long or short animations
-        durations = re.findall(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', content)
-        for duration, unit in durations:
-            duration_ms = float(duration) * (1000 if unit == 's' else 1)
-            if duration_ms < 50:
-                self.warnings.append(f"[Animation] {filename}: Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
-            elif duration_ms > 1000 and 'transition' in content.lower():
-                self.warnings.append(f"[Animation] {filename}: Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
-
-        # 5.2 Easing Function Correctness
-        # Check for incorrect easing patterns
-        if re.search(r'ease-in\s+.*entry|fade-in.*ease-in', content):
-            self.warnings.append(f"[Animation] {filename}: Entry animation with ease-in. Entry should use ease-out for snappy feel.")
-        if re.search(r'ease-out\s+.*exit|fade-out.*ease-out', content):
-            self.warnings.append(f"[Animation] {filename}: Exit animation with ease-out. Exit should use ease-in for natural feel.")
-
-        # 5.3 Micro-interaction Feedback Patterns
-        # Check for interactive elements without hover/focus states
-        interactive_elements = len(re.findall(r'<button|<a\s+href|onClick|@click', content))
-        has_hover_focus = bool(re.search(r'hover:|focus:|:hover|:focus', content))
-        if interactive_elements > 2 and not has_hover_focus:
-            self.warnings.append(f"[Animation] {filename}: Interactive elements without hover/focus states. Add micro-interactions for feedback.")
-
-        # 5.4 Loading State Indicators
-        # Check for loading patterns
-        has_async = bool(re.search(r'async|await|fetch|axios|loading|isLoading', content))
-        has_loading_indicator = bool(re.search(r'skeleton|spinner|progress|loading|<circle.*animate', content))
-        if has_async and not has_loading_indicator:
-            self.warnings.append(f"[Animation] {filename}: Async operations without loading indicator. Add skeleton or spinner for perceived performance.")
-
-        # 5.5 Page Transition Patterns
-        # Check for page/view transitions
-        has_routing = bool(re.search(r'router|navigate|Link.*to|useHistory', content))
-        has_page_transition = bool(re.search(r'AnimatePresence|motion\.|transition.*page|fade.*route', content))
-        if has_routing and not has_page_transition:
-            self.warnings.append(f"[Animation] {filename}: Routing detected without page transitions. Consider fade/slide for context continuity.")
-
-        # 5.6 Scroll Animation Performance
-        # Check for scroll-driven animations
-        has_scroll_anim = bool(re.search(r'onScroll|scroll.*trigger|IntersectionObserver', content))
-        if has_scroll_anim:
-            # Check if using expensive properties in scroll handlers
-            if re.search(r'onScroll.*[^\w](width|height|top|left)', content):
-                self.issues.append(f"[Animation] {filename}: Scroll handler animating layout properties. Use transform/opacity for 60fps.")
-
-        # --- 6. MOTION GRAPHICS (motion-graphics.md) ---
-
-        # 6.1 Lottie Animation Checks
-        has_lottie = bool(re.search(r'lottie|Lottie|@lottie-react', content))
-        if has_lottie:
-            # Check for reduced motion fallback
-            has_lottie_fallback = bool(re.search(r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', content))
-            if not has_lottie_fallback:
-                self.warnings.append(f"[Motion] {filename}: Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.")
-
-        # 6.2 GSAP Memory Leak Risks
-        has_gsap = bool(re.search(r'gsap|ScrollTrigger|from\(.*gsap', content))
-        if has_gsap:
-            # Check for cleanup patterns
-            has_gsap_cleanup = bool(re.search(r'kill\(|revert\(|useEffect.*return.*gsap', content))
-            if not has_gsap_cleanup:
-                self.issues.append(f"[Motion] {filename}: GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.")
-
-        # 6.3 SVG Animation Performance
-        svg_animations = re.findall(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset', content)
-        if len(svg_animations) > 3:
-            self.warnings.append(f"[Motion] {filename}: Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.")
-
-        # 6.4 3D Transform Performance
-        has_3d_transform = bool(re.search(r'transform3d|perspective\(|rotate3d|translate3d', content))
-        if has_3d_transform:
-            # Check for perspective on parent
-            has_perspective_parent = bool(re.search(r'perspective:\s*\d+px|perspective\s*\(', content))
-            if not has_perspective_parent:
-                self.warnings.append(f"[Motion] {filename}: 3D transform without perspective parent. Add perspective: 1000px for realistic depth.")
-
-            # Warn about mobile performance
-            self.warnings.append(f"[Motion] {filename}: 3D transforms detected. Test on mobile; can impact performance on low-end devices.")
-
-        # 6.5 Particle Effect Warnings
-        # Check for canvas/WebGL particle systems
-        has_particles = bool(re.search(r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js', content))
-        if has_particles:
-            self.warnings.append(f"[Motion] {filename}: Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.")
-
-        # 6.6 Scroll-Driven Animation Performance
-        has_scroll_driven = bool(re.search(r'IntersectionObserver.*animate|scroll.*progress|view-timeline', content))
-        if has_scroll_driven:
-            # Check for throttling/debouncing
-            has_throttle = bool(re.search(r'throttle|debounce|requestAnimationFrame', content))
-            if not has_throttle:
-                self.issues.append(f"[Motion] {filename}: Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.")
-
-        # 6.7 Motion Decision Tree - Context Check
-        # Check if animation serves purpose (not just decoration)
-        total_animations = (
-            len(re.findall(r'@keyframes|transition:|animate-', content)) +
-            (1 if has_lottie else 0) +
-            (1 if has_gsap else 0)
-        )
-        if total_animations > 5:
-            # Check if animations are functional
-            functional_animations = len(re.findall(r'hover:|focus:|disabled|loading|error|success', content))
-            if functional_animations < total_animations / 2:
-                self.warnings.append(f"[Motion] {filename}: Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration.")
-
-        # --- 7. ACCESSIBILITY ---
-        if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
-            self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
-
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+@rule("Typography")
+def paragraph_length(f):
+    # Very long paragraphs (>5 lines estimated)
+    for p in f.paragraphs:
+        word_count = len(p.split())
+        if word_count > 100:  # ~5-6 lines
+            yield WARNING, f"Long paragraph detected ({word_count} words). Break into 3-4 line chunks for readability."
+
+@rule("Typography")
+def subheadings(f):
+    if len(f.paragraphs) > 5 and f.count(P.SUBHEADINGS) == 0:
+        yield WARNING, "Long content without subheadings. Add h2/h3 to break up text."
+
+# --- 3. VISUAL EFFECTS (visual-effects.md) ---
+
+@rule("Visual")
+def glassmorphism(f):
+    if 'backdrop-filter' in f.text or 'blur(' in f.text:
+        if not f.has(P.TRANSLUCENT_BG):
+            yield WARNING, "Blur used without semi-transparent background (Glassmorphism fail)"
+
+@rule("Performance")
+def gpu_acceleration(f):
+    if f.animates:
+        expensive_props = f.all(P.EXPENSIVE_PROPS)
+        if expensive_props:
+            yield WARNING, f"Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible."
+
+@rule("Accessibility")
+def reduced_motion(f):
+    if f.animates and not f.has(P.REDUCED_MOTION):
+        yield WARNING, "Animations found without prefers-reduced-motion check"
+
+@rule("Visual")
+def natural_shadows(f):
+    for shadow in f.shadows:
+        # Check if natural (Y > X) or multiple layers
+        if ',' not in shadow and not P.SHADOW_Y_OFFSET.regex.search(shadow):
+            yield WARNING, "Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism."
+
+@rule("Visual")
+def neomorphism(f):
+    for shadow in f.shadows:
+        # Neomorphism has two shadows: positive offset + negative offset
+        if ',' in shadow and '-' in shadow and 'inset' in shadow:
+            yield WARNING, "Neomorphism inset detected. Ensure adequate contrast for accessibility."
+
+@rule("Visual")
+def shadow_hierarchy(f):
+    shadow_count = len(f.shadows)
+    if shadow_count >= 3:
+        # Shadow opacity levels should indicate elevation
+        shadow_opacities = [float(o) for o in f.all(P.OPACITIES) if float(o) < 0.5]
+        if len(shadow_opacities) > 0 and len(set(shadow_opacities)) < 2:
+            yield WARNING, "All shadows at same opacity level. Vary shadow intensity for elevation hierarchy."
+
+@rule("Visual")
+def gradients(f):
+    if f.has_gradient:
+        # Warn about mesh/aurora gradients (can be overused)
+        gradient_count = f.count(P.GRADIENT_ANY_CASE)
+        if gradient_count > 5:
+            yield WARNING, f"Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration."
+    elif f.has_hero and not f.has_background:
+        yield WARNING, "Hero section without visual interest. Consider gradient for depth."
+
+@rule("Visual")
+def border_effects(f):
+    if f.has(P.BORDER):
+        border_count = f.count(P.BORDER_DECL)
+        if border_count > 8:
+            yield WARNING, f"Many border declarations ({border_count}). Simplify for cleaner look."
+
+@rule("Visual")
+def text_glow(f):
+    for ts in f.all(P.TEXT_SHADOW):
+        # Multiple text-shadow layers indicate glow
+        if ',' in ts:
+            yield WARNING, "Text glow effect detected. Ensure readability is maintained."
+
+@rule("Visual")
+def box_glow(f):
+    # Multiple box-shadow layers with 0 offset
+    if f.count(P.GLOW_SHADOW) > 2:
+        yield WARNING, "Multiple glow effects detected. Use sparingly for emphasis only."
+
+@rule("Visual")
+def overlays(f):
+    if f.has(P.IMAGES) and f.has_long_text and not f.has(P.OVERLAY):
+        yield WARNING, "Text over image without overlay. Add gradient overlay for readability."
+
+@rule("Performance")
+def will_change_layout(f):
+    if f.has(P.WILL_CHANGE):
+        for prop in f.all(P.WILL_CHANGE_VALUES):
+            prop = prop.strip().lower()
+            if prop in LAYOUT_PROPS:
+                yield ISSUE, f"will-change on '{prop}' (layout property). Use only for transform/opacity."
+
+@rule("Performance")
+def will_change_count(f):
+    will_change_count = f.count(P.WILL_CHANGE)
+    if will_change_count > 3:
+        yield WARNING, f"Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations."
+
+@rule("Visual")
+def effect_overuse(f):
+    if f.effect_count > 10:
+        yield WARNING, f"Many visual effects ({f.effect_count}). Ensure effects serve purpose, not decoration."
+
+@rule("Visual")
+def flat_design(f):
+    if f.has_long_text and f.effect_count == 0:
+        yield WARNING, "Flat design with no depth. Consider shadows or subtle gradients for hierarchy."
+
+# --- 4. COLOR SYSTEM (color-system.md) ---
+
+@rule("Color")
+def purple_ban(f):
+    for purple in PURPLE_HEXES:
+        if purple.lower() in f.lower:
+            yield ISSUE, f"PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead."
+            break
+
+@rule("Color")
+def color_60_30_10(f):
+    total_colors = f.count(P.HEX) + f.count(P.HSL)
+    if total_colors > 3 and f.has(P.BG_DECLARATIONS) and f.has(P.TEXT_DECLARATIONS):
+        unique_hexes = set(f.all(P.HEX6))
+        if len(unique_hexes) > 5:
+            yield WARNING, f"{len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%)."
+
+@rule("Color")
+def monochromatic(f):
+    hsl_matches = f.all(P.HSL_HUES)
+    if len(hsl_matches) >= 3:
+        hues = [int(h) for h in hsl_matches]
+        hue_range = max(hues) - min(hues)
+        if hue_range < 10:
+            yield WARNING, f"Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast."
+
+@rule("Color")
+def dark_mode(f):
+    # Pure black (#000000) or pure white (#FFFFFF) are discouraged
+    if f.has(P.PURE_BLACK):
+        yield WARNING, "Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode."
+    if f.has(P.PURE_WHITE_BG) and f.has(P.DARK_MODE):
+        yield WARNING, "Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain."
+
+@rule("Color")
+def low_contrast(f):
+    if f.has(P.LIGHT_ON_LIGHT) or f.has(P.DARK_ON_DARK):
+        yield WARNING, "Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text)."
+
+@rule("Color")
+def color_psychology(f):
+    # Blue suppresses appetite in food/restaurant context
+    if f.has(P.BLUE) and f.has(P.FOOD):
+        yield WARNING, "Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow)."
+
+@rule("Color")
+def hsl_palette(f):
+    if f.has(P.COLOR_VARS) and not f.has(P.HSL):
+        yield WARNING, "Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness)."
+
+# --- 5. ANIMATION GUIDE (animation-guide.md) ---
+
+@rule("Animation")
+def durations(f):
+    for duration, unit in f.all(P.DURATIONS):
+        duration_ms = float(duration) * (1000 if unit == 's' else 1)
+        if duration_ms < 50:
+            yield WARNING, f"Very fast animation ({duration}{unit}). Minimum 50ms for visibility."
+        elif duration_ms > 1000 and 'transition' in f.lower:
+            yield WARNING, f"Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness."
+
+@rule("Animation")
+def easing(f):
+    if f.has(P.ENTRY_EASE_IN):
+        yield WARNING, "Entry animation with ease-in. Entry should use ease-out for snappy feel."
+    if f.has(P.EXIT_EASE_OUT):
+        yield WARNING, "Exit animation with ease-out. Exit should use ease-in for natural feel."
+
+@rule("Animation")
+def micro_interactions(f):
+    if f.count(P.INTERACTIVE) > 2 and not f.has(P.HOVER_FOCUS):
+        yield WARNING, "Interactive elements without hover/focus states. Add micro-interactions for feedback."
+
+@rule("Animation")
+def loading_states(f):
+    if f.has(P.ASYNC) and not f.has(P.LOADING_INDICATOR):
+        yield WARNING, "Async operations without loading indicator. Add skeleton or spinner for perceived performance."
+
+@rule("Animation")
+def page_transitions(f):
+    if f.has(P.ROUTING) and not f.has(P.PAGE_TRANSITION):
+        yield WARNING, "Routing detected without page transitions. Consider fade/slide for context continuity."
+
+@rule("Animation")
+def scroll_performance(f):
+    if f.has(P.SCROLL_ANIMATION) and f.has(P.SCROLL_LAYOUT):
+        yield ISSUE, "Scroll handler animating layout properties. Use transform/opacity for 60fps."
+
+# --- 6. MOTION GRAPHICS (motion-graphics.md) ---
+
+@rule("Motion")
+def lottie(f):
+    if f.has_lottie and not f.has(P.LOTTIE_FALLBACK):
+        yield WARNING, "Lottie animation without reduced-motion fallback. Add pause/stop for accessibility."
+
+@rule("Motion")
+def gsap_cleanup(f):
+    if f.has_gsap and not f.has(P.GSAP_CLEANUP):
+        yield ISSUE, "GSAP animation without cleanup (kill/revert). Memory leak risk on unmount."
+
+@rule("Motion")
+def svg_animation(f):
+    if f.count(P.SVG_ANIMATIONS) > 3:
+        yield WARNING, "Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance."
+
+@rule("Motion")
+def transforms_3d(f):
+    if f.has(P.TRANSFORM_3D):
+        if not f.has(P.PERSPECTIVE):
+            yield WARNING, "3D transform without perspective parent. Add perspective: 1000px for realistic depth."
+        yield WARNING, "3D transforms detected. Test on mobile; can impact performance on low-end devices."
+
+@rule("Motion")
+def particles(f):
+    if f.has(P.PARTICLES):
+        yield WARNING, "Particle effects detected. Ensure fallback or reduced-quality option for mobile devices."
+
+@rule("Motion")
+def scroll_driven(f):
+    if f.has(P.SCROLL_DRIVEN) and not f.has(P.THROTTLE):
+        yield ISSUE, "Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps."
+
+@rule("Motion")
+def motion_purpose(f):
+    # Animations should serve a purpose, not just decorate
+    total_animations = (
+        f.count(P.ANIMATIONS) +
+        (1 if f.has_lottie else 0) +
+        (1 if f.has_gsap else 0)
+    )
+    if total_animations > 5 and f.count(P.FUNCTIONAL_ANIMATIONS) < total_animations / 2:
+        yield WARNING, f"Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration."
+
+# --- 7. ACCESSIBILITY ---
+
+@rule("Accessibility")
+def img_alt(f):
+    if f.has(P.IMG_NO_ALT):
+        yield ISSUE, "Missing img alt text"
+
+
+# ============================================================================
+#  AUDITOR
+# ============================================================================
+
+class UXAuditor(Auditor):
+    name = "ux_audit"
+    extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
+    skip_dirs = {'node_modules', '.git', 'dist', 'build', '.next'}
+    state_fields = ('issues', 'warnings', 'passed_count', 'files_checked')
+
+    def __init__(self, rules=None, benchmark: bool = False):
+        super().__init__()
+        self.rules = RULES if rules is None else rules
+        self.issues = []
+        self.warnings = []
+        self.passed_count = 0
+        self.files_checked = 0
+        # Seconds spent per rule (features are charged to the first rule using them)
+        self.rule_times = {r.name: 0.0 for r in self.rules} if benchmark else None
+    
+    def audit_file(self, filepath: str) -> None:
+        path = Path(filepath)
+        self.visit(FileContext(path, Path(path.name)))
+
+    def visit(self, ctx: FileContext) -> None:
+        try:
+            ctx.text
+        except OSError: return
+        
+        self.files_checked += 1
+        filename = ctx.name
+        features = Features(ctx)
+        timings = self.rule_times
+
+        for r in self.rules:
+            start = time.perf_counter() if timings is not None else 0.0
+            for level, message in r.check(features):
+                if level == PASS:
+                    self.passed_count += 1
+                elif level == ISSUE:
+                    self.issues.append(f"[{r.tag}] {filename}: {message}")
+                else:
+                    self.warnings.append(f"[{r.tag}] {filename}: {message}")
+            if timings is not None:
+                timings[r.name] += time.perf_counter() - start
+
+    def audit_directory(self, directory: str, index: AuditIndex = None) -> None:
+        ScanEngine(directory, [self], index=index).run()
+
+    def report(self) -> dict:
+        return self.get_report()
 
     def get_report(self):
-        return {
+        report = {
             "files_checked": self.files_checked,
             "issues": self.issues,
             "warnings": self.warnings,
             "passed_checks": self.passed_count,
             "compliant": len(self.issues) == 0
         }
+        if self.rule_times is not None:
+            report["rule_times_ms"] = {name: round(t * 1000, 3) for name, t in
+                                       sorted(self.rule_times.items(), key=lambda kv: -kv[1])}
+        return report
 
 def main():
     if len(sys.argv) < 2: sys.exit(1)
     
     path = sys.argv[1]
     is_json = "--json" in sys.argv
+    benchmark = "--benchmark" in sys.argv
+    incremental, since = incremental_flags(sys.argv)
+    index = AuditIndex(path, since=since) if incremental and os.path.isdir(path) else None
     
-    auditor = UXAuditor()
+    auditor = UXAuditor(benchmark=benchmark)
     if os.path.isfile(path): auditor.audit_file(path)
-    else: auditor.audit_directory(path)
+    else: auditor.audit_directory(path, index=index)
     
     report = auditor.get_report()
+    if index is not None:
+        report["incremental"] = index.summary()
     
     if is_json:
         print(json.dumps(report))
@@ -715,6 +936,11 @@ def main():
         print(f"[+] PASSED CHECKS: {report['passed_checks']}")
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
+        if benchmark:
+            print("-" * 50)
+            print("[BENCHMARK] Slowest rules (ms):")
+            for name, ms in list(report['rule_times_ms'].items())[:10]:
+                print(f"  {ms:>9.3f}  {name}")
 
     sys.exit(0 if report['compliant'] else 1)
 
@@ -21,6 +21,10 @@ import re
 import json
 from pathlib import Path
 
+# Shared single-pass scan engine lives in .agents/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from _scan_engine import ScanEngine, Auditor, FileContext
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -78,30 +82,49 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
-def find_web_pages(project_path: Path) -> list:
-    """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
-    
-    return files[:30]  # Limit to 30 pages
+class GEOAuditor(Auditor):
+    """Scores public web pages (first 30) for AI citation readiness."""
+
+    name = "geo_checker"
+    extensions = {'.html', '.htm', '.jsx', '.tsx'}
+    skip_dirs = SKIP_DIRS
+    max_files = 30  # Limit to 30 pages
+
+    def __init__(self, project_path: Path):
+        super().__init__()
+        self.project_path = project_path
+        self.results = []
+
+    def accepts(self, path: Path) -> bool:
+        # Check if it's likely a page
+        return is_page_file(path)
 
+    def visit(self, ctx: FileContext) -> None:
+        self.results.append(check_page(ctx))
 
-def check_page(file_path: Path) -> dict:
+    def average_score(self) -> float:
+        return sum(r['score'] for r in self.results) / len(self.results) if self.results else 0
+
+    def report(self) -> dict:
+        if not self.results:
+            return {"script": "geo_checker", "pages_found": 0, "passed": True}
+        avg_score = self.average_score()
+        return {
+            "script": "geo_checker",
+            "project": str(self.project_path),
+            "pages_checked": len(self.results),
+            "average_score": round(avg_score),
+            "passed": avg_score >= 60
+        }
+
+
+def check_page(ctx: FileContext) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = ctx.text
+        lower = ctx.lower
     except Exception as e:
-        return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
+        return {'file': str(ctx.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
     issues = []
     passed = []
@@ -120,8 +143,8 @@ def check_page(file_path: Path) -> dict:
         issues.append("No JSON-LD structured data (AI engines prefer structured content)")
     
     # 2. Heading Structure
-    h1_count = len(re.findall(r'<h1[^>]*>', content, re.I))
-    h2_count = len(re.findall(r'<h2[^>]*>', content, re.I))
+    h1_count = ctx.count(r'<h1[^>]*>', re.I)
+    h2_count = ctx.count(r'<h2[^>]*>', re.I)
     
     if h1_count == 1:
         passed.append("Single H1 heading (clear topic)")
@@ -137,7 +160,7 @@ def check_page(file_path: Path) -> dict:
     
     # 3. Author Attribution (E-E-A-T signal)
     author_patterns = ['author', 'byline', 'written-by', 'contributor', 'rel="author"']
-    has_author = any(p in content.lower() for p in author_patterns)
+    has_author = any(p in lower for p in author_patterns)
     if has_author:
         passed.append("Author attribution found")
     else:
@@ -145,7 +168,7 @@ def check_page(file_path: Path) -> dict:
     
     # 4. Publication Date (Freshness signal)
     date_patterns = ['datePublished', 'dateModified', 'datetime=', 'pubdate', 'article:published']
-    has_date = any(re.search(p, content, re.I) for p in date_patterns)
+    has_date = any(ctx.search(p, re.I) for p in date_patterns)
     if has_date:
         passed.append("Publication date found")
     else:
@@ -153,17 +176,17 @@ def check_page(file_path: Path) -> dict:
     
     # 5. FAQ Section (Highly citable)
     faq_patterns = [r'<details', r'faq', r'frequently.?asked', r'"FAQPage"']
-    has_faq = any(re.search(p, content, re.I) for p in faq_patterns)
+    has_faq = any(ctx.search(p, re.I) for p in faq_patterns)
     if has_faq:
         passed.append("FAQ section detected (highly citable)")
     
     # 6. Lists (Structured content)
-    list_count = len(re.findall(r'<(ul|ol)[^>]*>', content, re.I))
+    list_count = ctx.count(r'<(ul|ol)[^>]*>', re.I)
     if list_count >= 2:
         passed.append(f"{list_count} lists (structured content)")
     
     # 7. Tables (Comparison data)
-    table_count = len(re.findall(r'<table[^>]*>', content, re.I))
+    table_count = ctx.count(r'<table[^>]*>', re.I)
     if table_count >= 1:
         passed.append(f"{table_count} table(s) (comparison data)")
     
@@ -175,7 +198,7 @@ def check_page(file_path: Path) -> dict:
         r'itemtype.*schema\.org/(Organization|Person|Brand)',
         r'rel="author"'
     ]
-    has_entity = any(re.search(p, content, re.I) for p in entity_patterns)
+    has_entity = any(ctx.search(p, re.I) for p in entity_patterns)
     if has_entity:
         passed.append("Entity/Brand recognition (E-E-A-T)")
     
@@ -189,7 +212,7 @@ def check_page(file_path: Path) -> dict:
         r'\d+x\s+(faster|better|more)', # Comparison stats
         r'(million|billion|trillion)', # Large numbers
     ]
-    stat_matches = sum(1 for p in stat_patterns if re.search(p, content, re.I))
+    stat_matches = sum(1 for p in stat_patterns if ctx.search(p, re.I))
     if stat_matches >= 2:
         passed.append("Original statistics/data (citation magnet)")
     
@@ -203,7 +226,7 @@ def check_page(file_path: Path) -> dict:
         r'simply put,',
         r'<dfn'
     ]
-    has_direct = any(re.search(p, content, re.I) for p in direct_answer_patterns)
+    has_direct = any(ctx.search(p, re.I) for p in direct_answer_patterns)
     if has_direct:
         passed.append("Direct answer patterns (LLM-friendly)")
     
@@ -212,7 +235,7 @@ def check_page(file_path: Path) -> dict:
     score = (len(passed) / total * 100) if total > 0 else 0
     
     return {
-        'file': str(file_path.name),
+        'file': str(ctx.name),
         'passed': passed,
         'issues': issues,
         'score': round(score)
@@ -229,24 +252,21 @@ def main():
     print(f"Project: {target_path}")
     print("-" * 60)
     
-    # Find web pages only
-    pages = find_web_pages(target_path)
+    # Find and check web pages in a single pass
+    auditor = GEOAuditor(target_path)
+    ScanEngine(target_path, [auditor]).run()
     
-    if not pages:
+    if not auditor.results:
         print("\n[!] No public web pages found.")
         print("    Looking for: HTML, JSX, TSX files in pages/app directories")
         print("    Skipping: docs, tests, config files, node_modules")
-        output = {"script": "geo_checker", "pages_found": 0, "passed": True}
+        output = auditor.report()
         print("\n" + json.dumps(output, indent=2))
         sys.exit(0)
     
-    print(f"Found {len(pages)} public pages to analyze\n")
+    print(f"Found {len(auditor.results)} public pages to analyze\n")
     
-    # Check each page
-    results = []
-    for page in pages:
-        result = check_page(page)
-        results.append(result)
+    results = auditor.results
     
     # Print results
     for result in results:
@@ -257,7 +277,7 @@ def main():
                 print(f"    - {issue}")
     
     # Average score
-    avg_score = sum(r['score'] for r in results) / len(results) if results else 0
+    avg_score = auditor.average_score()
     
     print("\n" + "=" * 60)
     print(f"AVERAGE GEO SCORE: {avg_score:.0f}%")
@@ -273,13 +293,7 @@ def main():
         print("[X] Poor - Content needs GEO optimization")
     
     # JSON output
-    output = {
-        "script": "geo_checker",
-        "project": str(target_path),
-        "pages_checked": len(results),
-        "average_score": round(avg_score),
-        "passed": avg_score >= 60
-    }
+    output = auditor.report()
     print("\n" + json.dumps(output, indent=2))
     
     sys.exit(0 if avg_score >= 60 else 1)
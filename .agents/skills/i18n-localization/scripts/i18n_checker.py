@@ -4,10 +4,13 @@ i18n Checker - Detects hardcoded strings and missing translations.
 Scans for untranslated text in React, Vue, and Python files.
 """
 import sys
-import re
 import json
 from pathlib import Path
 
+# Shared single-pass scan engine lives in .agents/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from _scan_engine import ScanEngine, Auditor, FileContext
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -50,22 +53,127 @@ I18N_PATTERNS = [
     r'i18n\.',             # Generic i18n
 ]
 
-def find_locale_files(project_path: Path) -> list:
-    """Find translation/locale files."""
-    patterns = [
-        "**/locales/**/*.json",
-        "**/translations/**/*.json",
-        "**/lang/**/*.json",
-        "**/i18n/**/*.json",
-        "**/messages/*.json",
-        "**/*.po",  # gettext
-    ]
-    
-    files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
-    
-    return [f for f in files if 'node_modules' not in str(f)]
+# Directories holding translation/locale files (**/<dir>/**/*.json)
+LOCALE_DIRS = {'locales', 'translations', 'lang', 'i18n'}
+
+# Code file extensions and the pattern family used for each
+CODE_EXTENSIONS = {
+    '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
+    '.vue': 'vue',
+    '.py': 'python'
+}
+
+
+class LocaleFileAuditor(Auditor):
+    """Collects translation/locale files."""
+
+    name = "i18n_locales"
+    extensions = {'.json', '.po'}
+
+    def __init__(self, project_path: Path):
+        super().__init__()
+        self.project_path = project_path
+        self.locale_files = []
+
+    def accepts(self, path: Path) -> bool:
+        if 'node_modules' in str(path):
+            return False
+        if path.suffix == '.po':  # gettext
+            return True
+        dirs = path.relative_to(self.project_path).parts[:-1]
+        return bool(LOCALE_DIRS.intersection(dirs)) or (dirs[-1:] == ('messages',))
+
+    def visit(self, ctx: FileContext) -> None:
+        self.locale_files.append(ctx)
+
+    def report(self) -> dict:
+        return check_locale_completeness(self.locale_files)
+
+
+class HardcodedStringAuditor(Auditor):
+    """Looks for hardcoded strings in code files (first 50, by extension)."""
+
+    name = "i18n_checker"
+    extensions = set(CODE_EXTENSIONS)
+    sample_size = 50  # Limit
+
+    def __init__(self):
+        super().__init__()
+        # Queued files per extension, so the sample keeps the CODE_EXTENSIONS order
+        self.results = {ext: [] for ext in CODE_EXTENSIONS}
+        self.files_with_i18n = 0
+        self.files_with_hardcoded = 0
+        self.hardcoded_examples = []
+
+    def accepts(self, path: Path) -> bool:
+        return not any(x in str(path) for x in
+                       ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])
+
+    def _sample_full(self, suffix: str) -> bool:
+        """True once this extension and those before it fill the sample."""
+        taken = 0
+        for ext, files in self.results.items():
+            taken += len(files)
+            if ext == suffix:
+                break
+        return taken >= self.sample_size
+
+    def visit(self, ctx: FileContext) -> None:
+        # Files are only queued here; finish() reads the ones in the sample
+        if not self._sample_full(ctx.suffix):
+            self.results.setdefault(ctx.suffix, []).append(ctx)
+
+    def finish(self) -> None:
+        sample = [ctx for ext in self.results for ctx in self.results[ext]][:self.sample_size]
+        for ctx in sample:
+            has_i18n, examples = self._audit(ctx)
+            if has_i18n:
+                self.files_with_i18n += 1
+            if examples:
+                self.files_with_hardcoded += 1
+                room = 5 - len(self.hardcoded_examples)
+                self.hardcoded_examples.extend(examples[:max(room, 0)])
+
+    def _audit(self, ctx: FileContext) -> tuple:
+        """(uses i18n, hardcoded string examples) for one code file."""
+        file_type = CODE_EXTENSIONS.get(ctx.suffix, 'jsx')
+        has_i18n = False
+        examples = []
+        try:
+            # Check for i18n usage
+            has_i18n = any(ctx.search(p) for p in I18N_PATTERNS)
+            
+            # Check for hardcoded strings
+            if not has_i18n:
+                for pattern in HARDCODED_PATTERNS.get(file_type, []):
+                    matches = ctx.findall(pattern)
+                    if matches:
+                        examples.append(f"{ctx.name}: {str(matches[0])[:40]}...")
+        except Exception:
+            pass
+        return has_i18n, examples
+
+    def report(self) -> dict:
+        """Summarize hardcoded string findings."""
+        issues = []
+        passed = []
+        
+        if not self.files_seen:
+            return {'passed': ["[!] No code files found"], 'issues': []}
+        
+        passed.append(f"[OK] Analyzed {self.files_seen} code files")
+        
+        if self.files_with_i18n > 0:
+            passed.append(f"[OK] {self.files_with_i18n} files use i18n")
+        
+        if self.files_with_hardcoded > 0:
+            issues.append(f"[X] {self.files_with_hardcoded} files may have hardcoded strings")
+            for ex in self.hardcoded_examples:
+                issues.append(f"   → {ex}")
+        else:
+            passed.append("[OK] No obvious hardcoded strings detected")
+        
+        return {'passed': passed, 'issues': issues}
 
 def check_locale_completeness(locale_files: list) -> dict:
     """Check if all locales have the same keys."""
@@ -80,11 +188,11 @@ def check_locale_completeness(locale_files: list) -> dict:
     for f in locale_files:
         if f.suffix == '.json':
             try:
-                lang = f.parent.name
-                content = json.loads(f.read_text(encoding='utf-8'))
+                lang = f.path.parent.name
+                content = json.loads(f.text)
                 if lang not in locales:
                     locales[lang] = {}
-                locales[lang][f.stem] = set(flatten_keys(content))
+                locales[lang][f.path.stem] = set(flatten_keys(content))
             except:
                 continue
     
@@ -128,74 +236,6 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
-def check_hardcoded_strings(project_path: Path) -> dict:
-    """Check for hardcoded strings in code files."""
-    issues = []
-    passed = []
-    
-    # Find code files
-    extensions = {
-        '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
-        '.vue': 'vue',
-        '.py': 'python'
-    }
-    
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
-    
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
-    
-    if not code_files:
-        return {'passed': ["[!] No code files found"], 'issues': []}
-    
-    files_with_i18n = 0
-    files_with_hardcoded = 0
-    hardcoded_examples = []
-    
-    for file_path in code_files[:50]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
-            
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
-                files_with_i18n += 1
-            
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
-            
-            if hardcoded_found:
-                files_with_hardcoded += 1
-                
-        except:
-            continue
-    
-    passed.append(f"[OK] Analyzed {len(code_files)} code files")
-    
-    if files_with_i18n > 0:
-        passed.append(f"[OK] {files_with_i18n} files use i18n")
-    
-    if files_with_hardcoded > 0:
-        issues.append(f"[X] {files_with_hardcoded} files may have hardcoded strings")
-        for ex in hardcoded_examples:
-            issues.append(f"   → {ex}")
-    else:
-        passed.append("[OK] No obvious hardcoded strings detected")
-    
-    return {'passed': passed, 'issues': issues}
-
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     project_path = Path(target)
@@ -204,12 +244,13 @@ def main():
     print("  i18n CHECKER - Internationalization Audit")
     print("=" * 60 + "\n")
     
-    # Check locale files
-    locale_files = find_locale_files(project_path)
-    locale_result = check_locale_completeness(locale_files)
+    # Check locale files and hardcoded strings in a single pass
+    locale_auditor = LocaleFileAuditor(project_path)
+    code_auditor = HardcodedStringAuditor()
+    ScanEngine(project_path, [locale_auditor, code_auditor]).run()
     
-    # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
+    locale_result = locale_auditor.report()
+    code_result = code_auditor.report()
     
     # Print results
     print("[LOCALE FILES]")
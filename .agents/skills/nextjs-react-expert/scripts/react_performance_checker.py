@@ -7,174 +7,157 @@ Based on Vercel Engineering best practices
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
 from typing import List, Dict, Tuple
 
-class PerformanceChecker:
-    SOURCE_EXTENSIONS = ('*.ts', '*.tsx', '*.js', '*.jsx')
-    TSX_EXTENSIONS = ('*.ts', '*.tsx')
+# Shared single-pass scan engine lives in .agents/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from _scan_engine import ScanEngine, Auditor, FileContext
 
-    def __init__(self, project_path: str):
-        self.project_path = Path(project_path)
-        self.issues = []
-        self.warnings = []
-        self.passed = []
 
-    def _find_files(self, extensions=None):
-        """Find source files matching extensions, skipping node_modules."""
-        exts = extensions or self.SOURCE_EXTENSIONS
-        for ext in exts:
-            for filepath in self.project_path.rglob(ext):
-                if 'node_modules' not in str(filepath):
-                    yield filepath
+class PerformanceChecker(Auditor):
+    SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+    TSX_EXTENSIONS = ('.ts', '.tsx')
 
-    def check_waterfalls(self):
-        """Check for sequential await patterns (Section 1)"""
-        print("\n[*] Checking for waterfalls (sequential awaits)...")
+    name = "react_performance_checker"
+    extensions = set(SOURCE_EXTENSIONS)
 
-        for filepath in self._find_files():
-            if 'node_modules' in str(filepath):
-                continue
+    # Checks run per file in a single pass; labels kept for progress output
+    CHECKS = [
+        "Checking for waterfalls (sequential awaits)",
+        "Checking for barrel imports",
+        "Checking for missing dynamic imports",
+        "Checking for useEffect data fetching",
+        "Checking for missing memoization",
+        "Checking for image optimization",
+    ]
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
+    # Characters kept after each "import " for the dynamic import check
+    IMPORT_TAIL = 120
 
-                # Pattern: multiple awaits in sequence without Promise.all
-                sequential_awaits = re.findall(r'await\s+\w+.*?\n\s*await\s+\w+', content)
-
-                if sequential_awaits:
-                    self.issues.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'CRITICAL',
-                        'issue': 'Sequential awaits detected (waterfall)',
-                        'fix': 'Use Promise.all() for parallel fetching',
-                        'section': '1-async-eliminating-waterfalls.md'
+    def __init__(self, project_path: str):
+        super().__init__()
+        self.project_path = Path(project_path)
+        self.issues = []
+        self.warnings = []
+        self.passed = []
+        # Findings per check, merged in check order by finish()
+        self._found = {key: [] for key in ('waterfalls', 'barrel', 'dynamic', 'useEffect', 'memo', 'image')}
+        self._large_files = []     # (rank, rel, stem) of .ts/.tsx files > 10KB
+        self._import_tails = []    # (rank, rel, tails) of .ts/.tsx files without dynamic()
+
+    def accepts(self, path: Path) -> bool:
+        return 'node_modules' not in str(path)
+
+    def _add(self, check: str, ctx: FileContext, finding: dict):
+        """Record a finding; ordered by extension first, as the per-extension globs did."""
+        finding['file'] = str(ctx.path.relative_to(self.project_path))
+        rank = self.SOURCE_EXTENSIONS.index(ctx.suffix) if ctx.suffix in self.SOURCE_EXTENSIONS else 0
+        self._found[check].append((rank, finding))
+
+    def visit(self, ctx: FileContext) -> None:
+        content = ctx.text
+        is_tsx = ctx.suffix in self.TSX_EXTENSIONS
+
+        # Section 1: multiple awaits in sequence without Promise.all
+        if ctx.findall(r'await\s+\w+.*?\n\s*await\s+\w+'):
+            self._add('waterfalls', ctx, {
+                'type': 'CRITICAL',
+                'issue': 'Sequential awaits detected (waterfall)',
+                'fix': 'Use Promise.all() for parallel fetching',
+                'section': '1-async-eliminating-waterfalls.md'
+            })
+
+        # Section 2: import from index files or barrel exports
+        if ctx.findall(r"import.*from\s+['\"](@/.*?)/index['\"]") or \
+                ctx.findall(r"import.*from\s+['\"]\.\.?/.*?['\"](?!.*?\.tsx?)"):
+            self._add('barrel', ctx, {
+                'type': 'CRITICAL',
+                'issue': 'Potential barrel imports detected',
+                'fix': 'Import directly from specific files',
+                'section': '2-bundle-bundle-size-optimization.md'
+            })
+
+        if is_tsx:
+            # Section 2: large components are matched against static imports in finish()
+            rank = self.TSX_EXTENSIONS.index(ctx.suffix)
+            rel = str(ctx.path.relative_to(self.project_path))
+            if len(content) > 10000:
+                self._large_files.append((rank, rel, ctx.path.stem))
+            if 'dynamic(' not in content:
+                tails = [content[m.end():m.end() + self.IMPORT_TAIL]
+                         for m in re.finditer(r'import ', content)]
+                if tails:
+                    self._import_tails.append((rank, rel, tails))
+
+            # Section 4: fetch in useEffect
+            if 'useEffect' in content and ctx.search(r'useEffect.*?fetch\(', re.DOTALL):
+                self._add('useEffect', ctx, {
+                    'type': 'MEDIUM-HIGH',
+                    'issue': 'Data fetching in useEffect',
+                    'fix': 'Consider using SWR or React Query for deduplication',
+                    'section': '4-client-client-side-data-fetching.md'
+                })
+
+        # Section 5: component definitions with props but without memo
+        if ctx.suffix == '.tsx':
+            components = ctx.findall(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)')
+            if components and 'React.memo' not in content and 'memo(' not in content:
+                if 'props:' in content or 'Props>' in content:
+                    self._add('memo', ctx, {
+                        'type': 'MEDIUM',
+                        'issue': 'Component with props not memoized',
+                        'fix': 'Consider using React.memo if props are stable',
+                        'section': '5-rerender-re-render-optimization.md'
                     })
-            except Exception as e:
-                continue
-
-    def check_barrel_imports(self):
-        """Check for barrel imports (Section 2)"""
-        print("[*] Checking for barrel imports...")
-
-        for filepath in self._find_files():
-            try:
-                content = filepath.read_text(encoding='utf-8')
 
-                # Pattern: import from index files or barrel exports
-                barrel_imports = re.findall(r"import.*from\s+['\"](@/.*?)/index['\"]", content)
-                barrel_imports += re.findall(r"import.*from\s+['\"]\.\.?/.*?['\"](?!.*?\.tsx?)", content)
-
-                if barrel_imports:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
+        # Section 6: <img> tags instead of next/image
+        if '<img' in content and 'next/image' not in content:
+            self._add('image', ctx, {
+                'type': 'MEDIUM',
+                'issue': 'Using <img> instead of next/image',
+                'fix': 'Use next/image for automatic optimization',
+                'section': '6-rendering-rendering-performance.md'
+            })
+
+    def finish(self) -> None:
+        self._check_dynamic_imports()
+
+        def ordered(check):
+            return [f for _, f in sorted(self._found[check], key=lambda item: item[0])]
+
+        self.issues.extend(ordered('waterfalls'))
+        for check in ('barrel', 'dynamic', 'useEffect', 'memo', 'image'):
+            self.warnings.extend(ordered(check))
+
+    def _check_dynamic_imports(self):
+        """Large components imported statically by a file without dynamic() (Section 2)"""
+        importers = sorted(self._import_tails, key=lambda item: item[0])
+        for rank, rel, filename in sorted(self._large_files, key=lambda item: item[0]):
+            for _, check_rel, tails in importers:
+                if check_rel == rel:
+                    continue
+                if any(t.startswith(filename) or t.startswith(f"{{ {filename}") for t in tails):
+                    self._found['dynamic'].append((rank, {
+                        'file': check_rel,
                         'type': 'CRITICAL',
-                        'issue': 'Potential barrel imports detected',
-                        'fix': 'Import directly from specific files',
+                        'issue': f'Large component {filename} imported statically',
+                        'fix': 'Use dynamic() for code splitting',
                         'section': '2-bundle-bundle-size-optimization.md'
-                    })
-            except Exception as e:
-                continue
-
-    def check_dynamic_imports(self):
-        """Check if large components use dynamic imports (Section 2)"""
-        print("[*] Checking for missing dynamic imports...")
-
-        for filepath in self._find_files(self.TSX_EXTENSIONS):
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check file size - if > 10KB, should probably use dynamic import
-                if len(content) > 10000:
-                    # Check if it's imported statically somewhere
-                    filename = filepath.stem
-
-                    # Search for static imports of this component
-                    for check_file in self._find_files(self.TSX_EXTENSIONS):
-                        if check_file == filepath or 'node_modules' in str(check_file):
-                            continue
-
-                        check_content = check_file.read_text(encoding='utf-8')
-                        if f"import {filename}" in check_content or f"import {{ {filename}" in check_content:
-                            if 'dynamic(' not in check_content:
-                                self.warnings.append({
-                                    'file': str(check_file.relative_to(self.project_path)),
-                                    'type': 'CRITICAL',
-                                    'issue': f'Large component {filename} imported statically',
-                                    'fix': 'Use dynamic() for code splitting',
-                                    'section': '2-bundle-bundle-size-optimization.md'
-                                })
-                                break
-            except Exception as e:
-                continue
-
-    def check_useEffect_fetching(self):
-        """Check for data fetching in useEffect (Section 4)"""
-        print("[*] Checking for useEffect data fetching...")
-
-        for filepath in self._find_files(self.TSX_EXTENSIONS):
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: fetch or axios in useEffect
-                if 'useEffect' in content:
-                    if re.search(r'useEffect.*?fetch\(', content, re.DOTALL):
-                        self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
-                            'type': 'MEDIUM-HIGH',
-                            'issue': 'Data fetching in useEffect',
-                            'fix': 'Consider using SWR or React Query for deduplication',
-                            'section': '4-client-client-side-data-fetching.md'
-                        })
-            except Exception as e:
-                continue
-
-    def check_missing_memoization(self):
-        """Check for missing React.memo, useMemo, useCallback (Section 5)"""
-        print("[*] Checking for missing memoization...")
-
-        for filepath in self._find_files(('*.tsx',)):
-
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check for component definitions without memo
-                components = re.findall(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)', content)
-
-                if components and 'React.memo' not in content and 'memo(' not in content:
-                    # Check if component receives props
-                    if 'props:' in content or 'Props>' in content:
-                        self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
-                            'type': 'MEDIUM',
-                            'issue': 'Component with props not memoized',
-                            'fix': 'Consider using React.memo if props are stable',
-                            'section': '5-rerender-re-render-optimization.md'
-                        })
-            except Exception as e:
-                continue
-
-    def check_image_optimization(self):
-        """Check for unoptimized images (Section 6)"""
-        print("[*] Checking for image optimization...")
-
-        for filepath in self._find_files():
-
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check for <img> tags instead of next/image
-                if '<img' in content and 'next/image' not in content:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'MEDIUM',
-                        'issue': 'Using <img> instead of next/image',
-                        'fix': 'Use next/image for automatic optimization',
-                        'section': '6-rendering-rendering-performance.md'
-                    })
-            except Exception as e:
-                continue
+                    }))
+                    break
+
+    def report(self) -> dict:
+        """Summary for audit_suite.py"""
+        critical = [i for i in self.issues if i['type'] == 'CRITICAL']
+        return {
+            "files_checked": self.files_visited,
+            "critical_issues": critical,
+            "warnings": self.warnings,
+            "passed": len(self.issues) == 0 and len(self.warnings) == 0
+        }
 
     def generate_report(self):
         """Generate final report"""
@@ -219,19 +202,15 @@ class PerformanceChecker:
         print("="*60)
         print(f"Scanning: {self.project_path}")
 
-        self.check_waterfalls()
-        self.check_barrel_imports()
-        self.check_dynamic_imports()
-        self.check_useEffect_fetching()
-        self.check_missing_memoization()
-        self.check_image_optimization()
+        print()
+        for label in self.CHECKS:
+            print(f"[*] {label}...")
+        ScanEngine(self.project_path, [self]).run()
 
         self.generate_report()
 
 
 def main():
-    import sys
-
     if len(sys.argv) < 2:
         print("Usage: python react_performance_checker.py <project_path>")
         sys.exit(1)
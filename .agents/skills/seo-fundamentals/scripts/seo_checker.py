@@ -23,6 +23,10 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared single-pass scan engine lives in .agents/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from _scan_engine import ScanEngine, Auditor, FileContext
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -75,59 +79,78 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
-def find_pages(project_path: Path) -> list:
-    """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
-    
-    return files[:50]  # Limit to 50 files
+class SEOAuditor(Auditor):
+    """Checks likely page files (first 50) for SEO issues."""
+
+    name = "seo_checker"
+    extensions = {'.html', '.htm', '.jsx', '.tsx'}
+    skip_dirs = SKIP_DIRS
+    max_files = 50  # Limit to 50 files
+
+    def __init__(self, project_path: Path):
+        super().__init__()
+        self.project_path = project_path
+        self.all_issues = []
 
+    def accepts(self, path: Path) -> bool:
+        # Check if it's likely a page
+        return is_page_file(path)
 
-def check_page(file_path: Path) -> dict:
+    def visit(self, ctx: FileContext) -> None:
+        result = check_page(ctx)
+        if result["issues"]:
+            self.all_issues.append(result)
+
+    def report(self) -> dict:
+        if not self.files_visited:
+            return {"script": "seo_checker", "files_checked": 0, "passed": True}
+        total_issues = sum(len(item["issues"]) for item in self.all_issues)
+        return {
+            "script": "seo_checker",
+            "project": str(self.project_path),
+            "files_checked": self.files_visited,
+            "files_with_issues": len(self.all_issues),
+            "issues_found": total_issues,
+            "passed": total_issues == 0
+        }
+
+
+def check_page(ctx: FileContext) -> dict:
     """Check a single page for SEO issues."""
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = ctx.text
+        lower = ctx.lower
     except Exception as e:
-        return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
+        return {"file": str(ctx.name), "issues": [f"Error: {e}"]}
     
     # Detect if this is a layout/template file (has Head component)
-    is_layout = 'Head>' in content or '<head' in content.lower()
+    is_layout = 'Head>' in content or '<head' in lower
     
     # 1. Title tag
-    has_title = '<title' in content.lower() or 'title=' in content or 'Head>' in content
+    has_title = '<title' in lower or 'title=' in content or 'Head>' in content
     if not has_title and is_layout:
         issues.append("Missing <title> tag")
     
     # 2. Meta description
-    has_description = 'name="description"' in content.lower() or 'name=\'description\'' in content.lower()
+    has_description = 'name="description"' in lower or 'name=\'description\'' in lower
     if not has_description and is_layout:
         issues.append("Missing meta description")
     
     # 3. Open Graph tags
-    has_og = 'og:' in content or 'property="og:' in content.lower()
+    has_og = 'og:' in content or 'property="og:' in lower
     if not has_og and is_layout:
         issues.append("Missing Open Graph tags")
     
     # 4. Heading hierarchy - multiple H1s
-    h1_matches = re.findall(r'<h1[^>]*>', content, re.I)
+    h1_matches = ctx.findall(r'<h1[^>]*>', re.I)
     if len(h1_matches) > 1:
         issues.append(f"Multiple H1 tags ({len(h1_matches)})")
     
     # 5. Images without alt
     img_pattern = r'<img[^>]+>'
-    imgs = re.findall(img_pattern, content, re.I)
+    imgs = ctx.findall(img_pattern, re.I)
     for img in imgs:
         if 'alt=' not in img.lower():
             issues.append("Image missing alt attribute")
@@ -137,10 +160,10 @@ def check_page(file_path: Path) -> dict:
             break
     
     # 6. Check for canonical link (nice to have)
-    # has_canonical = 'rel="canonical"' in content.lower()
+    # has_canonical = 'rel="canonical"' in lower
     
     return {
-        "file": str(file_path.name),
+        "file": str(ctx.name),
         "issues": issues
     }
 
@@ -155,24 +178,20 @@ def main():
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-"*60)
     
-    # Find pages
-    pages = find_pages(project_path)
+    # Find and check pages in a single pass
+    auditor = SEOAuditor(project_path)
+    ScanEngine(project_path, [auditor]).run()
     
-    if not pages:
+    if not auditor.files_visited:
         print("\n[!] No page files found.")
         print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
-        output = {"script": "seo_checker", "files_checked": 0, "passed": True}
+        output = auditor.report()
         print("\n" + json.dumps(output, indent=2))
         sys.exit(0)
     
-    print(f"Found {len(pages)} page files to analyze\n")
+    print(f"Found {auditor.files_visited} page files to analyze\n")
     
-    # Check each page
-    all_issues = []
-    for f in pages:
-        result = check_page(f)
-        if result["issues"]:
-            all_issues.append(result)
+    all_issues = auditor.all_issues
     
     # Summary
     print("=" * 60)
@@ -198,17 +217,8 @@ def main():
     else:
         print("\n[OK] No SEO issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    passed = total_issues == 0
-    
-    output = {
-        "script": "seo_checker",
-        "project": str(project_path),
-        "files_checked": len(pages),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
+    output = auditor.report()
+    passed = output["passed"]
     
     print("\n" + json.dumps(output, indent=2))
     
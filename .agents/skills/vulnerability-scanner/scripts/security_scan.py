@@ -4,8 +4,13 @@ Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
 Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
+       [--incremental] [--since REF] [--jobs N] [--max-file-bytes N]
 Output: JSON with validation findings
 
+Large files are streamed as overlapping mmap windows and read only up to a
+per-file byte budget; binary files are skipped and minified bundles are
+sampled. Files cut short are listed under "truncated_files".
+
 This script verifies:
 1. Dependencies - Supply chain security (OWASP A03)
 2. Secrets - No hardcoded credentials (OWASP A04)
@@ -18,10 +23,17 @@ import os
 import sys
 import re
 import argparse
+import bisect
+import functools
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
 
+# Shared single-pass scan engine lives in .agents/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from _scan_engine import (ScanEngine, Auditor, FileContext, AuditIndex, compile_rule,
+                          DEFAULT_BYTE_BUDGET, MINIFIED_SAMPLE_BYTES, WINDOW_BYTES, WINDOW_OVERLAP)
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -178,204 +190,339 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+class SecretScanner(Auditor):
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
     """
-    results = {
-        "tool": "secret_scanner",
-        "findings": [],
-        "status": "[OK] No secrets detected",
-        "scanned_files": 0,
-        "by_severity": {"critical": 0, "high": 0, "medium": 0}
-    }
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+
+    name = "secrets"
+    extensions = CODE_EXTENSIONS | CONFIG_EXTENSIONS
+    skip_dirs = SKIP_DIRS
+    state_fields = ("results.findings", "results.scanned_files", "results.by_severity",
+                    "results.skipped_binary", "results.truncated_files")
+
+    def __init__(self):
+        super().__init__()
+        self.results = {
+            "tool": "secret_scanner",
+            "findings": [],
+            "status": "[OK] No secrets detected",
+            "scanned_files": 0,
+            "skipped_binary": 0,
+            "truncated_files": [],
+            "by_severity": {"critical": 0, "high": 0, "medium": 0}
+        }
+
+    def visit(self, ctx: FileContext) -> None:
+        results = self.results
+        results["scanned_files"] += 1
+        if not admit_file(ctx, results):
+            return
         
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
-                pass
-    
-    if results["by_severity"]["critical"] > 0:
-        results["status"] = "[!!] CRITICAL: Secrets exposed!"
-    elif results["by_severity"]["high"] > 0:
-        results["status"] = "[!] HIGH: Secrets found"
-    elif sum(results["by_severity"].values()) > 0:
-        results["status"] = "[?] Potential secrets detected"
-    
-    # Limit findings for output
-    results["findings"] = results["findings"][:15]
-    
-    return results
+        counts = [0] * len(SECRET_PATTERNS)
+        for window in ctx.windows():
+            for i, (pattern, _, _) in enumerate(SECRET_PATTERNS):
+                counts[i] += window.count_owned(pattern, re.IGNORECASE)
+        
+        for count, (_, secret_type, severity) in zip(counts, SECRET_PATTERNS):
+            if count:
+                results["findings"].append({
+                    "file": str(ctx.rel),
+                    "type": secret_type,
+                    "severity": severity,
+                    "count": count
+                })
+                results["by_severity"][severity] += count
 
+    def report(self) -> Dict[str, Any]:
+        results = self.results
+        if results["by_severity"]["critical"] > 0:
+            results["status"] = "[!!] CRITICAL: Secrets exposed!"
+        elif results["by_severity"]["high"] > 0:
+            results["status"] = "[!] HIGH: Secrets found"
+        elif sum(results["by_severity"].values()) > 0:
+            results["status"] = "[?] Potential secrets detected"
+        
+        # Limit findings for output
+        return dict(results, findings=results["findings"][:15],
+                    truncated_files=results["truncated_files"][:15])
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+
+class PatternScanner(Auditor):
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
     """
-    results = {
-        "tool": "pattern_scanner",
-        "findings": [],
-        "status": "[OK] No dangerous patterns",
-        "scanned_files": 0,
-        "by_category": {}
-    }
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+
+    name = "code_patterns"
+    extensions = CODE_EXTENSIONS
+    skip_dirs = SKIP_DIRS
+    state_fields = ("results.findings", "results.scanned_files", "results.by_category",
+                    "results.skipped_binary", "results.truncated_files")
+
+    def __init__(self):
+        super().__init__()
+        self.rules = [(compile_rule(pattern, re.IGNORECASE), name, severity, category)
+                      for pattern, name, severity, category in DANGEROUS_PATTERNS]
+        self.results = {
+            "tool": "pattern_scanner",
+            "findings": [],
+            "status": "[OK] No dangerous patterns",
+            "scanned_files": 0,
+            "skipped_binary": 0,
+            "truncated_files": [],
+            "by_category": {}
+        }
+
+    def visit(self, ctx: FileContext) -> None:
+        results = self.results
+        results["scanned_files"] += 1
+        if not admit_file(ctx, results):
+            return
+        for window in ctx.windows():
+            self._scan_window(ctx, window)
+
+    def _scan_window(self, ctx: FileContext, window: FileContext) -> None:
+        results = self.results
         
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
-    
-    critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
-    high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
-    
-    if critical_count > 0:
-        results["status"] = f"[!!] CRITICAL: {critical_count} dangerous patterns"
-    elif high_count > 0:
-        results["status"] = f"[!] HIGH: {high_count} risky patterns"
-    elif results["findings"]:
-        results["status"] = "[?] Some patterns need review"
-    
-    # Limit findings
-    results["findings"] = results["findings"][:20]
-    
-    return results
+        # Only patterns whose leading literal occurs in the window can match a line
+        candidates = [(order, rule) for order, rule in enumerate(self.rules)
+                      if rule[0].first_position(window) is not None]
+        if not candidates:
+            return
+        
+        text = window.text
+        lines = text.split('\n')
+        starts = [0]  # Offset where each line begins
+        newline = text.find('\n')
+        while newline != -1:
+            starts.append(newline + 1)
+            newline = text.find('\n', newline + 1)
+        
+        # Lines starting in the overlap (or before the window) belong to a neighbour
+        first = 0 if window.at_line_start else 1
+        last = len(lines) if window.final else bisect.bisect_left(starts, window.owned)
+        
+        hits = []
+        for order, (rule, name, severity, category) in candidates:
+            for line_num in matching_lines(rule, text, lines, starts):
+                if first < line_num <= last:
+                    hits.append((line_num, order))
+        
+        # Same order as a line-by-line scan: by line, then by pattern
+        for line_num, order in sorted(hits):
+            _, name, severity, category = self.rules[order]
+            results["findings"].append({
+                "file": str(ctx.rel),
+                "line": window.first_line + line_num - 1,
+                "pattern": name,
+                "severity": severity,
+                "category": category,
+                "snippet": lines[line_num - 1].strip()[:80]
+            })
+            results["by_category"][category] = results["by_category"].get(category, 0) + 1
 
+    def report(self) -> Dict[str, Any]:
+        results = self.results
+        critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
+        high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
+        
+        if critical_count > 0:
+            results["status"] = f"[!!] CRITICAL: {critical_count} dangerous patterns"
+        elif high_count > 0:
+            results["status"] = f"[!] HIGH: {high_count} risky patterns"
+        elif results["findings"]:
+            results["status"] = "[?] Some patterns need review"
+        
+        # Limit findings
+        return dict(results, findings=results["findings"][:20],
+                    truncated_files=results["truncated_files"][:15])
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+
+def admit_file(ctx: FileContext, results: Dict[str, Any]) -> bool:
+    """Skip binary files and record files read only up to the byte budget."""
+    if ctx.is_binary:
+        results["skipped_binary"] += 1
+        return False
+    if ctx.truncated:
+        results["truncated_files"].append(ctx.read_summary())
+    return True
+
+
+def matching_lines(rule, text: str, lines: List[str], starts: List[int]):
+    """
+    Line numbers (1-based) where a pattern matches, as a line-by-line
+    search would report them, found with whole-file searches instead of one
+    regex call per line.
+
+    Each search resumes at the start of the line after the previous hit.
+    A match that spills over a line break is re-checked on its own line.
+    Patterns with lookarounds or anchors see past line ends in a whole-file
+    search, so they are still matched line by line.
+    """
+    regex = rule.regex
+    if not rule.context_free:
+        for line_num, line in enumerate(lines, 1):
+            if regex.search(line):
+                yield line_num
+        return
+    
+    pos = 0
+    end = len(text)
+    while pos <= end:
+        m = regex.search(text, pos)
+        if m is None:
+            return
+        index = bisect.bisect_right(starts, m.start()) - 1
+        line_end = starts[index + 1] - 1 if index + 1 < len(starts) else end
+        if m.end() <= line_end or regex.search(lines[index]):
+            yield index + 1
+        if index + 1 >= len(starts):
+            return
+        pos = starts[index + 1]
+
+
+# Common config files checked for issues
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+CONFIG_FILES = ['next.config.js', 'webpack.config.js', '.eslintrc.js']
+
+
+class ConfigScanner(Auditor):
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
     """
-    results = {
-        "tool": "config_scanner",
-        "findings": [],
-        "status": "[OK] Configuration secure",
-        "checks": {}
-    }
-    
-    # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+
+    name = "configuration"
+    extensions = CONFIG_EXTENSIONS | {'.js'}
+    skip_dirs = SKIP_DIRS
+    state_fields = ("results.findings",)
+
+    def __init__(self, project_path: str):
+        super().__init__()
+        self.project_path = project_path
+        self.results = {
+            "tool": "config_scanner",
+            "findings": [],
+            "status": "[OK] Configuration secure",
+            "checks": {}
+        }
+
+    def accepts(self, path: Path) -> bool:
+        return path.suffix.lower() in CONFIG_EXTENSIONS or path.name in CONFIG_FILES
+
+    def visit(self, ctx: FileContext) -> None:
+        if ctx.is_binary:
+            return
+        found = set()
+        for window in ctx.windows():
+            found.update(i for i, (pattern, _, _) in enumerate(CONFIG_ISSUES)
+                         if i not in found and window.search(pattern, re.IGNORECASE))
+        for i, (pattern, issue, severity) in enumerate(CONFIG_ISSUES):
+            if i in found:
+                self.results["findings"].append({
+                    "file": str(ctx.rel),
+                    "issue": issue,
+                    "severity": severity
+                })
+
+    def finish(self) -> None:
+        results = self.results
         
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
-    
-    # Check for security header configurations
-    header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
-    for hf in header_files:
-        hf_path = Path(project_path) / hf
-        if hf_path.exists():
-            results["checks"]["security_headers_config"] = True
-            break
-    else:
-        results["checks"]["security_headers_config"] = False
-        results["findings"].append({
-            "issue": "No security headers configuration found",
-            "severity": "medium",
-            "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
-        })
-    
-    if any(f["severity"] == "critical" for f in results["findings"]):
-        results["status"] = "[!!] CRITICAL: Configuration issues"
-    elif any(f["severity"] == "high" for f in results["findings"]):
-        results["status"] = "[!] HIGH: Configuration review needed"
-    elif results["findings"]:
-        results["status"] = "[?] Minor configuration issues"
-    
-    return results
+        # Check for security header configurations
+        header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
+        for hf in header_files:
+            hf_path = Path(self.project_path) / hf
+            if hf_path.exists():
+                results["checks"]["security_headers_config"] = True
+                break
+        else:
+            results["checks"]["security_headers_config"] = False
+            results["findings"].append({
+                "issue": "No security headers configuration found",
+                "severity": "medium",
+                "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
+            })
+        
+        if any(f["severity"] == "critical" for f in results["findings"]):
+            results["status"] = "[!!] CRITICAL: Configuration issues"
+        elif any(f["severity"] == "high" for f in results["findings"]):
+            results["status"] = "[!] HIGH: Configuration review needed"
+        elif results["findings"]:
+            results["status"] = "[?] Minor configuration issues"
+
+    def report(self) -> Dict[str, Any]:
+        return self.results
+
+
+def file_scanners(project_path: str) -> Dict[str, Auditor]:
+    """File-based scanners keyed by --scan-type, sharing one directory walk."""
+    return {
+        "secrets": SecretScanner(),
+        "patterns": PatternScanner(),
+        "config": ConfigScanner(project_path),
+    }
+
+
+def selected_scanners(project_path: str, scan_type: str) -> List[Auditor]:
+    """Scanners for a --scan-type, in a stable order (also used to rebuild them in workers)."""
+    return [scanner for key, scanner in file_scanners(project_path).items()
+            if scan_type == "all" or scan_type == key]
+
+
+def _run_scanner(project_path: str, key: str) -> Dict[str, Any]:
+    scanner = file_scanners(project_path)[key]
+    ScanEngine(project_path, [scanner]).run()
+    return scanner.report()
+
+
+def scan_secrets(project_path: str) -> Dict[str, Any]:
+    """Validate no hardcoded secrets (OWASP A04)."""
+    return _run_scanner(project_path, "secrets")
+
+
+def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+    """Validate dangerous code patterns (OWASP A05)."""
+    return _run_scanner(project_path, "patterns")
+
+
+def scan_configuration(project_path: str) -> Dict[str, Any]:
+    """Validate security configuration (OWASP A02)."""
+    return _run_scanner(project_path, "config")
 
 
 # ============================================================================
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+def run_full_scan(project_path: str, scan_type: str = "all",
+                  index: AuditIndex = None, jobs: int = 1,
+                  max_file_bytes: int = DEFAULT_BYTE_BUDGET) -> Dict[str, Any]:
+    """
+    Execute security validation scans (incrementally when an index is given,
+    across `jobs` worker processes when jobs > 1, reading at most
+    `max_file_bytes` of each file; 0 or None reads files whole).
+    """
+    budget = max_file_bytes or None
     
     report = {
         "project": project_path,
         "timestamp": datetime.now().isoformat(),
         "scan_type": scan_type,
+        "read_limits": {
+            "byte_budget": budget,
+            "minified_sample": MINIFIED_SAMPLE_BYTES,
+            "window": WINDOW_BYTES,
+            "overlap": WINDOW_OVERLAP
+        },
         "scans": {},
         "summary": {
             "total_findings": 0,
@@ -385,16 +532,24 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
         }
     }
     
-    scanners = {
-        "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
+    names = {
+        "deps": "dependencies",
+        "secrets": "secrets",
+        "patterns": "code_patterns",
+        "config": "configuration",
     }
     
-    for key, (name, scanner) in scanners.items():
+    # Secrets, patterns and config share a single walk/read of the project
+    selected = {key: scanner for key, scanner in file_scanners(project_path).items()
+                if scan_type == "all" or scan_type == key}
+    if selected:
+        # Workers rebuild the same scanners, in the same order, from the factory
+        ScanEngine(project_path, selected.values(), index=index, jobs=jobs, budget=budget,
+                   factory=functools.partial(selected_scanners, project_path, scan_type)).run()
+    
+    for key, name in names.items():
         if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
+            result = scan_dependencies(project_path) if key == "deps" else selected[key].report()
             report["scans"][name] = result
             
             findings_count = len(result.get("findings", []))
@@ -407,6 +562,9 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
                 elif sev == "high":
                     report["summary"]["high"] += 1
     
+    if index is not None:
+        report["incremental"] = index.summary()
+    
     # Determine overall status
     if report["summary"]["critical"] > 0:
         report["summary"]["overall_status"] = "[!!] CRITICAL ISSUES FOUND"
@@ -427,6 +585,14 @@ def main():
                         default="all", help="Type of scan to run")
     parser.add_argument("--output", choices=["json", "summary"], default="json",
                         help="Output format")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only re-scan files changed since the last run")
+    parser.add_argument("--since", metavar="REF",
+                        help="Always re-scan files changed since a git ref (implies --incremental)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for file scanning (default: 1)")
+    parser.add_argument("--max-file-bytes", type=int, default=DEFAULT_BYTE_BUDGET,
+                        help=f"Bytes read per file, 0 for no limit (default: {DEFAULT_BYTE_BUDGET})")
     
     args = parser.parse_args()
     
@@ -434,7 +600,9 @@ def main():
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    index = AuditIndex(args.project_path, since=args.since) if args.incremental or args.since else None
+    result = run_full_scan(args.project_path, args.scan_type, index=index, jobs=args.jobs,
+                           max_file_bytes=args.max_file_bytes)
     
     if args.output == "summary":
         print(f"\n{'='*60}")